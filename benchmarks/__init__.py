@@ -0,0 +1 @@
+"""Micro-benchmarks for timing-critical paths."""
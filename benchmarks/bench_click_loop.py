@@ -0,0 +1,133 @@
+"""Per-click overhead of the click loop, fixed versus jittered intervals.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_click_loop
+
+``ns/click`` is the median (and ``min`` the best) cost over ``--repeats`` runs,
+including factor generation. ``refill`` is the generation cost per click as
+timed inside the loop, where :meth:`IntervalSampler.refill` fills the spare
+block :data:`REFILL_CHUNK` factors at a time; ``no refill`` subtracts it, so
+``vs fixed`` is the cost of drawing a factor on the hot path. ``chunk`` is the
+median time of one chunk. Generation still runs on the click thread, between a
+click and the following wait: the loop re-reads its clock after it, so it
+shortens the wait, but intervals shorter than ``max refill`` (the longest
+single chunk seen in the loop, including any preemption) are delayed by up to
+that much.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+
+import src.domain.clicker_loop as loop_module
+import src.domain.jitter as jitter_module
+from src.domain.clicker_loop import ClickBackend, ClickLoop
+from src.domain.jitter import JITTER_DISTRIBUTIONS, REFILL_CHUNK, IntervalSampler, JitterConfig
+
+
+@dataclass
+class FillStats:
+    """Generation time spent inside the loop (block generation at construction is excluded)."""
+
+    chunks_ns: list[int] = field(default_factory=list)
+
+
+def run_once(clicks: int, jitter: JitterConfig | None) -> float:
+    """Return the per-click loop cost of one run in nanoseconds."""
+    remaining = clicks
+
+    def wait(_: float) -> bool:
+        nonlocal remaining
+        remaining -= 1
+        return remaining == 0
+
+    loop = ClickLoop(ClickBackend(click=lambda: None, name="bench"), wait=wait)
+    started = time.perf_counter_ns()
+    loop.run(1, jitter)
+    return (time.perf_counter_ns() - started) / clicks
+
+
+def measure(clicks: int, jitter: JitterConfig | None = None, repeats: int = 7) -> tuple[float, float]:
+    """Return the median and minimum per-click loop cost in nanoseconds."""
+    samples = [run_once(clicks, jitter) for _ in range(repeats)]
+    return statistics.median(samples), min(samples)
+
+
+@contextmanager
+def timed_fills() -> Iterator[FillStats]:
+    """Make the click loop time every chunk its sampler generates after construction."""
+    stats = FillStats()
+
+    class TimedSampler(IntervalSampler):
+        def __init__(self, config: JitterConfig) -> None:
+            self._timing = False
+            super().__init__(config)
+            self._timing = True
+
+        def _fill(self, block: array[float], start: int, end: int) -> None:
+            if not self._timing:
+                super()._fill(block, start, end)
+                return
+            started = time.perf_counter_ns()
+            super()._fill(block, start, end)
+            stats.chunks_ns.append(time.perf_counter_ns() - started)
+
+    saved, loop_module.IntervalSampler = loop_module.IntervalSampler, TimedSampler  # type: ignore[assignment, misc]
+    try:
+        yield stats
+    finally:
+        loop_module.IntervalSampler = saved  # type: ignore[misc]
+
+
+@contextmanager
+def stdlib_only() -> Iterator[None]:
+    """Force the pure-Python block generator even when NumPy is installed."""
+    saved, jitter_module.np = jitter_module.np, None
+    try:
+        yield
+    finally:
+        jitter_module.np = saved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clicks", type=int, default=200_000)
+    parser.add_argument("--repeats", type=int, default=7)
+    args = parser.parse_args()
+
+    baseline, baseline_min = measure(args.clicks, repeats=args.repeats)
+    print(f"refill chunk: {REFILL_CHUNK} factors")
+    print(
+        f"{'case':<24}{'ns/click':>10}{'min':>10}{'refill':>10}{'no refill':>11}{'vs fixed':>10}"
+        f"{'chunk':>11}{'max refill':>13}"
+    )
+    print(
+        f"{'fixed':<24}{baseline:>10.1f}{baseline_min:>10.1f}{'-':>10}{baseline:>11.1f}{0.0:>+10.1f}{'-':>11}{'-':>13}"
+    )
+    generators = ["stdlib"] + (["numpy"] if jitter_module.np is not None else [])
+    for generator in generators:
+        for distribution in JITTER_DISTRIBUTIONS:
+            config = JitterConfig(distribution=distribution, spread=0.1, seed=0)
+            with stdlib_only() if generator == "stdlib" else nullcontext():
+                total, best = measure(args.clicks, config, args.repeats)
+                with timed_fills() as stats:
+                    run_once(args.clicks, config)
+            refill = sum(stats.chunks_ns) / args.clicks
+            chunk = statistics.median(stats.chunks_ns) / 1000.0
+            hot = total - refill
+            name = f"{distribution} ({generator})"
+            print(
+                f"{name:<24}{total:>10.1f}{best:>10.1f}{refill:>10.1f}{hot:>11.1f}{hot - baseline:>+10.1f}"
+                f"{chunk:>9.1f}us{max(stats.chunks_ns) / 1000.0:>11.1f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
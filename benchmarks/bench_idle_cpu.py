@@ -0,0 +1,44 @@
+"""CPU cost of waiting between clicks, default versus low-power scheduling.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_idle_cpu --interval-ms 500 --clicks 20
+
+Each case runs the real click loop with a no-op backend, so the numbers are
+the loop's own CPU time and wake-ups. ``max late`` shows what the timer slack
+costs in timing accuracy.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from src.domain.clicker_loop import ClickBackend, ClickLoop, RunSummary
+
+
+def run(interval_ms: float, clicks: int, low_power: bool) -> RunSummary:
+    """Run ``clicks`` clicks at ``interval_ms`` and return the summary."""
+    loop = ClickLoop(ClickBackend(click=lambda: None, name="bench"))
+    return loop.run(interval_ms, max_clicks=clicks, low_power=low_power)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--interval-ms", type=float, default=500.0)
+    parser.add_argument("--clicks", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'case':<12}{'cpu/click':>12}{'cpu/s':>12}{'wakeups':>10}{'ctx sw':>10}{'slack':>10}{'max late':>12}")
+    for name, low_power in (("default", False), ("low-power", True)):
+        summary = run(args.interval_ms, args.clicks, low_power)
+        switches = "n/a" if summary.context_switches is None else str(summary.context_switches)
+        cpu_per_second = summary.cpu_s / summary.elapsed_s if summary.elapsed_s else 0.0
+        print(
+            f"{name:<12}{summary.cpu_per_click_s * 1e6:>10.1f}us{cpu_per_second * 1e3:>10.3f}ms"
+            f"{summary.wakeups:>10}{switches:>10}{summary.timer_slack_s * 1e3:>8.1f}ms"
+            f"{summary.max_lateness_s * 1e3:>10.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Trigger-to-click latency and sustainable frame rate of the screen-change trigger.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_screen_trigger --size 256 --clicks 50
+    python -m benchmarks.bench_screen_trigger --region 0,0,256,256
+
+The synthetic source toggles a patch every ``--period-ms``; latency is the time
+from the toggle to the end of the click that reacted to it, so it includes the
+wait for the next captured frame. ``--region`` measures the frame rate of the
+real capture backend instead (no clicks are sent).
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from src.domain.clicker_loop import ClickBackend
+from src.domain.screen_trigger import (
+    ChangeDetector,
+    Region,
+    ScreenTrigger,
+    ScreenTriggerConfig,
+    SyntheticFrameSource,
+    parse_region,
+)
+from src.infra.screen_capture import resolve_frame_source
+
+
+def synthetic(size: int, period_s: float, clicks: int, max_fps: float, step: int) -> None:
+    """Measure toggle-to-click latency against a synthetic source."""
+    source = SyntheticFrameSource(size, size, period_s=period_s)
+    latencies: list[float] = []
+
+    def click() -> None:
+        assert source.changed_at is not None
+        latencies.append(time.perf_counter() - source.changed_at)
+
+    trigger = ScreenTrigger(ClickBackend(click=click, name="bench"))
+    config = ScreenTriggerConfig(Region(0, 0, size, size), step=step, max_fps=max_fps)
+    summary = trigger.run(source, config, max_clicks=clicks)
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{size:>6}{step:>6}{max_fps:>8g}{summary.fps:>10.0f}"
+        f"{statistics.median(latencies) * 1e3:>10.3f}ms{p95 * 1e3:>10.3f}ms{latencies[-1] * 1e3:>10.3f}ms"
+    )
+
+
+def capture(region: Region, seconds: float, step: int) -> None:
+    """Measure the frame rate of the real capture backend plus change detection."""
+    try:
+        source = resolve_frame_source(region)
+    except RuntimeError as exc:
+        raise SystemExit(str(exc)) from exc
+    detector = ChangeDetector(ScreenTriggerConfig(region, step=step))
+    frames = 0
+    grab_s = 0.0
+    detect_s = 0.0
+    try:
+        end = time.perf_counter() + seconds
+        while (before := time.perf_counter()) < end:
+            frame = source.grab()
+            grabbed = time.perf_counter()
+            detector.update(frame)
+            detect_s += time.perf_counter() - grabbed
+            grab_s += grabbed - before
+            frames += 1
+    finally:
+        source.close()
+    print(f"{type(source).__name__}: {frames / seconds:.0f} fps")
+    print(f"  grab {grab_s / frames * 1e3:.3f}ms/frame, detect {detect_s / frames * 1e6:.1f}us/frame")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--period-ms", type=float, default=20.0)
+    parser.add_argument("--clicks", type=int, default=50)
+    parser.add_argument("--step", type=int, default=4)
+    parser.add_argument("--region", default="", help="x,y,width,height to measure real screen capture")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    if args.region:
+        region = parse_region(args.region)
+        if region is None:
+            parser.error("--region must be x,y,width,height")
+        capture(region, args.seconds, args.step)
+        return
+
+    print(f"{'size':>6}{'step':>6}{'cap fps':>8}{'fps':>10}{'p50':>12}{'p95':>12}{'max':>12}")
+    for max_fps in (60.0, 240.0, 1000.0):
+        synthetic(args.size, args.period_ms / 1000.0, args.clicks, max_fps, args.step)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 # -*- mode: python ; coding: utf-8 -*-
 from PyInstaller.utils.hooks import collect_submodules
 
-hiddenimports = collect_submodules("pynput") + ["keyboard"]
+# numpy (jitter, screen trigger) and the screen capture backends are loaded via import_module.
+hiddenimports = collect_submodules("pynput") + ["keyboard", "numpy"] + collect_submodules("mss") + ["PIL.ImageGrab"]
 
 block_cipher = None
 
@@ -3,23 +3,42 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from dataclasses import replace
 
-from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QObject, pyqtSignal
 
 from ..domain.clicker import ClickerController
+from ..domain.clicker_loop import RunSummary
+from ..domain.screen_trigger import TriggerSummary
+from ..infra.hotkey_bindings import HotkeyAction
 from ..infra.hotkey_service import HotkeyService
+from ..infra.key_repeat import exclude_hotkey_keys, resolve_key_backend
+from ..infra.screen_capture import resolve_frame_source
+from ..infra.settings import TRIGGER_HOLD
 from ..ui.main_window import MainWindow
+from .metrics import Counter, MetricsRegistry
+
+_SPEED_UP_FACTOR = 0.8
+_SLOW_DOWN_FACTOR = 1.25
+# X11 may deliver held-key auto-repeat as release+press pairs; a hold release
+# only stops clicking if no press of the hotkey follows within this window.
+_HOLD_RELEASE_DEBOUNCE_S = 0.02
 
 
 class AppCoordinator(QObject):
     """Connect UI events with domain services."""
 
+    hotkey_triggered = pyqtSignal(str)
+
     def __init__(
         self,
         window: MainWindow,
         clicker: ClickerController,
         hotkey_service: HotkeyService,
         logger: logging.Logger | None = None,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         super().__init__()
         self._window = window
@@ -27,50 +46,262 @@ class AppCoordinator(QObject):
         self._hotkey_service = hotkey_service
         self._logger = logger or logging.getLogger(__name__)
         self._running = False
+        self._paused = False
+        self._scheduled_wall = 0.0
+        # Read from the hotkey listener thread in hold mode; only replaced on the UI thread.
+        self._interval_ms = self._window.current_interval_ms()
+        self._hold_mode = self._window.current_trigger_mode() == TRIGGER_HOLD
+        self._jitter = self._window.current_jitter()
+        self._hold_lock = threading.Lock()
+        self._pending_hold_stop: threading.Timer | None = None
+        self._runs_started: Counter | None = None
+        self._run_errors: Counter | None = None
+        if metrics is not None:
+            self._runs_started = metrics.counter("renda_runs_started_total", "Clicker runs started.")
+            self._run_errors = metrics.counter("renda_run_errors_total", "Clicker runs that ended with an error.")
 
-        self._window.hotkey_changed.connect(self._handle_hotkey_changed)
+        self.hotkey_triggered.connect(self._handle_hotkey_action)
+        self._window.hotkey_bindings_changed.connect(self._handle_hotkey_inputs_changed)
+        self._window.interval_changed.connect(self._handle_interval_changed)
+        self._window.trigger_mode_changed.connect(self._handle_trigger_mode_changed)
+        self._window.jitter_changed.connect(self._handle_jitter_changed)
+        self._window.key_repeat_changed.connect(self._handle_hotkey_inputs_changed)
+        self._window.low_power_changed.connect(self._clicker.set_low_power)
+        self._window.screen_trigger_changed.connect(self._apply_screen_trigger)
+        self._window.scheduled_start_requested.connect(self._handle_scheduled_start)
+        self._window.schedule_cancel_requested.connect(self._clicker.stop)
         self._clicker.started.connect(self._handle_clicker_started)
         self._clicker.stopped.connect(self._handle_clicker_stopped)
         self._clicker.error.connect(self._handle_clicker_error)
+        self._clicker.finished.connect(self._handle_run_finished)
 
-        self._register_hotkey(self._window.current_hotkey())
+        self._clicker.set_low_power(self._window.current_low_power())
+        self._register_hotkeys()
+        self._apply_key_repeat()
+        self._apply_screen_trigger()
 
-    def shutdown(self) -> None:
-        """Clean up any running services."""
+    def shutdown(self) -> bool:
+        """Clean up any running services; return ``False`` if the clicker thread is hung."""
         self._logger.info("Shutting down application coordinator")
         self._hotkey_service.unregister()
-        self._clicker.shutdown()
+        with self._hold_lock:
+            pending, self._pending_hold_stop = self._pending_hold_stop, None
+        if pending is not None:
+            pending.cancel()
+        if self._clicker.shutdown():
+            return True
+        self._logger.error("Clicker thread did not stop; a backend call is still blocked")
+        return False
+
+    def handle_hotkey(self, action: HotkeyAction) -> None:
+        """Handle a hotkey press reported on the listener thread.
+
+        In hold mode the start request goes straight to the clicker so the first
+        click does not wait for the UI thread; a press that follows a release
+        within the debounce window only cancels the pending stop. Other actions
+        are forwarded to the UI thread.
+        """
+        if action is HotkeyAction.TOGGLE and self._hold_mode:
+            with self._hold_lock:
+                pending, self._pending_hold_stop = self._pending_hold_stop, None
+            if pending is not None:
+                pending.cancel()
+                return
+            self._clicker.start(self._interval_ms, self._jitter)
+            return
+        self.hotkey_triggered.emit(action.value)
+
+    def handle_hotkey_release(self, action: HotkeyAction) -> None:
+        """Stop a hold-mode run shortly after its hotkey is released on the listener thread."""
+        if action is not HotkeyAction.TOGGLE or not self._hold_mode:
+            return
+
+        def stop() -> None:
+            with self._hold_lock:
+                if self._pending_hold_stop is not timer:
+                    return
+                self._pending_hold_stop = None
+            self._clicker.stop()
+
+        timer = threading.Timer(_HOLD_RELEASE_DEBOUNCE_S, stop)
+        timer.daemon = True
+        with self._hold_lock:
+            previous, self._pending_hold_stop = self._pending_hold_stop, timer
+        if previous is not None:
+            previous.cancel()
+        timer.start()
 
     def _handle_clicker_started(self, interval_ms: int, backend: str) -> None:
         self._running = True
-        self._window.set_running(True)
+        self._paused = False
+        if self._runs_started is not None:
+            self._runs_started.inc()
+        if self._scheduled_wall > time.time():
+            self._window.set_scheduled(self._scheduled_wall)
+        else:
+            self._window.set_running(True)
         self._logger.info(
             "Clicker started",
             extra={"interval_ms": interval_ms, "backend": backend},
         )
 
     def _handle_clicker_stopped(self) -> None:
-        self._running = False
-        self._window.set_running(False)
+        self._reset_run_state()
         self._logger.info("Clicker stopped")
 
-    def _handle_clicker_error(self, message: str) -> None:
+    def _reset_run_state(self) -> None:
+        """Mark the run as over and pick up interval settings changed while it ran."""
         self._running = False
+        self._paused = False
+        self._scheduled_wall = 0.0
+        self._interval_ms = self._window.current_interval_ms()
+        self._jitter = self._window.current_jitter()
         self._window.set_running(False)
+
+    def _handle_scheduled_start(self, wall_time: float) -> None:
+        if self._running:
+            return
+        self._scheduled_wall = wall_time
+        self._clicker.start(self._window.current_interval_ms(), self._jitter, start_wall=wall_time)
+        self._logger.info(
+            "Scheduled start armed",
+            extra={"start_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(wall_time))},
+        )
+
+    def _handle_run_finished(self, summary: RunSummary | TriggerSummary) -> None:
+        if summary.start_error_s is not None:
+            self._logger.info("Scheduled start error", extra={"start_error_ms": round(summary.start_error_s * 1000, 3)})
+        if isinstance(summary, TriggerSummary):
+            self._logger.info(
+                "Screen trigger summary",
+                extra={
+                    "frames": summary.frames,
+                    "clicks": summary.clicks,
+                    "elapsed_s": round(summary.elapsed_s, 3),
+                    "fps": round(summary.fps, 1),
+                    "max_latency_ms": round(summary.max_latency_s * 1000, 3),
+                },
+            )
+            return
+        self._logger.info(
+            "Click run summary",
+            extra={
+                "clicks": summary.clicks,
+                "missed": summary.missed,
+                "elapsed_s": round(summary.elapsed_s, 3),
+                "max_lateness_ms": round(summary.max_lateness_s * 1000, 3),
+                "cpu_s": round(summary.cpu_s, 6),
+                "cpu_per_click_us": round(summary.cpu_per_click_s * 1e6, 1),
+                "wakeups": summary.wakeups,
+                "context_switches": summary.context_switches,
+                "timer_slack_ms": round(summary.timer_slack_s * 1000, 3),
+            },
+        )
+
+    def _handle_clicker_error(self, message: str) -> None:
+        self._reset_run_state()
+        if self._run_errors is not None:
+            self._run_errors.inc()
         self._logger.error("Clicker error: %s", message)
 
-    def _handle_hotkey_changed(self, hotkey: str) -> None:
-        self._register_hotkey(hotkey)
+    def _handle_hotkey_inputs_changed(self) -> None:
+        """Re-register hotkeys and key repeat together; each depends on the other's keys."""
+        self._register_hotkeys()
+        self._apply_key_repeat()
+
+    def _apply_key_repeat(self) -> None:
+        """Switch the clicker between mouse clicks and the configured key repeat.
 
-    def _register_hotkey(self, hotkey: str) -> None:
+        Keys that are part of a hotkey are left out so repeated input cannot
+        trigger (or, in hold mode, release) the hotkey itself.
+        """
+        config = self._window.current_key_repeat()
+        if config is None:
+            self._clicker.set_backend(None)
+            return
+        keys = exclude_hotkey_keys(config.keys, self._window.current_hotkey_bindings())
+        if keys != config.keys:
+            self._logger.warning("Hotkey keys excluded from key repeat: %s", sorted(set(config.keys) - set(keys)))
         try:
-            self._hotkey_service.register(hotkey)
+            backend = resolve_key_backend(replace(config, keys=keys))
+        except (RuntimeError, ValueError, OSError) as exc:
+            self._logger.warning("Key repeat unavailable, using mouse clicks: %s", exc)
+            self._clicker.set_backend(None)
+            return
+        self._clicker.set_backend(backend)
+        self._logger.info("Key repeat configured", extra={"backend": backend.name, "keys": list(keys)})
+
+    def _apply_screen_trigger(self) -> None:
+        """Switch the clicker between interval clicking and the screen-change trigger.
+
+        The capture backend is resolved on the worker thread when a run starts,
+        so a missing capture library is reported as a run error.
+        """
+        config = self._window.current_screen_trigger()
+        if config is None:
+            self._clicker.set_screen_trigger(None)
+            return
+        region = config.region
+        self._clicker.set_screen_trigger(config, lambda: resolve_frame_source(region))
+        self._logger.info(
+            "Screen trigger configured",
+            extra={"region": [region.left, region.top, region.width, region.height]},
+        )
+
+    def _handle_jitter_changed(self) -> None:
+        self._jitter = self._window.current_jitter()
+
+    def _handle_trigger_mode_changed(self, mode: str) -> None:
+        if self._running:
+            self._clicker.stop()
+        self._hold_mode = mode == TRIGGER_HOLD
+        self._register_hotkeys()
+
+    def _register_hotkeys(self) -> None:
+        hold_actions = (HotkeyAction.TOGGLE,) if self._hold_mode else ()
+        # The listener also sees our repeated keys; they must not cancel a half-typed sequence.
+        # Only keys that survive the hotkey exclusion are repeated, so only those are ignored.
+        bindings = self._window.current_hotkey_bindings()
+        key_repeat = self._window.current_key_repeat()
+        repeat_keys = exclude_hotkey_keys(key_repeat.keys, bindings) if key_repeat is not None else ()
+        try:
+            self._hotkey_service.register(bindings, hold_actions, repeat_keys)
         except ValueError as exc:
-            self._logger.warning("Hotkey registration failed: %s", exc)
+            self._logger.warning("Hotkey registration failed, keeping the previous hotkeys: %s", exc)
+
+    def _handle_hotkey_action(self, value: str) -> None:
+        action = HotkeyAction(value)
+        if action is HotkeyAction.TOGGLE:
+            self.toggle_clicking()
+        elif action is HotkeyAction.PAUSE:
+            self.toggle_pause()
+        elif action is HotkeyAction.SPEED_UP:
+            self._window.scale_interval(_SPEED_UP_FACTOR)
+        elif action is HotkeyAction.SLOW_DOWN:
+            self._window.scale_interval(_SLOW_DOWN_FACTOR)
+        elif action is HotkeyAction.NEXT_PROFILE:
+            self._window.next_profile()
+
+    def _handle_interval_changed(self, interval_ms: int) -> None:
+        self._interval_ms = interval_ms
+        if self._running:
+            self._clicker.set_interval(interval_ms)
+            self._logger.info("Click interval changed", extra={"interval_ms": interval_ms})
 
     def toggle_clicking(self) -> None:
         """Toggle clicker start/stop based on current state."""
         if self._running:
             self._clicker.stop()
             return
-        self._clicker.start(self._window.current_interval_ms())
+        self._clicker.start(self._window.current_interval_ms(), self._jitter)
+
+    def toggle_pause(self) -> None:
+        """Pause or resume the running clicker."""
+        if not self._running:
+            return
+        self._paused = not self._paused
+        if self._paused:
+            self._clicker.pause()
+        else:
+            self._clicker.resume()
+        self._window.set_paused(self._paused)
@@ -12,11 +12,54 @@ class AppConfig:
 
     log_level: str = "INFO"
     log_format: str = "json"
+    metrics_enabled: bool = False
+    metrics_port: int = 0
+    profile_mode: str = ""
+    profile_dir: str = ""
+    trace_enabled: bool = False
+    trace_dir: str = ""
+    click_deadline_s: float = 2.0
 
 
 def load_config() -> AppConfig:
     """Load configuration from environment variables."""
+    metrics_port = _env_int("RENDA_METRICS_PORT", AppConfig.metrics_port)
+    trace_dir = os.getenv("RENDA_TRACE_DIR", AppConfig.trace_dir)
     return AppConfig(
         log_level=os.getenv("RENDA_LOG_LEVEL", AppConfig.log_level),
         log_format=os.getenv("RENDA_LOG_FORMAT", AppConfig.log_format),
+        metrics_enabled=_env_flag("RENDA_METRICS", AppConfig.metrics_enabled) or metrics_port > 0,
+        metrics_port=metrics_port,
+        profile_mode=os.getenv("RENDA_PROFILE", AppConfig.profile_mode).strip().lower(),
+        profile_dir=os.getenv("RENDA_PROFILE_DIR", AppConfig.profile_dir),
+        trace_enabled=_env_flag("RENDA_TRACE", AppConfig.trace_enabled) or bool(trace_dir),
+        trace_dir=trace_dir,
+        click_deadline_s=_env_float("RENDA_CLICK_DEADLINE", AppConfig.click_deadline_s),
     )
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import logging
+import tempfile
+from pathlib import Path
 from typing import NamedTuple
 
 from ..domain.clicker import ClickerController
+from ..infra.click_trace import ClickTracer
+from ..infra.hotkey_bindings import HotkeyAction
 from ..infra.hotkey_service import HotkeyService
+from ..infra.metrics_server import MetricsServer
 from ..infra.settings import SettingsRepository
 from ..ui.main_window import MainWindow
 from .app import AppCoordinator
 from .config import AppConfig, load_config
 from .logging import configure_logging
+from .metrics import MetricsRegistry
+from .profiling import PROFILE_MODES, RunProfiler
 
 
 class AppContainer(NamedTuple):
@@ -20,31 +27,70 @@ class AppContainer(NamedTuple):
     config: AppConfig
     window: MainWindow
     coordinator: AppCoordinator
+    metrics: MetricsRegistry | None = None
+    metrics_server: MetricsServer | None = None
 
 
 def build_container() -> AppContainer:
     """Construct the application components."""
     config = load_config()
-    configure_logging(config)
+    metrics = MetricsRegistry() if config.metrics_enabled else None
+    configure_logging(config, metrics)
     logger = logging.getLogger("renda-chan")
 
-    settings_repo = SettingsRepository()
+    profiler = None
+    if config.profile_mode in PROFILE_MODES:
+        profile_dir = Path(config.profile_dir or tempfile.gettempdir()) / "renda-chan-profiles"
+        profiler = RunProfiler(config.profile_mode, profile_dir, logger=logger)
+    elif config.profile_mode:
+        logger.warning("Unknown profile mode ignored: %s", config.profile_mode)
+
+    tracer = None
+    if config.trace_enabled:
+        trace_dir = Path(config.trace_dir or tempfile.gettempdir()) / "renda-chan-traces"
+        tracer = ClickTracer(trace_dir, logger=logger)
+
+    settings_repo = SettingsRepository(metrics=metrics)
     window = MainWindow(settings_repo)
-    clicker = ClickerController()
+    clicker = ClickerController(
+        metrics=metrics, profiler=profiler, tracer=tracer, click_deadline_s=config.click_deadline_s
+    )
 
     holder: dict[str, AppCoordinator] = {}
 
-    def on_trigger() -> None:
+    def on_action(action: HotkeyAction) -> None:
+        coordinator = holder.get("coordinator")
+        if coordinator is not None:
+            coordinator.handle_hotkey(action)
+
+    def on_release(action: HotkeyAction) -> None:
         coordinator = holder.get("coordinator")
         if coordinator is not None:
-            coordinator.toggle_clicking()
+            coordinator.handle_hotkey_release(action)
 
-    hotkey_service = HotkeyService(on_trigger)
+    hotkey_service = HotkeyService(on_action, metrics=metrics, on_release=on_release)
     coordinator = AppCoordinator(
         window=window,
         clicker=clicker,
         hotkey_service=hotkey_service,
         logger=logger,
+        metrics=metrics,
     )
     holder["coordinator"] = coordinator
-    return AppContainer(config=config, window=window, coordinator=coordinator)
+
+    metrics_server = None
+    if metrics is not None and config.metrics_port > 0:
+        try:
+            metrics_server = MetricsServer(metrics, config.metrics_port, logger=logger)
+        except OSError as exc:
+            logger.warning("Metrics endpoint unavailable: %s", exc)
+        else:
+            metrics_server.start()
+
+    return AppContainer(
+        config=config,
+        window=window,
+        coordinator=coordinator,
+        metrics=metrics,
+        metrics_server=metrics_server,
+    )
@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
-from collections.abc import Mapping
+import queue
+from collections.abc import Callable, Mapping
 from dataclasses import asdict
-from typing import Any
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Any
 
 from .config import AppConfig
 
+if TYPE_CHECKING:
+    from .metrics import MetricsRegistry
+
+_QUEUE_CAPACITY = 10_000
+_listener: QueueListener | None = None
+# Attributes every LogRecord has; anything else was passed through ``extra=``.
+_RECORD_ATTRIBUTES = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "taskName"}
+
+
+def _extra_fields(record: logging.LogRecord) -> dict[str, Any]:
+    """Return the fields passed to the log call through ``extra=``."""
+    return {key: value for key, value in vars(record).items() if key not in _RECORD_ATTRIBUTES}
+
 
 class JsonFormatter(logging.Formatter):
-    """Format log records as JSON lines."""
+    """Format log records as JSON lines, with ``extra=`` fields as top-level keys."""
 
     def format(self, record: logging.LogRecord) -> str:
         payload: dict[str, Any] = {
@@ -21,9 +37,37 @@ class JsonFormatter(logging.Formatter):
             "name": record.name,
             "message": record.getMessage(),
         }
+        for key, value in _extra_fields(record).items():
+            payload.setdefault(key, value)
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=False)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Plain text formatter that appends ``extra=`` fields as ``key=value`` pairs."""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        message = super().formatMessage(record)
+        extras = _extra_fields(record)
+        if not extras:
+            return message
+        return message + " " + " ".join(f"{key}={value}" for key, value in extras.items())
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+
+    def __init__(self, log_queue: queue.Queue[Any], on_drop: Callable[[], None] | None = None) -> None:
+        super().__init__(log_queue)
+        self._on_drop = on_drop
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self._on_drop is not None:
+                self._on_drop()
 
 
 def _resolve_level(level: str) -> int:
@@ -33,25 +77,53 @@ def _resolve_level(level: str) -> int:
     return logging._nameToLevel.get(normalized, logging.INFO)
 
 
-def configure_logging(config: AppConfig) -> None:
-    """Configure structured logging based on application config."""
+def configure_logging(config: AppConfig, metrics: MetricsRegistry | None = None) -> None:
+    """Configure structured logging based on application config.
+
+    Records are handed to a bounded queue and written by a background listener so
+    that the click and hotkey threads never block on I/O.
+    """
+    global _listener
+
     handler = logging.StreamHandler()
     if config.log_format.lower() == "json":
         handler.setFormatter(JsonFormatter())
     else:
         handler.setFormatter(
-            logging.Formatter(
+            TextFormatter(
                 fmt="%(asctime)s %(levelname)s %(name)s %(message)s",
             )
         )
 
+    on_drop = None
+    if metrics is not None:
+        on_drop = metrics.counter("renda_log_queue_drops_total", "Log records dropped because the queue was full.").inc
+
+    if _listener is not None:
+        _listener.stop()
+    log_queue: queue.Queue[Any] = queue.Queue(maxsize=_QUEUE_CAPACITY)
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
     root = logging.getLogger()
     root.handlers.clear()
-    root.addHandler(handler)
+    root.addHandler(DroppingQueueHandler(log_queue, on_drop))
     root.setLevel(_resolve_level(config.log_level))
 
     logging.getLogger(__name__).debug("Logging configured", extra={"config": _config_map(config)})
 
 
+def shutdown_logging() -> None:
+    """Flush queued records and stop the background listener."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def _config_map(config: AppConfig) -> Mapping[str, str]:
     return {key: str(value) for key, value in asdict(config).items()}
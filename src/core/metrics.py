@@ -0,0 +1,193 @@
+"""In-process metrics registry with a text exposition renderer."""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable
+
+LabelItems = tuple[tuple[str, str], ...]
+
+# Seconds; covers sub-millisecond backend calls up to multi-second stalls.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+
+class Counter:
+    """Monotonically increasing value."""
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter by ``amount``."""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        """Return the current value."""
+        return self._value
+
+
+class Histogram:
+    """Cumulative-bucket histogram with fixed upper bounds."""
+
+    __slots__ = ("_bounds", "_counts", "_count", "_lock", "_sum")
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        bounds = tuple(sorted(buckets))
+        if not bounds:
+            raise ValueError("buckets must not be empty")
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+
+    @property
+    def count(self) -> int:
+        """Return the number of observations."""
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of all observations."""
+        return self._sum
+
+    def snapshot(self) -> tuple[list[tuple[float, int]], int, float]:
+        """Return cumulative ``(upper_bound, count)`` pairs, total count and sum."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            total_sum = self._sum
+        cumulative: list[tuple[float, int]] = []
+        running = 0
+        for bound, count in zip(self._bounds, counts, strict=False):
+            running += count
+            cumulative.append((bound, running))
+        cumulative.append((float("inf"), total))
+        return cumulative, total, total_sum
+
+
+class MetricsRegistry:
+    """Create and hold named metrics, keyed by name and label set."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._help: dict[str, tuple[str, str]] = {}
+        self._counters: dict[tuple[str, LabelItems], Counter] = {}
+        self._histograms: dict[tuple[str, LabelItems], Histogram] = {}
+
+    def counter(self, name: str, help_text: str, **labels: str) -> Counter:
+        """Return the counter for ``name`` and ``labels``, creating it if needed."""
+        key = (name, _label_items(labels))
+        with self._lock:
+            self._declare(name, "counter", help_text)
+            counter = self._counters.get(key)
+            if counter is None:
+                counter = Counter()
+                self._counters[key] = counter
+            return counter
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        **labels: str,
+    ) -> Histogram:
+        """Return the histogram for ``name`` and ``labels``, creating it if needed."""
+        key = (name, _label_items(labels))
+        with self._lock:
+            self._declare(name, "histogram", help_text)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = Histogram(buckets)
+                self._histograms[key] = histogram
+            return histogram
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            help_map = dict(self._help)
+            counters = sorted(self._counters.items(), key=lambda item: item[0])
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+
+        lines: list[str] = []
+        emitted: set[str] = set()
+
+        def header(name: str) -> None:
+            if name in emitted:
+                return
+            emitted.add(name)
+            kind, help_text = help_map[name]
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), counter in counters:
+            header(name)
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(counter.value)}")
+
+        for (name, labels), histogram in histograms:
+            header(name)
+            cumulative, total, total_sum = histogram.snapshot()
+            for bound, count in cumulative:
+                le = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total_sum)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {total}")
+
+        return "\n".join(lines) + "\n"
+
+    def _declare(self, name: str, kind: str, help_text: str) -> None:
+        existing = self._help.get(name)
+        if existing is None:
+            self._help[name] = (kind, help_text)
+        elif existing[0] != kind:
+            raise ValueError(f"metric {name} is already registered as {existing[0]}")
+
+
+def _label_items(labels: dict[str, str]) -> LabelItems:
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(labels: LabelItems) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
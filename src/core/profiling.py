@@ -0,0 +1,123 @@
+"""Profiling helpers: thread stack dumps, stack sampling and cProfile sessions."""
+
+from __future__ import annotations
+
+import cProfile
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter as TallyCounter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+PROFILE_MODES = ("cprofile", "sample")
+
+
+def dump_stacks() -> str:
+    """Return a formatted stack trace for every live thread."""
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    sections: list[str] = []
+    for ident, frame in sys._current_frames().items():
+        header = f"Thread {names.get(ident, '?')} ({ident})"
+        sections.append(header + "\n" + "".join(traceback.format_stack(frame)))
+    return "\n".join(sections)
+
+
+class StackSampler:
+    """Sample thread stacks periodically and aggregate them as collapsed stacks."""
+
+    def __init__(self, interval_s: float = 0.005, thread_id: int | None = None) -> None:
+        if interval_s <= 0:
+            raise ValueError("interval_s must be positive")
+        self._interval_s = interval_s
+        self._thread_id = thread_id
+        self._samples: TallyCounter[str] = TallyCounter()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling on a daemon thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="renda-stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> str:
+        """Stop sampling and return the collapsed stacks collected so far."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        return self.collapsed()
+
+    def sample_for(self, duration_s: float) -> str:
+        """Sample for ``duration_s`` seconds on the calling thread."""
+        deadline = time.monotonic() + duration_s
+        while time.monotonic() < deadline:
+            self._sample_once()
+            time.sleep(self._interval_s)
+        return self.collapsed()
+
+    def collapsed(self) -> str:
+        """Return samples in the ``frame;frame;frame count`` collapsed format."""
+        return "".join(f"{stack} {count}\n" for stack, count in self._samples.most_common())
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self._interval_s):
+            self._sample_once()
+
+    def _sample_once(self) -> None:
+        own = threading.get_ident()
+        for ident, frame in sys._current_frames().items():
+            if ident == own or (self._thread_id is not None and ident != self._thread_id):
+                continue
+            frames = [
+                f"{entry.name} ({Path(entry.filename).name}:{entry.lineno})" for entry in traceback.extract_stack(frame)
+            ]
+            self._samples[";".join(frames)] += 1
+
+
+class RunProfiler:
+    """Profile click runs according to the configured mode and dump results to disk."""
+
+    def __init__(self, mode: str, output_dir: Path, logger: logging.Logger | None = None) -> None:
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"unknown profile mode: {mode}")
+        self._mode = mode
+        self._output_dir = output_dir
+        self._logger = logger or logging.getLogger(__name__)
+        self._runs = itertools.count(1)
+
+    @contextmanager
+    def session(self, label: str) -> Iterator[None]:
+        """Profile the enclosed block on the calling thread.
+
+        Output is named ``<label>-<timestamp>-<pid>-<run>`` so runs started
+        within the same second keep separate files.
+        """
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(self._runs)}"
+        if self._mode == "cprofile":
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                path = self._output_dir / f"{label}-{stamp}.prof"
+                profile.dump_stats(path)
+                self._logger.info("Profile written: %s", path)
+            return
+
+        sampler = StackSampler(thread_id=threading.get_ident())
+        sampler.start()
+        try:
+            yield
+        finally:
+            path = self._output_dir / f"{label}-{stamp}.folded"
+            path.write_text(sampler.stop(), encoding="utf-8")
+            self._logger.info("Stack samples written: %s", path)
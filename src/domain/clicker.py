@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import threading
+from contextlib import ExitStack, nullcontext
 from importlib import import_module, util
+from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
 
-from .clicker_loop import ClickBackend, ClickLoop
+from .clicker_loop import ClickBackend, ClickLoop, wall_to_clock
+from .jitter import JitterConfig
+from .screen_trigger import FrameSourceFactory, ScreenTrigger, ScreenTriggerConfig
+from .watchdog import DEFAULT_CLICK_DEADLINE_S, ClickWatchdog, HangReport
+
+if TYPE_CHECKING:
+    from ..core.metrics import MetricsRegistry
+    from ..core.profiling import RunProfiler
+    from ..infra.click_trace import ClickTracer
 
 
 def resolve_click_backend() -> ClickBackend:
@@ -30,37 +41,182 @@ def resolve_click_backend() -> ClickBackend:
     raise RuntimeError("pynput または pyautogui のいずれかをインストールしてください。")
 
 
+DEFAULT_SHUTDOWN_TIMEOUT_S = 3.0
+
+
+def _close_backend(backend: ClickBackend) -> None:
+    if backend.close is not None:
+        backend.close()
+
+
 class ClickerWorker(QObject):
     """Background worker that executes clicks at a fixed interval."""
 
     started = pyqtSignal(int, str)
     stopped = pyqtSignal()
     error = pyqtSignal(str)
+    finished = pyqtSignal(object)
 
-    def __init__(self, backend: ClickBackend | None = None) -> None:
+    def __init__(
+        self,
+        backend: ClickBackend | None = None,
+        metrics: MetricsRegistry | None = None,
+        profiler: RunProfiler | None = None,
+        tracer: ClickTracer | None = None,
+        click_deadline_s: float = DEFAULT_CLICK_DEADLINE_S,
+    ) -> None:
         super().__init__()
-        self._backend = backend or resolve_click_backend()
-        self._loop = ClickLoop(self._backend)
+        self._metrics = metrics
+        self._low_power = False
+        self._default_backend = backend or resolve_click_backend()
+        self._backend = self._default_backend
+        self._pending_backend: ClickBackend | None = None
+        self._loop = ClickLoop(self._backend, metrics=metrics)
+        self._trigger = ScreenTrigger(self._backend, metrics=metrics)
+        self._screen_trigger: tuple[ScreenTriggerConfig, FrameSourceFactory] | None = None
+        self._watchdog = (
+            ClickWatchdog(self._loop, click_deadline_s, self._report_hang) if click_deadline_s > 0 else None
+        )
+        self._profiler = profiler
+        self._tracer = tracer
+        self._request_lock = threading.Lock()
+        self._requested = 0
+        self._cancelled = 0
+
+    def request_run(self) -> int:
+        """Reserve a token for a start request (safe to call from any thread)."""
+        with self._request_lock:
+            self._requested += 1
+            return self._requested
 
-    @pyqtSlot(int)
-    def start(self, interval_ms: int) -> None:
-        """Start clicking on the worker thread."""
+    @pyqtSlot(int, int, object, float)
+    def start(
+        self,
+        interval_ms: int,
+        token: int = 0,
+        jitter: JitterConfig | None = None,
+        start_wall: float = 0.0,
+    ) -> None:
+        """Start clicking on the worker thread.
+
+        Requests whose ``token`` was issued before the latest :meth:`stop` are
+        dropped, so a stop that overtakes a queued start still wins. A positive
+        ``start_wall`` (epoch seconds) holds the first click until that moment;
+        :meth:`stop` cancels the wait. With a screen trigger configured, clicks
+        follow region changes instead and ``interval_ms`` is the minimum gap.
+        """
         if interval_ms <= 0:
             self.error.emit("クリック間隔は 1ms 以上を指定してください。")
             return
+        with self._request_lock:
+            if token and token <= self._cancelled:
+                return
+            self._loop.arm()
+            self._trigger.arm()
+            pending, self._pending_backend = self._pending_backend, None
+        if pending is not None and pending is not self._backend:
+            previous, self._backend = self._backend, pending
+            self._loop.set_backend(pending)
+            self._trigger.set_backend(pending)
+            _close_backend(previous)
 
         self.started.emit(interval_ms, self._backend.name)
+        session = self._profiler.session("click-run") if self._profiler is not None else nullcontext()
         try:
-            self._loop.run(interval_ms)
+            with session, ExitStack() as stack:
+                screen_trigger = self._screen_trigger
+                if self._watchdog is not None:
+                    self._watchdog.arm(self._backend.name, self._trigger if screen_trigger is not None else None)
+                    stack.callback(self._watchdog.disarm)
+                start_at = wall_to_clock(start_wall) if start_wall > 0 else None
+                if screen_trigger is not None:
+                    config, source_factory = screen_trigger
+                    source = source_factory()
+                    stack.callback(source.close)
+                    summary: object = self._trigger.run(source, config, interval_ms, start_at=start_at)
+                else:
+                    trace = None
+                    if self._tracer is not None:
+                        trace = stack.enter_context(self._tracer.session("click-run")).record
+                    summary = self._loop.run(
+                        interval_ms, jitter, trace=trace, low_power=self._low_power, start_at=start_at
+                    )
+            self.finished.emit(summary)
         except Exception as exc:  # pragma: no cover - depends on backend
             self.error.emit(str(exc))
         finally:
             self.stopped.emit()
 
-    @pyqtSlot()
+    def _report_hang(self, report: HangReport) -> None:
+        # Runs on the watchdog thread: request a stop in case the call ever returns.
+        self.stop()
+        if self._metrics is not None:
+            self._metrics.counter(
+                "renda_click_hangs_total",
+                "Backend click calls that exceeded the watchdog deadline.",
+                backend=report.backend,
+            ).inc()
+        self.error.emit(report.message())
+
+    def set_backend(self, backend: ClickBackend | None) -> None:
+        """Use ``backend`` (``None`` for the default mouse click) from the next run on.
+
+        Safe to call from any thread; a running loop keeps its current backend.
+        """
+        with self._request_lock:
+            replaced, self._pending_backend = self._pending_backend, backend or self._default_backend
+        if replaced is not None and replaced is not self._backend:
+            _close_backend(replaced)
+
+    def set_low_power(self, enabled: bool) -> None:
+        """Enable power-saving timers from the next run on (safe to call from any thread)."""
+        self._low_power = enabled
+
+    def set_screen_trigger(
+        self, config: ScreenTriggerConfig | None, source_factory: FrameSourceFactory | None = None
+    ) -> None:
+        """Click on changes of ``config.region`` from the next run on (``None`` for interval clicking).
+
+        ``source_factory`` is called on the worker thread at the start of each
+        run. Safe to call from any thread.
+        """
+        if config is None or source_factory is None:
+            self._screen_trigger = None
+        else:
+            self._screen_trigger = (config, source_factory)
+
+    def close(self) -> None:
+        """Release the watchdog and the active and pending backends (after the worker thread has stopped)."""
+        if self._watchdog is not None:
+            self._watchdog.close()
+        with self._request_lock:
+            pending, self._pending_backend = self._pending_backend, None
+        if pending is not None and pending is not self._backend:
+            _close_backend(pending)
+        _close_backend(self._backend)
+        self._backend = self._default_backend
+
     def stop(self) -> None:
-        """Request the click loop to stop."""
-        self._loop.stop()
+        """Request the click loop to stop (safe to call from any thread)."""
+        with self._request_lock:
+            self._cancelled = self._requested
+            self._loop.stop()
+            self._trigger.stop()
+
+    def pause(self) -> None:
+        """Pause the click loop (safe to call from any thread)."""
+        self._loop.pause()
+        self._trigger.pause()
+
+    def resume(self) -> None:
+        """Resume a paused click loop (safe to call from any thread)."""
+        self._loop.resume()
+        self._trigger.resume()
+
+    def set_interval(self, interval_ms: int) -> None:
+        """Change the interval of the running loop (safe to call from any thread)."""
+        self._loop.set_interval(interval_ms)
+        self._trigger.set_min_gap(interval_ms)
 
 
 class ClickerController(QObject):
@@ -69,37 +225,86 @@ class ClickerController(QObject):
     started = pyqtSignal(int, str)
     stopped = pyqtSignal()
     error = pyqtSignal(str)
+    finished = pyqtSignal(object)
 
-    request_start = pyqtSignal(int)
-    request_stop = pyqtSignal()
+    request_start = pyqtSignal(int, int, object, float)
 
-    def __init__(self, backend: ClickBackend | None = None) -> None:
+    def __init__(
+        self,
+        backend: ClickBackend | None = None,
+        metrics: MetricsRegistry | None = None,
+        profiler: RunProfiler | None = None,
+        tracer: ClickTracer | None = None,
+        click_deadline_s: float = DEFAULT_CLICK_DEADLINE_S,
+        shutdown_timeout_s: float = DEFAULT_SHUTDOWN_TIMEOUT_S,
+    ) -> None:
         super().__init__()
+        self._shutdown_timeout_s = shutdown_timeout_s
         self._thread = QThread()
-        self._worker = ClickerWorker(backend)
+        self._worker = ClickerWorker(
+            backend, metrics=metrics, profiler=profiler, tracer=tracer, click_deadline_s=click_deadline_s
+        )
         self._worker.moveToThread(self._thread)
 
         self.request_start.connect(self._worker.start)
-        self.request_stop.connect(self._worker.stop)
         self._worker.started.connect(self.started)
         self._worker.stopped.connect(self._handle_stopped)
         self._worker.error.connect(self.error)
+        self._worker.finished.connect(self.finished)
 
         self._thread.start()
 
-    def start(self, interval_ms: int) -> None:
-        """Emit a signal to start clicking."""
-        self.request_start.emit(interval_ms)
+    def start(self, interval_ms: int, jitter: JitterConfig | None = None, start_wall: float = 0.0) -> None:
+        """Emit a signal to start clicking, optionally at epoch time ``start_wall`` (safe to call from any thread)."""
+        self.request_start.emit(interval_ms, self._worker.request_run(), jitter, start_wall)
 
     def stop(self) -> None:
-        """Emit a signal to stop clicking."""
-        self.request_stop.emit()
+        """Stop clicking.
+
+        The worker thread is busy inside the loop while clicking, so control
+        requests go straight to the thread-safe loop instead of a queued signal.
+        """
+        self._worker.stop()
+
+    def pause(self) -> None:
+        """Pause clicking without ending the run."""
+        self._worker.pause()
+
+    def resume(self) -> None:
+        """Resume a paused run."""
+        self._worker.resume()
+
+    def set_interval(self, interval_ms: int) -> None:
+        """Change the interval of the current run."""
+        self._worker.set_interval(interval_ms)
+
+    def set_backend(self, backend: ClickBackend | None) -> None:
+        """Switch the click backend for the next run (``None`` restores mouse clicks)."""
+        self._worker.set_backend(backend)
+
+    def set_low_power(self, enabled: bool) -> None:
+        """Toggle power-saving timers for the next run."""
+        self._worker.set_low_power(enabled)
+
+    def set_screen_trigger(
+        self, config: ScreenTriggerConfig | None, source_factory: FrameSourceFactory | None = None
+    ) -> None:
+        """Switch the next run between interval clicking and the screen-change trigger."""
+        self._worker.set_screen_trigger(config, source_factory)
+
+    def shutdown(self) -> bool:
+        """Stop the worker thread and release resources.
 
-    def shutdown(self) -> None:
-        """Stop the worker thread and release resources."""
+        Waits at most ``shutdown_timeout_s`` for the worker thread. Returns
+        ``False`` if it is still stuck inside a backend call; the caller should
+        then exit the process without waiting for it.
+        """
         self.stop()
         self._thread.quit()
-        self._thread.wait()
+        if not self._thread.wait(int(self._shutdown_timeout_s * 1000)):
+            return False
+        self._worker.close()
+        return True
 
     def _handle_stopped(self) -> None:
         self.stopped.emit()
@@ -3,43 +3,320 @@
 from __future__ import annotations
 
 import threading
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .jitter import IntervalSampler, JitterConfig
+from .power import CpuSample, low_power_slack, timer_slack
+
+if TYPE_CHECKING:
+    from ..core.metrics import Counter, Histogram, MetricsRegistry
+
+ClickTrace = Callable[[float, float, float], None]
+"""Per-click hook receiving ``(scheduled, actual, cost)`` in ``clock`` seconds."""
+
+# A scheduled start sleeps until this long before the target, then polls.
+START_SPIN_S = 0.02
+
+
+def wall_to_clock(
+    wall_time: float,
+    clock: Callable[[], float] = time.perf_counter,
+    wall_clock: Callable[[], float] = time.time,
+) -> float:
+    """Convert an epoch timestamp into a deadline on ``clock``.
+
+    The wall clock is read between two ``clock`` readings and paired with their
+    midpoint, which keeps the conversion error well below a millisecond.
+    """
+    before = clock()
+    now = wall_clock()
+    after = clock()
+    return (before + after) / 2.0 + (wall_time - now)
+
+
+def wait_until(
+    target: float,
+    clock: Callable[[], float],
+    wait: Callable[[float], bool],
+    stop_event: threading.Event,
+) -> bool:
+    """Block until ``clock`` reaches ``target``; return ``True`` if stopped first.
+
+    ``wait`` sleeps coarsely until :data:`START_SPIN_S` before ``target``, then
+    is polled with a zero timeout so the deadline is met well inside a
+    millisecond regardless of the OS timer resolution.
+    """
+    # Compare against an absolute deadline: recomputing ``target - clock()``
+    # can leave a remainder a rounding error above the threshold forever.
+    spin_from = target - START_SPIN_S
+    while (now := clock()) < spin_from:
+        if wait(spin_from - now):
+            return True
+    while clock() < target:
+        if wait(0.0):
+            return True
+    return stop_event.is_set()
 
 
 @dataclass(frozen=True)
 class ClickBackend:
-    """Callable wrapper for executing a click action."""
+    """Callable wrapper for executing a click action.
+
+    ``close`` releases backend resources (such as a virtual input device) once
+    the backend is no longer used.
+    """
 
     click: Callable[[], None]
     name: str
+    close: Callable[[], None] | None = None
+
+
+class _LoopInstruments:
+    """Metrics resolved once per loop so the hot path only touches attributes."""
+
+    __slots__ = ("click_cost", "clicks", "cpu", "errors", "lateness", "runs", "wakeups")
+
+    def __init__(self, registry: MetricsRegistry, backend: str) -> None:
+        self.clicks: Counter = registry.counter("renda_clicks_total", "Clicks sent to the backend.", backend=backend)
+        self.runs: Counter = registry.counter("renda_click_runs_total", "Click loop runs started.", backend=backend)
+        self.errors: Counter = registry.counter(
+            "renda_click_errors_total", "Backend click calls that raised.", backend=backend
+        )
+        self.click_cost: Histogram = registry.histogram(
+            "renda_click_cost_seconds", "Time spent inside backend click calls.", backend=backend
+        )
+        self.lateness: Histogram = registry.histogram(
+            "renda_click_lateness_seconds", "Delay between the scheduled and actual click time.", backend=backend
+        )
+        self.cpu: Counter = registry.counter(
+            "renda_click_loop_cpu_seconds_total", "CPU time used by the click loop thread.", backend=backend
+        )
+        self.wakeups: Counter = registry.counter(
+            "renda_click_loop_wakeups_total", "Times the click loop woke up from a wait.", backend=backend
+        )
+
+
+@dataclass(frozen=True)
+class RunSummary:
+    """Outcome of a single :meth:`ClickLoop.run`.
+
+    ``cpu_s`` is the CPU time of the loop thread (``time.thread_time``) and
+    ``context_switches`` comes from ``getrusage`` (``None`` if unsupported).
+    """
+
+    clicks: int
+    missed: int
+    elapsed_s: float
+    max_lateness_s: float
+    cpu_s: float = 0.0
+    wakeups: int = 0
+    context_switches: int | None = None
+    timer_slack_s: float = 0.0
+    start_error_s: float | None = None
+
+    @property
+    def cpu_per_click_s(self) -> float:
+        """Return the average CPU time spent per click."""
+        return self.cpu_s / self.clicks if self.clicks else 0.0
 
 
 class ClickLoop:
-    """Click loop that can run on any thread."""
+    """Click loop that can run on any thread.
+
+    Clicks are scheduled on absolute deadlines taken from ``clock`` so backend
+    cost and wake-up lateness do not accumulate as drift. When the loop falls
+    more than one interval behind, the missed slots are skipped (and counted)
+    rather than replayed as a burst.
+    """
 
     def __init__(
         self,
         backend: ClickBackend,
         stop_event: threading.Event | None = None,
         wait: Callable[[float], bool] | None = None,
+        metrics: MetricsRegistry | None = None,
+        clock: Callable[[], float] = time.perf_counter,
     ) -> None:
         self._backend = backend
+        self._metrics = metrics
         self._stop_event = stop_event or threading.Event()
         self._wait = wait or self._stop_event.wait
+        self._clock = clock
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._interval_s = 0.0
+        self._armed = False
+        # Published for ClickWatchdog: start time of the in-flight backend call.
+        self._click_started: float | None = None
+        self._thread_id: int | None = None
+        self._instruments = _LoopInstruments(metrics, backend.name) if metrics is not None else None
+
+    def run(
+        self,
+        interval_ms: float,
+        jitter: JitterConfig | None = None,
+        max_clicks: int | None = None,
+        trace: ClickTrace | None = None,
+        low_power: bool = False,
+        start_at: float | None = None,
+    ) -> RunSummary:
+        """Run the click loop until stopped or ``max_clicks`` clicks were sent.
 
-    def run(self, interval_ms: int) -> None:
-        """Run the click loop until stopped."""
+        With ``jitter`` each interval is the current interval scaled by a factor
+        drawn from a pre-generated block (see :class:`IntervalSampler`). With
+        ``trace`` every click's deadline, start time and backend cost are passed
+        to the hook right after the click. ``low_power`` lets the OS defer
+        wake-ups by a small timer slack when the interval is long enough (see
+        :func:`low_power_slack`). With ``start_at`` (a ``clock`` time) the first
+        click waits for that moment: a coarse wait until :data:`START_SPIN_S`
+        before it, then polling the stop event until it is reached. A stop
+        during the wait cancels the run without clicking.
+        """
         if interval_ms <= 0:
             raise ValueError("interval_ms must be positive")
+        if max_clicks is not None and max_clicks <= 0:
+            raise ValueError("max_clicks must be positive")
+
+        if self._armed:
+            self._armed = False
+        else:
+            self._stop_event.clear()
+        self._resume_event.set()
+        self._interval_s = interval_ms / 1000.0
+        instruments = self._instruments
+        if instruments is not None:
+            instruments.runs.inc()
+        sampler = IntervalSampler(jitter) if jitter is not None else None
+        click = self._backend.click
+        clock = self._clock
+        stop_event = self._stop_event
+        wait = self._wait
+        self._thread_id = threading.get_ident()
+        self._click_started = None
+
+        clicks = 0
+        missed = 0
+        max_lateness = 0.0
+        wakeups = 0
+        if start_at is not None and wait_until(start_at, clock, wait, stop_event):
+            return RunSummary(clicks=0, missed=0, elapsed_s=0.0, max_lateness_s=0.0)
+        # Sampled after the start wait so its final spin is not charged to the clicks.
+        cpu_before = CpuSample.take()
+        slack = low_power_slack(self._interval_s) if low_power else 0.0
+        with timer_slack(slack) as applied_slack:
+            started_at = deadline = clock()
+            start_error = started_at - start_at if start_at is not None else None
+            while not stop_event.is_set():
+                before = clock()
+                lateness = before - deadline
+                if lateness > max_lateness:
+                    max_lateness = lateness
+                self._click_started = before
+                if instruments is None:
+                    click()
+                else:
+                    try:
+                        click()
+                    except Exception:
+                        instruments.errors.inc()
+                        raise
+                self._click_started = None
+                after = clock()
+                clicks += 1
+                if instruments is not None:
+                    instruments.clicks.inc()
+                    instruments.click_cost.observe(after - before)
+                    instruments.lateness.observe(max(lateness, 0.0))
+                if trace is not None:
+                    trace(deadline, before, after - before)
+                if clicks == max_clicks:
+                    break
+
+                if sampler is None:
+                    interval_s = self._interval_s
+                else:
+                    interval_s = self._interval_s * sampler.next_factor()
+                    sampler.refill()
+                    # Generation time comes out of the wait, not on top of it.
+                    after = clock()
+                deadline += interval_s
+                behind = after - deadline
+                if behind > interval_s:
+                    skipped = int(behind / interval_s)
+                    missed += skipped
+                    deadline += skipped * interval_s
+                remaining = deadline - after
+                if remaining > 0:
+                    wakeups += 1
+                    if wait(remaining):
+                        break
+                elif stop_event.is_set():
+                    break
+                if not self._resume_event.is_set():
+                    wakeups += 1
+                    self._resume_event.wait()
+                    deadline = clock()
+
+        elapsed = clock() - started_at
+        cpu = CpuSample.take() - cpu_before
+        if instruments is not None:
+            instruments.cpu.inc(cpu.thread_cpu_s)
+            instruments.wakeups.inc(wakeups)
+        return RunSummary(
+            clicks=clicks,
+            missed=missed,
+            elapsed_s=elapsed,
+            max_lateness_s=max_lateness,
+            cpu_s=cpu.thread_cpu_s,
+            wakeups=wakeups,
+            context_switches=cpu.context_switches,
+            timer_slack_s=applied_slack,
+            start_error_s=start_error,
+        )
+
+    @property
+    def click_started(self) -> float | None:
+        """Return the clock time the in-flight backend call started, or ``None`` between calls."""
+        return self._click_started
 
+    @property
+    def thread_id(self) -> int | None:
+        """Return the identifier of the thread running (or that last ran) the loop."""
+        return self._thread_id
+
+    def set_backend(self, backend: ClickBackend) -> None:
+        """Send clicks through ``backend`` from the next :meth:`run` on."""
+        self._backend = backend
+        if self._metrics is not None:
+            self._instruments = _LoopInstruments(self._metrics, backend.name)
+
+    def arm(self) -> None:
+        """Reset the stop request ahead of :meth:`run`.
+
+        A :meth:`stop` issued after arming makes the next run return without
+        clicking, instead of being cleared when the run begins.
+        """
         self._stop_event.clear()
-        interval_s = interval_ms / 1000.0
-        while not self._stop_event.is_set():
-            self._backend.click()
-            if self._wait(interval_s):
-                break
+        self._armed = True
+
+    def set_interval(self, interval_ms: float) -> None:
+        """Change the interval of a running loop, effective from the next scheduled click."""
+        if interval_ms <= 0:
+            raise ValueError("interval_ms must be positive")
+        self._interval_s = interval_ms / 1000.0
+
+    def pause(self) -> None:
+        """Hold the loop after the current wait until resumed or stopped."""
+        self._resume_event.clear()
+
+    def resume(self) -> None:
+        """Continue a paused loop."""
+        self._resume_event.set()
 
     def stop(self) -> None:
         """Request the click loop to stop."""
         self._stop_event.set()
+        self._resume_event.set()
@@ -0,0 +1,166 @@
+"""Randomized click interval factors generated in preallocated blocks."""
+
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from dataclasses import dataclass
+from importlib import import_module, util
+from typing import Any
+
+np: Any = import_module("numpy") if util.find_spec("numpy") is not None else None
+
+JITTER_DISTRIBUTIONS = ("uniform", "normal", "lognormal")
+DEFAULT_BLOCK_SIZE = 4096
+# Factors generated per refill call: about 0.2 ms with the stdlib generator.
+REFILL_CHUNK = 128
+
+
+@dataclass(frozen=True)
+class JitterConfig:
+    """Interval randomization relative to the configured interval.
+
+    Samples are multiplicative factors with mean 1.0: ``spread`` is the half
+    width for ``uniform`` and the standard deviation for ``normal`` and
+    ``lognormal``. Factors are clipped to ``[lower, upper]``. A fixed ``seed``
+    reproduces the same sequence for the same generator backend (NumPy or the
+    standard library).
+    """
+
+    distribution: str = "uniform"
+    spread: float = 0.1
+    lower: float = 0.5
+    upper: float = 1.5
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.distribution not in JITTER_DISTRIBUTIONS:
+            raise ValueError(f"unknown jitter distribution: {self.distribution}")
+        if self.spread < 0:
+            raise ValueError("spread must not be negative")
+        if not 0 < self.lower <= 1.0 <= self.upper:
+            raise ValueError("bounds must satisfy 0 < lower <= 1 <= upper")
+
+
+class IntervalSampler:
+    """Hand out interval factors from a preallocated buffer, one index step per click.
+
+    Two ``array('d')`` blocks are kept: when the active block runs out the
+    sampler swaps to the spare one, and :meth:`refill` regenerates the drained
+    block :data:`REFILL_CHUNK` factors at a time. The click loop calls
+    :meth:`refill` after each click and re-reads its clock before waiting, so
+    generation shortens the wait instead of delaying the next click, and no
+    single call costs more than one chunk. If the spare block is still
+    incomplete when it is needed (``refill`` was not called often enough), the
+    rest is generated inside :meth:`next_factor`.
+    """
+
+    def __init__(
+        self,
+        config: JitterConfig,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        use_numpy: bool | None = None,
+    ) -> None:
+        if block_size <= 0:
+            raise ValueError("block_size must be positive")
+        self._config = config
+        self._use_numpy = np is not None if use_numpy is None else use_numpy and np is not None
+        self._rng: random.Random | None = None
+        self._np_rng: Any = None
+        if self._use_numpy:
+            self._np_rng = np.random.default_rng(config.seed)
+        else:
+            self._rng = random.Random(config.seed)
+        self._active = array("d", bytes(8 * block_size))
+        self._spare = array("d", bytes(8 * block_size))
+        self._fill(self._active, 0, block_size)
+        self._fill(self._spare, 0, block_size)
+        self._index = 0
+        self._filled = block_size
+
+    @property
+    def uses_numpy(self) -> bool:
+        """Return whether blocks are generated with NumPy."""
+        return self._use_numpy
+
+    def next_factor(self) -> float:
+        """Return the next interval factor."""
+        index = self._index
+        if index == len(self._active):
+            if self._filled < len(self._spare):
+                self._fill(self._spare, self._filled, len(self._spare))
+            self._active, self._spare = self._spare, self._active
+            self._filled = 0
+            index = 0
+        self._index = index + 1
+        return self._active[index]
+
+    def refill(self) -> None:
+        """Regenerate up to :data:`REFILL_CHUNK` factors of a consumed spare block."""
+        filled = self._filled
+        size = len(self._spare)
+        if filled < size:
+            end = min(filled + REFILL_CHUNK, size)
+            self._fill(self._spare, filled, end)
+            self._filled = end
+
+    def take(self, count: int) -> list[float]:
+        """Return the next ``count`` factors (for tests and benchmarks)."""
+        values: list[float] = []
+        for _ in range(count):
+            values.append(self.next_factor())
+            self.refill()
+        return values
+
+    def _fill(self, block: array[float], start: int, end: int) -> None:
+        if self._np_rng is not None:
+            self._fill_numpy(block, start, end)
+        else:
+            self._fill_stdlib(block, start, end)
+
+    def _fill_numpy(self, block: array[float], start: int, end: int) -> None:
+        config = self._config
+        rng = self._np_rng
+        assert rng is not None
+        out = np.frombuffer(block, dtype=np.float64)[start:end]
+        if config.distribution == "uniform":
+            rng.random(out=out)
+            out *= 2.0 * config.spread
+            out += 1.0 - config.spread
+        elif config.distribution == "normal":
+            rng.standard_normal(out=out)
+            out *= config.spread
+            out += 1.0
+        else:
+            mu, sigma = _lognormal_params(config.spread)
+            rng.standard_normal(out=out)
+            out *= sigma
+            out += mu
+            np.exp(out, out=out)
+        np.clip(out, config.lower, config.upper, out=out)
+
+    def _fill_stdlib(self, block: array[float], start: int, end: int) -> None:
+        config = self._config
+        rng = self._rng
+        assert rng is not None
+        lower, upper, spread = config.lower, config.upper, config.spread
+        if config.distribution == "uniform":
+            sample = rng.random
+            for i in range(start, end):
+                block[i] = min(max(1.0 - spread + 2.0 * spread * sample(), lower), upper)
+        elif config.distribution == "normal":
+            gauss = rng.gauss
+            for i in range(start, end):
+                block[i] = min(max(gauss(1.0, spread), lower), upper)
+        else:
+            mu, sigma = _lognormal_params(spread)
+            lognormal = rng.lognormvariate
+            for i in range(start, end):
+                block[i] = min(max(lognormal(mu, sigma), lower), upper)
+
+
+def _lognormal_params(spread: float) -> tuple[float, float]:
+    """Return ``(mu, sigma)`` of a log-normal with mean 1 and standard deviation ``spread``."""
+    variance = math.log1p(spread * spread)
+    return -variance / 2.0, math.sqrt(variance)
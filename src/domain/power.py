@@ -0,0 +1,99 @@
+"""CPU accounting and power-saving scheduling helpers for the click loop."""
+
+from __future__ import annotations
+
+import ctypes
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import cache
+
+try:  # pragma: no cover - platform dependent
+    import resource
+except ImportError:  # pragma: no cover - platform dependent
+    resource = None  # type: ignore[assignment]
+
+# Low-power mode only relaxes timers for intervals at least this long.
+LOW_POWER_MIN_INTERVAL_MS = 200.0
+MAX_TIMER_SLACK_S = 0.05
+_TIMER_SLACK_RATIO = 0.02
+_PR_SET_TIMERSLACK = 29
+_PR_GET_TIMERSLACK = 30
+
+
+@dataclass(frozen=True)
+class CpuSample:
+    """CPU time of the calling thread and its context switches so far.
+
+    ``context_switches`` (voluntary plus involuntary) comes from
+    ``getrusage`` and is ``None`` where the ``resource`` module is missing.
+    """
+
+    thread_cpu_s: float
+    context_switches: int | None
+
+    @classmethod
+    def take(cls) -> CpuSample:
+        """Sample the current thread."""
+        return cls(thread_cpu_s=time.thread_time(), context_switches=_context_switches())
+
+    def __sub__(self, earlier: CpuSample) -> CpuSample:
+        switches = None
+        if self.context_switches is not None and earlier.context_switches is not None:
+            switches = self.context_switches - earlier.context_switches
+        return CpuSample(thread_cpu_s=self.thread_cpu_s - earlier.thread_cpu_s, context_switches=switches)
+
+
+def _context_switches() -> int | None:
+    if resource is None:
+        return None
+    # Per-thread counters on Linux; the whole process elsewhere.
+    usage = resource.getrusage(getattr(resource, "RUSAGE_THREAD", resource.RUSAGE_SELF))
+    return usage.ru_nvcsw + usage.ru_nivcsw
+
+
+def low_power_slack(interval_s: float) -> float:
+    """Return the timer slack low-power mode allows for ``interval_s`` (0 for short intervals)."""
+    if interval_s * 1000.0 < LOW_POWER_MIN_INTERVAL_MS:
+        return 0.0
+    return min(interval_s * _TIMER_SLACK_RATIO, MAX_TIMER_SLACK_S)
+
+
+@cache
+def _prctl() -> Callable[..., int] | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        prctl = ctypes.CDLL(None, use_errno=True).prctl
+    except (OSError, AttributeError):
+        return None
+    prctl.argtypes = [ctypes.c_int, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong, ctypes.c_ulong]
+    prctl.restype = ctypes.c_int
+    return prctl
+
+
+def timer_slack_supported() -> bool:
+    """Return whether :func:`timer_slack` can take effect on this platform."""
+    return _prctl() is not None
+
+
+@contextmanager
+def timer_slack(seconds: float) -> Iterator[float]:
+    """Let the kernel delay this thread's timer wake-ups by up to ``seconds``.
+
+    Timers with slack can be coalesced with other wake-ups, so the CPU stays
+    in deep idle states longer. Only Linux supports this (``PR_SET_TIMERSLACK``);
+    elsewhere, or for ``seconds <= 0``, nothing changes. Yields the slack that
+    was actually applied.
+    """
+    prctl = _prctl()
+    previous = prctl(_PR_GET_TIMERSLACK, 0, 0, 0, 0) if prctl is not None and seconds > 0 else -1
+    if prctl is None or previous < 0 or prctl(_PR_SET_TIMERSLACK, int(seconds * 1e9), 0, 0, 0) != 0:
+        yield 0.0
+        return
+    try:
+        yield seconds
+    finally:
+        prctl(_PR_SET_TIMERSLACK, previous, 0, 0, 0)
@@ -0,0 +1,411 @@
+"""Reactive clicking: click when a screen region changes instead of on a fixed interval."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from importlib import import_module, util
+from typing import TYPE_CHECKING, Any, Protocol
+
+from .clicker_loop import ClickBackend, wait_until
+
+if TYPE_CHECKING:
+    from ..core.metrics import Counter, Histogram, MetricsRegistry
+
+np: Any = import_module("numpy") if util.find_spec("numpy") is not None else None
+
+REGION_SEPARATOR = ", "
+DEFAULT_MAX_FPS = 60.0
+_LATENCY_BUCKETS = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1)
+
+
+@dataclass(frozen=True)
+class Region:
+    """Screen rectangle in pixels."""
+
+    left: int
+    top: int
+    width: int
+    height: int
+
+    def __post_init__(self) -> None:
+        if self.width <= 0 or self.height <= 0:
+            raise ValueError("region width and height must be positive")
+
+
+def parse_region(text: str) -> Region | None:
+    """Parse ``"x, y, width, height"``; return ``None`` for empty or invalid text."""
+    parts = [part.strip() for part in text.split(",")]
+    if len(parts) != 4:
+        return None
+    try:
+        left, top, width, height = (int(part) for part in parts)
+        return Region(left, top, width, height)
+    except ValueError:
+        return None
+
+
+def format_region(region: Region | None) -> str:
+    """Format a region for storage and display (empty for ``None``)."""
+    if region is None:
+        return ""
+    return REGION_SEPARATOR.join(str(value) for value in (region.left, region.top, region.width, region.height))
+
+
+@dataclass(frozen=True)
+class ScreenTriggerConfig:
+    """Where to watch and how large a change has to be to click.
+
+    Every ``step``-th pixel in both directions is compared with the previous
+    frame; a pixel counts as changed when any of its colour channels moved by
+    more than ``threshold`` (0-255), so a pure hue change counts as well. A
+    click fires once at least ``min_changed`` of the sampled pixels changed.
+    ``max_fps`` caps the capture rate; it must be positive, because an uncapped
+    loop would spin the capture thread at full CPU.
+    """
+
+    region: Region
+    threshold: int = 24
+    min_changed: float = 0.02
+    step: int = 4
+    max_fps: float = DEFAULT_MAX_FPS
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.threshold < 255:
+            raise ValueError("threshold must be within 0-254")
+        if not 0 < self.min_changed <= 1:
+            raise ValueError("min_changed must be within (0, 1]")
+        if self.step <= 0:
+            raise ValueError("step must be positive")
+        if self.max_fps <= 0:
+            raise ValueError("max_fps must be positive")
+
+
+class FrameSource(Protocol):
+    """Supplier of region snapshots as ``height x width x channels`` uint8 arrays."""
+
+    def grab(self) -> Any:
+        """Capture the current frame."""
+        ...
+
+    def close(self) -> None:
+        """Release capture resources."""
+        ...
+
+
+FrameSourceFactory = Callable[[], FrameSource]
+"""Creates a frame source on the thread that will use it (capture handles are thread-bound)."""
+
+
+class ChangeDetector:
+    """Compare downsampled frames against the previous one with preallocated NumPy buffers.
+
+    Only the strided view ``frame[::step, ::step, :3]`` is read, so a 4x step
+    touches 1/16 of the pixels. The view is widened into an ``int16`` buffer,
+    differenced per channel against the previous frame, and reduced to the
+    largest channel change per pixel; difference, reduction, mask and count
+    all write into buffers allocated once, without temporary arrays.
+    """
+
+    def __init__(self, config: ScreenTriggerConfig) -> None:
+        if np is None:
+            raise RuntimeError("画面変化トリガーには numpy をインストールしてください。")
+        self._config = config
+        self._buffers: tuple[Any, Any] | None = None
+        self._diff: Any = None
+        self._peak: Any = None
+        self._mask: Any = None
+        self._index = 0
+        self._has_reference = False
+        self._min_pixels = 0
+
+    def reset(self) -> None:
+        """Forget the previous frame; the next frame becomes the new reference."""
+        self._has_reference = False
+
+    def update(self, frame: Any) -> bool:
+        """Feed the next frame; return whether it differs enough from the previous one."""
+        step = self._config.step
+        sample = frame[::step, ::step, :3]
+        if self._buffers is None or self._diff.shape != sample.shape:
+            self._allocate(sample.shape)
+        assert self._buffers is not None
+        current = self._buffers[self._index]
+        previous = self._buffers[1 - self._index]
+        np.copyto(current, sample)
+        self._index = 1 - self._index
+        if not self._has_reference:
+            self._has_reference = True
+            return False
+        np.subtract(current, previous, out=self._diff)
+        np.abs(self._diff, out=self._diff)
+        np.max(self._diff, axis=2, out=self._peak)
+        np.greater(self._peak, self._config.threshold, out=self._mask)
+        return int(np.count_nonzero(self._mask)) >= self._min_pixels
+
+    def _allocate(self, shape: tuple[int, int, int]) -> None:
+        self._buffers = (np.empty(shape, dtype=np.int16), np.empty(shape, dtype=np.int16))
+        self._diff = np.empty(shape, dtype=np.int16)
+        self._peak = np.empty(shape[:2], dtype=np.int16)
+        self._mask = np.empty(shape[:2], dtype=bool)
+        self._has_reference = False
+        self._min_pixels = max(1, round(self._config.min_changed * shape[0] * shape[1]))
+
+
+class SyntheticFrameSource:
+    """Frame source for tests and benchmarks: a patch that toggles on a schedule.
+
+    The patch (a quarter of the region) switches between dark and lit every
+    ``period_s`` of ``clock`` time, starting at ``start``. :attr:`changed_at`
+    is the clock time of the latest toggle, so the delay to the click that
+    reacted to it can be measured. Frames are BGRA like a real screen capture.
+    """
+
+    def __init__(
+        self,
+        width: int = 128,
+        height: int = 128,
+        period_s: float = 0.1,
+        clock: Callable[[], float] = time.perf_counter,
+        start: float | None = None,
+    ) -> None:
+        if np is None:
+            raise RuntimeError("画面変化トリガーには numpy をインストールしてください。")
+        if period_s <= 0:
+            raise ValueError("period_s must be positive")
+        self._clock = clock
+        self._period_s = period_s
+        self._start = clock() if start is None else start
+        self._dark = np.zeros((height, width, 4), dtype=np.uint8)
+        self._lit = self._dark.copy()
+        self._lit[: height // 2, : width // 2, :3] = 255
+        self.frames = 0
+        self.changed_at: float | None = None
+
+    def grab(self) -> Any:
+        """Return the frame visible at the current clock time."""
+        self.frames += 1
+        toggles = int((self._clock() - self._start) // self._period_s)
+        if toggles > 0:
+            self.changed_at = self._start + toggles * self._period_s
+        return self._lit if toggles % 2 else self._dark
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+@dataclass(frozen=True)
+class TriggerSummary:
+    """Outcome of a single :meth:`ScreenTrigger.run`.
+
+    ``max_latency_s`` is the longest delay from capturing the frame that showed
+    a change to the end of the click it caused. ``start_error_s`` is how far
+    the first capture landed from a scheduled ``start_at`` (``None`` without
+    one).
+    """
+
+    frames: int
+    clicks: int
+    elapsed_s: float
+    max_latency_s: float
+    start_error_s: float | None = None
+
+    @property
+    def fps(self) -> float:
+        """Return the frames captured per second."""
+        return self.frames / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+
+class _TriggerInstruments:
+    """Metrics resolved once per backend so the capture loop only touches attributes."""
+
+    __slots__ = ("clicks", "errors", "frames", "latency")
+
+    def __init__(self, registry: MetricsRegistry, backend: str) -> None:
+        self.clicks: Counter = registry.counter("renda_clicks_total", "Clicks sent to the backend.", backend=backend)
+        self.errors: Counter = registry.counter(
+            "renda_click_errors_total", "Backend click calls that raised.", backend=backend
+        )
+        self.frames: Counter = registry.counter(
+            "renda_screen_trigger_frames_total", "Frames captured by the screen-change trigger."
+        )
+        self.latency: Histogram = registry.histogram(
+            "renda_screen_trigger_latency_seconds",
+            "Delay from capturing a changed frame to the end of the click.",
+            buckets=_LATENCY_BUCKETS,
+            backend=backend,
+        )
+
+
+class ScreenTrigger:
+    """Capture a region repeatedly and click through a :class:`ClickBackend` when it changes.
+
+    ``min_gap_ms`` passed to :meth:`run` is the shortest time between two
+    clicks; a change seen during that gap is kept and clicked as soon as the
+    gap ends. Control methods mirror :class:`ClickLoop` and are safe to call
+    from any thread. The in-flight click start time and thread are published
+    for :class:`~.watchdog.ClickWatchdog`.
+    """
+
+    def __init__(
+        self,
+        backend: ClickBackend,
+        stop_event: threading.Event | None = None,
+        wait: Callable[[float], bool] | None = None,
+        metrics: MetricsRegistry | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._backend = backend
+        self._metrics = metrics
+        self._stop_event = stop_event or threading.Event()
+        self._wait = wait or self._stop_event.wait
+        self._clock = clock
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        self._armed = False
+        self._min_gap_s = 0.0
+        self._click_started: float | None = None
+        self._thread_id: int | None = None
+        self._instruments = _TriggerInstruments(metrics, backend.name) if metrics is not None else None
+
+    def run(
+        self,
+        source: FrameSource,
+        config: ScreenTriggerConfig,
+        min_gap_ms: float = 0.0,
+        max_clicks: int | None = None,
+        start_at: float | None = None,
+    ) -> TriggerSummary:
+        """Watch ``source`` until stopped or ``max_clicks`` clicks were sent.
+
+        The first frame only sets the reference. With ``start_at`` (a ``clock``
+        time) watching begins at that moment, waited for like a scheduled
+        :meth:`ClickLoop.run` (see :func:`wait_until`); a stop during the wait
+        cancels the run.
+        """
+        if min_gap_ms < 0:
+            raise ValueError("min_gap_ms must not be negative")
+        if max_clicks is not None and max_clicks <= 0:
+            raise ValueError("max_clicks must be positive")
+
+        if self._armed:
+            self._armed = False
+        else:
+            self._stop_event.clear()
+        self._resume_event.set()
+        self._min_gap_s = min_gap_ms / 1000.0
+        detector = ChangeDetector(config)
+        instruments = self._instruments
+        click = self._backend.click
+        clock = self._clock
+        stop_event = self._stop_event
+        wait = self._wait
+        self._thread_id = threading.get_ident()
+        self._click_started = None
+
+        if start_at is not None and wait_until(start_at, clock, wait, stop_event):
+            return TriggerSummary(frames=0, clicks=0, elapsed_s=0.0, max_latency_s=0.0)
+        frame_interval = 1.0 / config.max_fps
+        frames = 0
+        clicks = 0
+        max_latency = 0.0
+        changed_at: float | None = None
+        ready_at = started_at = next_frame = clock()
+        start_error = started_at - start_at if start_at is not None else None
+        while not stop_event.is_set():
+            grabbed = clock()
+            if detector.update(source.grab()) and changed_at is None:
+                changed_at = grabbed
+            frames += 1
+            if instruments is not None:
+                instruments.frames.inc()
+            if changed_at is not None:
+                now = clock()
+                if now >= ready_at:
+                    self._click_started = now
+                    try:
+                        click()
+                    except Exception:
+                        if instruments is not None:
+                            instruments.errors.inc()
+                        raise
+                    finally:
+                        self._click_started = None
+                    after = clock()
+                    clicks += 1
+                    latency = after - changed_at
+                    if latency > max_latency:
+                        max_latency = latency
+                    if instruments is not None:
+                        instruments.clicks.inc()
+                        instruments.latency.observe(latency)
+                    changed_at = None
+                    ready_at = after + self._min_gap_s
+                    if clicks == max_clicks:
+                        break
+
+            next_frame += frame_interval
+            remaining = next_frame - clock()
+            if remaining > 0:
+                if wait(remaining):
+                    break
+            else:
+                # Behind schedule: capture again right away instead of catching up in a burst.
+                next_frame = clock()
+                if stop_event.is_set():
+                    break
+            if not self._resume_event.is_set():
+                self._resume_event.wait()
+                detector.reset()
+                changed_at = None
+                next_frame = clock()
+
+        return TriggerSummary(
+            frames=frames,
+            clicks=clicks,
+            elapsed_s=clock() - started_at,
+            max_latency_s=max_latency,
+            start_error_s=start_error,
+        )
+
+    @property
+    def click_started(self) -> float | None:
+        """Return the clock time the in-flight backend call started, or ``None`` between calls."""
+        return self._click_started
+
+    @property
+    def thread_id(self) -> int | None:
+        """Return the identifier of the thread running (or that last ran) the trigger."""
+        return self._thread_id
+
+    def set_backend(self, backend: ClickBackend) -> None:
+        """Send clicks through ``backend`` from the next :meth:`run` on."""
+        self._backend = backend
+        if self._metrics is not None:
+            self._instruments = _TriggerInstruments(self._metrics, backend.name)
+
+    def set_min_gap(self, min_gap_ms: float) -> None:
+        """Change the shortest time between clicks of a running trigger."""
+        if min_gap_ms < 0:
+            raise ValueError("min_gap_ms must not be negative")
+        self._min_gap_s = min_gap_ms / 1000.0
+
+    def arm(self) -> None:
+        """Reset the stop request ahead of :meth:`run` (see :meth:`ClickLoop.arm`)."""
+        self._stop_event.clear()
+        self._armed = True
+
+    def pause(self) -> None:
+        """Stop capturing after the current frame until resumed or stopped."""
+        self._resume_event.clear()
+
+    def resume(self) -> None:
+        """Continue a paused trigger; the first frame after resuming is the new reference."""
+        self._resume_event.set()
+
+    def stop(self) -> None:
+        """Request the trigger to stop."""
+        self._stop_event.set()
+        self._resume_event.set()
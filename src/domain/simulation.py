@@ -0,0 +1,146 @@
+"""Deterministic virtual clock and simulated backends for exercising the click loop."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from array import array
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from .clicker_loop import ClickBackend, ClickLoop
+
+if TYPE_CHECKING:
+    from ..core.metrics import MetricsRegistry
+
+Duration = float | Callable[[], float]
+
+
+def _duration(value: Duration) -> Callable[[], float]:
+    if callable(value):
+        return value
+    constant = float(value)
+    return lambda: constant
+
+
+class VirtualClock:
+    """Time source that only moves when advanced, running due timers in order."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+        self._timers: list[tuple[float, int, Callable[[], None]]] = []
+        self._sequence = itertools.count()
+
+    def __call__(self) -> float:
+        return self._now
+
+    @property
+    def now(self) -> float:
+        """Return the current virtual time in seconds."""
+        return self._now
+
+    def call_at(self, when: float, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once virtual time reaches ``when``."""
+        heapq.heappush(self._timers, (when, next(self._sequence), callback))
+
+    def call_after(self, delay: float, callback: Callable[[], None]) -> None:
+        """Run ``callback`` after ``delay`` seconds of virtual time."""
+        self.call_at(self._now + delay, callback)
+
+    def advance(self, seconds: float, interrupt: Callable[[], bool] | None = None) -> bool:
+        """Move time forward, firing timers on the way.
+
+        If ``interrupt`` becomes true after a timer fires, time stops at that
+        timer and ``True`` is returned.
+        """
+        target = self._now + max(seconds, 0.0)
+        while self._timers and self._timers[0][0] <= target:
+            when, _, callback = heapq.heappop(self._timers)
+            self._now = max(self._now, when)
+            callback()
+            if interrupt is not None and interrupt():
+                return True
+        self._now = target
+        return False
+
+
+class SimulatedWait:
+    """Drop-in for ``threading.Event.wait`` that advances a :class:`VirtualClock`.
+
+    Every wake-up after a full timeout arrives ``lateness`` seconds late, which
+    models scheduler and timer-slack delays of a real OS. A zero timeout is a
+    poll that costs ``poll_cost`` seconds, so busy-wait loops make progress.
+    """
+
+    def __init__(
+        self,
+        clock: VirtualClock,
+        stop_event: threading.Event,
+        lateness: Duration = 0.0,
+        poll_cost: float = 1e-6,
+    ) -> None:
+        self._clock = clock
+        self._stop_event = stop_event
+        self._lateness = _duration(lateness)
+        self._poll_cost = poll_cost
+        self.wakeups = 0
+        self.polls = 0
+
+    def __call__(self, timeout: float) -> bool:
+        stop_event = self._stop_event
+        if timeout <= 0:
+            self.polls += 1
+            return stop_event.is_set() or self._clock.advance(self._poll_cost, stop_event.is_set)
+        self.wakeups += 1
+        if stop_event.is_set() or self._clock.advance(timeout, stop_event.is_set):
+            return True
+        return self._clock.advance(self._lateness(), stop_event.is_set) or stop_event.is_set()
+
+
+class SimulatedBackend:
+    """Click backend that costs virtual time and optionally records click times."""
+
+    def __init__(self, clock: VirtualClock, cost: Duration = 0.0, record: bool = False) -> None:
+        self._clock = clock
+        self._cost = _duration(cost)
+        self.clicks = 0
+        self.times: array[float] | None = array("d") if record else None
+
+    def click(self) -> None:
+        """Record a click at the current virtual time and spend its cost."""
+        self.clicks += 1
+        if self.times is not None:
+            self.times.append(self._clock.now)
+        self._clock.advance(self._cost())
+
+    def as_backend(self) -> ClickBackend:
+        """Wrap this simulator as a :class:`ClickBackend`."""
+        return ClickBackend(click=self.click, name="simulated")
+
+
+class ClickSimulation:
+    """A :class:`ClickLoop` wired to a virtual clock, simulated waits and a simulated backend."""
+
+    def __init__(
+        self,
+        cost: Duration = 0.0,
+        lateness: Duration = 0.0,
+        record: bool = False,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.clock = VirtualClock()
+        self.stop_event = threading.Event()
+        self.wait = SimulatedWait(self.clock, self.stop_event, lateness)
+        self.backend = SimulatedBackend(self.clock, cost, record)
+        self.loop = ClickLoop(
+            self.backend.as_backend(),
+            stop_event=self.stop_event,
+            wait=self.wait,
+            metrics=metrics,
+            clock=self.clock,
+        )
+
+    def stop_at(self, when: float) -> None:
+        """Request the loop to stop at virtual time ``when``."""
+        self.clock.call_at(when, self.loop.stop)
@@ -0,0 +1,128 @@
+"""Watchdog that detects backend click calls which never return."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import traceback
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+DEFAULT_CLICK_DEADLINE_S = 2.0
+_MIN_POLL_INTERVAL_S = 0.01
+
+
+@dataclass(frozen=True)
+class HangReport:
+    """A backend call that exceeded its deadline, with the stuck thread's stack."""
+
+    backend: str
+    elapsed_s: float
+    stack: str
+
+    def message(self) -> str:
+        """Return a user-facing description including the stack dump."""
+        return (
+            f"クリック処理が {self.elapsed_s:.1f} 秒以上応答しません (バックエンド: {self.backend})。"
+            f"クリックを停止します。\n{self.stack}"
+        )
+
+
+class WatchedRunner(Protocol):
+    """A click runner that publishes its in-flight backend call (``ClickLoop``, ``ScreenTrigger``)."""
+
+    @property
+    def click_started(self) -> float | None: ...
+
+    @property
+    def thread_id(self) -> int | None: ...
+
+
+class ClickWatchdog:
+    """Poll a click runner such as :class:`~.clicker_loop.ClickLoop` for a click call running past ``deadline_s``.
+
+    The loop publishes the start time of the in-flight call as a plain
+    attribute, so the click thread does no extra work beyond two stores per
+    click. While armed, the watchdog thread checks it every ``deadline_s / 2``;
+    a hang is therefore reported between one and one and a half deadlines
+    after the call started, once per stuck call. While disarmed the thread
+    blocks without waking up.
+    """
+
+    def __init__(
+        self,
+        loop: WatchedRunner,
+        deadline_s: float,
+        on_hang: Callable[[HangReport], None],
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        if deadline_s <= 0:
+            raise ValueError("deadline_s must be positive")
+        self._loop = loop
+        self._target = loop
+        self._deadline_s = deadline_s
+        self._on_hang = on_hang
+        self._clock = clock
+        self._poll_interval_s = max(deadline_s / 2.0, _MIN_POLL_INTERVAL_S)
+        self._armed = threading.Event()
+        self._disarmed = threading.Event()
+        self._disarmed.set()
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self._backend = ""
+        self._reported: float | None = None
+
+    def arm(self, backend: str, target: WatchedRunner | None = None) -> None:
+        """Watch the loop, or ``target`` instead, while it runs ``backend`` (starts the thread on first use)."""
+        self._backend = backend
+        self._target = target or self._loop
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="renda-click-watchdog", daemon=True)
+            self._thread.start()
+        self._disarmed.clear()
+        self._armed.set()
+
+    def disarm(self) -> None:
+        """Stop watching until the next :meth:`arm`."""
+        self._armed.clear()
+        self._disarmed.set()
+
+    def close(self) -> None:
+        """Stop the watchdog thread."""
+        self._closed = True
+        self._armed.set()
+        self._disarmed.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def check(self) -> HangReport | None:
+        """Report the in-flight click if it has run past the deadline and was not reported yet."""
+        target = self._target
+        started = target.click_started
+        if started is None or started == self._reported:
+            return None
+        elapsed = self._clock() - started
+        if elapsed < self._deadline_s:
+            return None
+        self._reported = started
+        return HangReport(backend=self._backend, elapsed_s=elapsed, stack=_format_thread_stack(target.thread_id))
+
+    def _run(self) -> None:
+        while True:
+            self._armed.wait()
+            if self._closed:
+                return
+            while not self._disarmed.wait(self._poll_interval_s):
+                report = self.check()
+                if report is not None:
+                    self._on_hang(report)
+
+
+def _format_thread_stack(thread_id: int | None) -> str:
+    frame = sys._current_frames().get(thread_id) if thread_id is not None else None
+    if frame is None:
+        return "(stack unavailable)"
+    return "".join(traceback.format_stack(frame))
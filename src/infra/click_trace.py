@@ -0,0 +1,264 @@
+"""Per-click binary trace recording to a memory-mapped file."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, NamedTuple
+
+TRACE_MAGIC = b"RENDATRC"
+TRACE_VERSION = 1
+TRACE_SUFFIX = ".rtrace"
+# magic, version, record size, reserved, wall-clock start, clock start, record count
+_HEADER = struct.Struct("<8sHHIddQ")
+HEADER_SIZE = 64
+RECORD = struct.Struct("<ddd")
+_FIELDS = 3
+_GROWTH_RECORDS = 1 << 16
+
+
+class TraceRecord(NamedTuple):
+    """One click: scheduled and actual clock time, and time spent in the backend."""
+
+    scheduled: float
+    actual: float
+    cost: float
+
+
+class TraceHeader(NamedTuple):
+    """Trace file metadata."""
+
+    started_wall: float
+    started_clock: float
+    records: int
+
+
+class TraceRecorder:
+    """Collect click records in a preallocated ring buffer and spill them to disk.
+
+    :meth:`record` runs on the click thread and only stores three floats into a
+    fixed ``array('d')`` slot; a background thread copies finished records into
+    a memory-mapped file. If the flusher falls a whole ring behind, the oldest
+    unflushed records are dropped and counted rather than blocking the clicker.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        capacity: int = 1 << 14,
+        flush_interval_s: float = 0.05,
+        started_clock: float = 0.0,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a positive power of two")
+        self._path = path
+        self._capacity = capacity
+        self._mask = capacity - 1
+        self._buffer = array("d", bytes(RECORD.size * capacity))
+        self._flush_interval_s = flush_interval_s
+        self._started_clock = started_clock
+        self._logger = logger or logging.getLogger(__name__)
+        self._write_count = 0
+        self._read_count = 0
+        self._dropped = 0
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._file: BinaryIO | None = None
+        self._map: mmap.mmap | None = None
+        self._records_on_disk = 0
+        self._started_wall = 0.0
+
+    @property
+    def path(self) -> Path:
+        """Return the trace file path."""
+        return self._path
+
+    @property
+    def dropped(self) -> int:
+        """Return the number of records lost because the ring overflowed."""
+        return self._dropped
+
+    def __enter__(self) -> TraceRecorder:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Create the trace file and start the background flusher."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self._path.open("w+b")
+        self._remap(HEADER_SIZE + _GROWTH_RECORDS * RECORD.size)
+        self._started_wall = time.time()
+        self._write_header()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_flusher, name="renda-trace-flush", daemon=True)
+        self._thread.start()
+
+    def record(self, scheduled: float, actual: float, cost: float) -> None:
+        """Store one click record (called on the click thread)."""
+        index = self._write_count
+        base = (index & self._mask) * _FIELDS
+        buffer = self._buffer
+        buffer[base] = scheduled
+        buffer[base + 1] = actual
+        buffer[base + 2] = cost
+        self._write_count = index + 1
+
+    def close(self) -> int:
+        """Flush remaining records, trim the file and return the number written."""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        if self._map is not None:
+            self._drain(producer_done=True)
+        written = self._records_on_disk
+        if self._map is not None:
+            self._write_header()
+            self._map.flush()
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.truncate(HEADER_SIZE + written * RECORD.size)
+            self._file.close()
+            self._file = None
+            self._logger.info("Click trace written: %s (%d records, %d dropped)", self._path, written, self._dropped)
+        return written
+
+    def _run_flusher(self) -> None:
+        while not self._stop_event.wait(self._flush_interval_s):
+            self._drain()
+
+    def _drain(self, producer_done: bool = False) -> None:
+        end = self._write_count
+        start = self._read_count
+        if end == start:
+            return
+        if end - start > self._capacity:
+            self._dropped += end - start - self._capacity
+            start = end - self._capacity
+
+        view = memoryview(self._buffer).cast("B")
+        chunks: list[bytes] = []
+        first = start & self._mask
+        last = first + (end - start)
+        if last <= self._capacity:
+            chunks.append(view[first * RECORD.size : last * RECORD.size].tobytes())
+        else:
+            chunks.append(view[first * RECORD.size :].tobytes())
+            chunks.append(view[: (last - self._capacity) * RECORD.size].tobytes())
+        data = b"".join(chunks)
+
+        # Records the producer overwrote while we copied are no longer valid,
+        # including the slot it may be writing now (record() stores before it counts).
+        oldest_valid = self._write_count - self._capacity + (0 if producer_done else 1)
+        if start < oldest_valid:
+            skip = oldest_valid - start
+            self._dropped += skip
+            data = data[skip * RECORD.size :]
+            start = oldest_valid
+
+        self._append(data)
+        self._read_count = end
+
+    def _append(self, data: bytes) -> None:
+        offset = HEADER_SIZE + self._records_on_disk * RECORD.size
+        needed = offset + len(data)
+        assert self._map is not None
+        if needed > len(self._map):
+            self._remap(needed + _GROWTH_RECORDS * RECORD.size)
+            assert self._map is not None
+        self._map[offset:needed] = data
+        self._records_on_disk += len(data) // RECORD.size
+        self._write_header()
+
+    def _remap(self, size: int) -> None:
+        assert self._file is not None
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+        self._file.truncate(size)
+        self._map = mmap.mmap(self._file.fileno(), size)
+
+    def _write_header(self) -> None:
+        assert self._map is not None
+        header = _HEADER.pack(
+            TRACE_MAGIC,
+            TRACE_VERSION,
+            RECORD.size,
+            0,
+            self._started_wall,
+            self._started_clock,
+            self._records_on_disk,
+        )
+        self._map[: len(header)] = header
+
+
+class ClickTracer:
+    """Open a :class:`TraceRecorder` per click run when tracing is enabled."""
+
+    def __init__(self, output_dir: Path, capacity: int = 1 << 14, logger: logging.Logger | None = None) -> None:
+        self._output_dir = output_dir
+        self._capacity = capacity
+        self._logger = logger or logging.getLogger(__name__)
+        self._runs = itertools.count(1)
+
+    @contextmanager
+    def session(self, label: str) -> Iterator[TraceRecorder]:
+        """Record one run into ``<output_dir>/<label>-<timestamp>-<pid>-<run>.rtrace``.
+
+        The process id and run counter keep runs started within the same
+        second from overwriting each other.
+        """
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = self._output_dir / f"{label}-{stamp}-{os.getpid()}-{next(self._runs)}{TRACE_SUFFIX}"
+        recorder = TraceRecorder(path, self._capacity, started_clock=time.perf_counter(), logger=self._logger)
+        with recorder:
+            yield recorder
+
+
+def read_trace_header(stream: BinaryIO) -> TraceHeader:
+    """Read and validate a trace header from the start of ``stream``."""
+    raw = stream.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError("trace file is truncated")
+    magic, version, record_size, _, started_wall, started_clock, records = _HEADER.unpack_from(raw)
+    if magic != TRACE_MAGIC:
+        raise ValueError("not a renda-chan trace file")
+    if version != TRACE_VERSION or record_size != RECORD.size:
+        raise ValueError(f"unsupported trace format (version {version}, record size {record_size})")
+    return TraceHeader(started_wall=started_wall, started_clock=started_clock, records=records)
+
+
+def iter_trace(stream: BinaryIO, records: int, chunk_records: int = 8192) -> Iterator[TraceRecord]:
+    """Stream ``records`` records from ``stream`` (positioned after the header)."""
+    remaining = records
+    while remaining > 0:
+        count = min(remaining, chunk_records)
+        data = stream.read(count * RECORD.size)
+        usable = len(data) - len(data) % RECORD.size
+        if usable == 0:
+            return
+        for fields in RECORD.iter_unpack(data[:usable]):
+            yield TraceRecord(*fields)
+        remaining -= usable // RECORD.size
+        if usable < count * RECORD.size:
+            return
@@ -0,0 +1,246 @@
+"""Hotkey binding parsing and the compiled key-event state machine."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class HotkeyAction(StrEnum):
+    """Actions that can be bound to global hotkeys."""
+
+    TOGGLE = "toggle"
+    PAUSE = "pause"
+    SPEED_UP = "speed_up"
+    SLOW_DOWN = "slow_down"
+    NEXT_PROFILE = "next_profile"
+
+
+MODIFIER_BITS: Mapping[str, int] = {"ctrl": 1, "alt": 2, "shift": 4, "meta": 8}
+# Key codes carrying this flag are modifiers; the low bits hold the modifier bit.
+MODIFIER_FLAG = 1 << 20
+UNKNOWN_KEY = 0
+# Keys we send ourselves (key repeat): dropped without resetting a partly entered sequence.
+IGNORED_KEY = MODIFIER_FLAG - 1
+SEQUENCE_SEPARATOR = ", "
+
+_ESCAPE_TOKENS = {"esc", "escape"}
+_MODIFIER_ALIASES = {
+    "control": "ctrl",
+    "ctl": "ctrl",
+    "command": "meta",
+    "cmd": "meta",
+    "win": "meta",
+    "windows": "meta",
+    "option": "alt",
+}
+# Display names (Qt native text, user input) mapped to canonical key names.
+_KEY_ALIASES = {
+    "return": "enter",
+    "escape": "esc",
+    "pgup": "page_up",
+    "pageup": "page_up",
+    "pgdown": "page_down",
+    "pgdn": "page_down",
+    "pagedown": "page_down",
+    "del": "delete",
+    "ins": "insert",
+    "capslock": "caps_lock",
+    "print": "print_screen",
+    "printscreen": "print_screen",
+}
+
+
+@dataclass(frozen=True)
+class Chord:
+    """A single key press together with the modifiers held for it."""
+
+    modifiers: int
+    key: str
+
+
+def parse_hotkey(hotkey: str) -> tuple[Chord, ...]:
+    """Parse ``"Ctrl+K, S"`` style text into chords, validating each step."""
+    chords: list[Chord] = []
+    for part in hotkey.split(SEQUENCE_SEPARATOR):
+        tokens = _tokenize_hotkey(part)
+        if not tokens:
+            raise ValueError("ホットキーが空です。")
+        if any(token in _ESCAPE_TOKENS for token in tokens):
+            raise ValueError("Esc キーはホットキーに利用できません。")
+        modifiers = 0
+        keys: list[str] = []
+        for token in tokens:
+            normalized = _MODIFIER_ALIASES.get(token, token)
+            bit = MODIFIER_BITS.get(normalized)
+            if bit is not None:
+                modifiers |= bit
+            else:
+                keys.append(_KEY_ALIASES.get(normalized, normalized))
+        if not keys:
+            raise ValueError("修飾キーのみのホットキーは登録できません。")
+        if len(keys) > 1:
+            raise ValueError(f"1 ステップに指定できるキーは 1 つです: {part.strip()}")
+        chords.append(Chord(modifiers=modifiers, key=keys[0]))
+    return tuple(chords)
+
+
+def normalize_key_name(name: str) -> str:
+    """Return the canonical name of a single key or modifier (``"Return"`` -> ``"enter"``)."""
+    token = name.strip().lower()
+    token = _MODIFIER_ALIASES.get(token, token)
+    return _KEY_ALIASES.get(token, token)
+
+
+def _tokenize_hotkey(hotkey: str) -> list[str]:
+    normalized = hotkey.replace("⌘", "Meta").replace("⌥", "Alt").replace("⇧", "Shift").replace("⌃", "Ctrl")
+    return [token.strip().lower() for token in normalized.replace("-", "+").split("+") if token.strip()]
+
+
+@dataclass(frozen=True)
+class CompiledHotkeys:
+    """Bindings compiled into a trie over integer chord identifiers.
+
+    ``transitions[node]`` maps ``key_id << 4 | modifiers`` to the next node and
+    ``actions[node]`` is the action fired when that node is reached.
+    """
+
+    key_ids: Mapping[str, int]
+    transitions: tuple[Mapping[int, int], ...]
+    actions: tuple[HotkeyAction | None, ...]
+    bindings: Mapping[HotkeyAction, tuple[Chord, ...]]
+    hold_actions: frozenset[HotkeyAction] = frozenset()
+
+
+def compile_hotkeys(
+    bindings: Mapping[HotkeyAction, str],
+    hold_actions: Iterable[HotkeyAction] = (),
+) -> CompiledHotkeys:
+    """Compile action bindings into a trie, rejecting duplicates and prefix clashes.
+
+    Actions in ``hold_actions`` also report the release of their key and must be
+    bound to a single chord.
+    """
+    hold = frozenset(hold_actions)
+    key_ids: dict[str, int] = {}
+    transitions: list[dict[int, int]] = [{}]
+    actions: list[HotkeyAction | None] = [None]
+    parsed: dict[HotkeyAction, tuple[Chord, ...]] = {}
+
+    for action, text in bindings.items():
+        text = text.strip()
+        if not text:
+            continue
+        chords = parse_hotkey(text)
+        if action in hold and len(chords) > 1:
+            raise ValueError(f"押している間モードのホットキーにシーケンスは使えません: {text}")
+        parsed[action] = chords
+        node = 0
+        for index, chord in enumerate(chords):
+            key_id = key_ids.setdefault(chord.key, len(key_ids) + 1)
+            chord_id = key_id << 4 | chord.modifiers
+            next_node = transitions[node].get(chord_id)
+            if next_node is None:
+                next_node = len(transitions)
+                transitions[node][chord_id] = next_node
+                transitions.append({})
+                actions.append(None)
+            elif actions[next_node] is not None and index < len(chords) - 1:
+                raise ValueError(f"ホットキーが他のホットキーで始まっています: {text}")
+            elif actions[next_node] is not None:
+                raise ValueError(f"ホットキーが重複しています: {text} ({actions[next_node]} と {action})")
+            node = next_node
+            if index == len(chords) - 1 and transitions[node]:
+                raise ValueError(f"ホットキーが他のシーケンスの先頭と重複しています: {text}")
+        actions[node] = action
+
+    return CompiledHotkeys(
+        key_ids=key_ids,
+        transitions=tuple(transitions),
+        actions=tuple(actions),
+        bindings=parsed,
+        hold_actions=hold,
+    )
+
+
+class HotkeyStateMachine:
+    """Advance through compiled bindings one raw key event at a time.
+
+    Every event costs a constant number of dict/set operations; no strings are
+    parsed and no bindings are scanned. Callers translate raw backend keys into
+    integer codes beforehand using ``CompiledHotkeys.key_ids``. Key-down events
+    repeated by OS auto-repeat are dropped here, before any callback runs.
+    Unknown keys cancel a partly entered sequence; :data:`IGNORED_KEY` events
+    (our own key repeat) leave it alone.
+    """
+
+    def __init__(
+        self,
+        compiled: CompiledHotkeys,
+        sequence_timeout_s: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._transitions = compiled.transitions
+        self._actions = compiled.actions
+        self._hold_actions = compiled.hold_actions
+        self._timeout_s = sequence_timeout_s
+        self._clock = clock
+        self._modifiers = 0
+        self._held: set[int] = set()
+        self._holding: dict[int, HotkeyAction] = {}
+        self._node = 0
+        self._last_step = 0.0
+
+    def press(self, code: int) -> HotkeyAction | None:
+        """Handle a key-down event and return the action it completes, if any."""
+        if code & MODIFIER_FLAG:
+            self._modifiers |= code & 0xF
+            return None
+        if code == IGNORED_KEY:
+            return None
+        if code in self._held:
+            # OS auto-repeat of a key that is already down.
+            return None
+        if code == UNKNOWN_KEY:
+            self._node = 0
+            return None
+        self._held.add(code)
+
+        chord_id = code << 4 | self._modifiers
+        now = self._clock()
+        node = self._node
+        if node and now - self._last_step > self._timeout_s:
+            node = 0
+        next_node = self._transitions[node].get(chord_id)
+        if next_node is None and node:
+            next_node = self._transitions[0].get(chord_id)
+        if next_node is None:
+            self._node = 0
+            return None
+
+        action = self._actions[next_node]
+        if action is not None:
+            self._node = 0
+            if action in self._hold_actions:
+                self._holding[code] = action
+            return action
+        self._node = next_node
+        self._last_step = now
+        return None
+
+    def release(self, code: int) -> HotkeyAction | None:
+        """Handle a key-up event and return the hold action it ends, if any."""
+        if code & MODIFIER_FLAG:
+            self._modifiers &= ~(code & 0xF)
+            return None
+        self._held.discard(code)
+        return self._holding.pop(code, None)
+
+    def reset(self) -> None:
+        """Forget held keys and any partially entered sequence."""
+        self._modifiers = 0
+        self._held.clear()
+        self._holding.clear()
+        self._node = 0
@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from .hotkey_bindings import (
+    IGNORED_KEY,
+    MODIFIER_BITS,
+    MODIFIER_FLAG,
+    UNKNOWN_KEY,
+    CompiledHotkeys,
+    HotkeyAction,
+    HotkeyStateMachine,
+    compile_hotkeys,
+)
 
 try:  # pragma: no cover - optional dependency
     from pynput import keyboard as pynput_keyboard
@@ -18,58 +29,115 @@ except ImportError:  # pragma: no cover - optional dependency
 if TYPE_CHECKING:
     from pynput.keyboard import Listener
 
+    from ..core.metrics import Counter, MetricsRegistry
 
-_ESCAPE_TOKENS = {"esc", "escape"}
-_MODIFIER_ALIASES = {
-    "control": "ctrl",
-    "ctl": "ctrl",
-    "command": "meta",
+
+_PYNPUT_MODIFIERS = {
+    "ctrl": "ctrl",
+    "ctrl_l": "ctrl",
+    "ctrl_r": "ctrl",
+    "shift": "shift",
+    "shift_l": "shift",
+    "shift_r": "shift",
+    "alt": "alt",
+    "alt_l": "alt",
+    "alt_r": "alt",
+    "alt_gr": "alt",
     "cmd": "meta",
-    "win": "meta",
+    "cmd_l": "meta",
+    "cmd_r": "meta",
+}
+_KEYBOARD_MODIFIERS = {
+    "ctrl": "ctrl",
+    "left ctrl": "ctrl",
+    "right ctrl": "ctrl",
+    "shift": "shift",
+    "left shift": "shift",
+    "right shift": "shift",
+    "alt": "alt",
+    "left alt": "alt",
+    "right alt": "alt",
+    "alt gr": "alt",
     "windows": "meta",
-    "option": "alt",
+    "left windows": "meta",
+    "right windows": "meta",
+    "command": "meta",
+    "left command": "meta",
+    "right command": "meta",
 }
 
 
 class HotkeyService:
-    """Register and manage a global start/stop hotkey."""
-
-    def __init__(self, on_trigger: Callable[[], None]) -> None:
+    """Register global hotkeys for several actions on a single raw key listener.
+
+    Bindings are compiled up front into a :class:`HotkeyStateMachine`, and each
+    backend's raw keys are translated through lookup tables built at the same
+    time, so the listener thread only performs dict/set lookups per key event.
+    """
+
+    def __init__(
+        self,
+        on_action: Callable[[HotkeyAction], None],
+        metrics: MetricsRegistry | None = None,
+        sequence_timeout_s: float = 1.0,
+        on_release: Callable[[HotkeyAction], None] | None = None,
+    ) -> None:
         if pynput_keyboard is None and keyboard_module is None:
             raise RuntimeError("pynput または keyboard のいずれかをインストールしてください。")
-        self._on_trigger = on_trigger
+        self._on_action = on_action
+        self._on_release = on_release
+        self._sequence_timeout_s = sequence_timeout_s
         self._backend = "pynput" if pynput_keyboard is not None else "keyboard"
         self._listener: Listener | None = None
-        self._keyboard_handle: int | None = None
+        self._keyboard_handle: Callable[[Any], None] | None = None
+        self._machine: HotkeyStateMachine | None = None
+        self._key_table: dict[Any, int] = {}
+        self._char_table: dict[str, int] = {}
+        self._vk_table: dict[int, int] = {}
+        self._triggers: dict[HotkeyAction, Counter] = {}
+        if metrics is not None:
+            self._triggers = {
+                action: metrics.counter("renda_hotkey_triggers_total", "Global hotkey activations.", action=action)
+                for action in HotkeyAction
+            }
 
     @property
     def backend_name(self) -> str:
         """Return the backend in use."""
         return self._backend
 
-    def register(self, hotkey: str) -> None:
-        """Register a global hotkey, replacing any existing registration."""
+    def register(
+        self,
+        bindings: Mapping[HotkeyAction, str],
+        hold_actions: Iterable[HotkeyAction] = (),
+        ignored_keys: Iterable[str] = (),
+    ) -> None:
+        """Register hotkeys for all actions, replacing any existing registration.
+
+        Actions in ``hold_actions`` additionally report key release via ``on_release``.
+        ``ignored_keys`` (canonical key names, e.g. the key-repeat set) are
+        dropped without cancelling a partly entered hotkey sequence; ignored
+        modifiers (e.g. a repeated ``shift``) also leave the held modifiers
+        unchanged, so pass only keys no binding uses. Invalid or
+        conflicting bindings raise ``ValueError`` and keep the current
+        registration active.
+        """
+        compiled = compile_hotkeys(bindings, hold_actions)
         self.unregister()
-
-        hotkey = hotkey.strip()
-        if not hotkey:
+        if not compiled.bindings:
             return
 
-        tokens = _tokenize_hotkey(hotkey)
-        if not tokens:
-            raise ValueError("ホットキーが空です。")
-        if any(token in _ESCAPE_TOKENS for token in tokens):
-            raise ValueError("Esc キーはホットキーに利用できません。")
-        if not _has_non_modifier(tokens):
-            raise ValueError("修飾キーのみのホットキーは登録できません。")
-
-        formatted = _format_hotkey(tokens, self._backend)
+        self._machine = HotkeyStateMachine(compiled, self._sequence_timeout_s)
         if self._backend == "pynput":
-            listener = pynput_keyboard.GlobalHotKeys({formatted: self._on_trigger})
+            self._key_table, self._char_table, self._vk_table = _pynput_tables(compiled, ignored_keys)
+            listener = pynput_keyboard.Listener(
+                on_press=self._handle_pynput_press, on_release=self._handle_pynput_release
+            )
             listener.start()
             self._listener = listener
         else:
-            self._keyboard_handle = keyboard_module.add_hotkey(formatted, self._on_trigger)
+            self._key_table = _keyboard_table(compiled, ignored_keys)
+            self._keyboard_handle = keyboard_module.hook(self._handle_keyboard_event)
 
     def unregister(self) -> None:
         """Remove any existing hotkey registration."""
@@ -80,43 +148,104 @@ class HotkeyService:
                 self._listener = None
         else:
             if self._keyboard_handle is not None:
-                keyboard_module.remove_hotkey(self._keyboard_handle)
+                keyboard_module.unhook(self._keyboard_handle)
                 self._keyboard_handle = None
-
-
-def _tokenize_hotkey(hotkey: str) -> list[str]:
-    normalized = hotkey.replace("⌘", "Meta").replace("⌥", "Alt").replace("⇧", "Shift").replace("⌃", "Ctrl")
-    return [token.strip().lower() for token in normalized.replace("-", "+").split("+") if token.strip()]
-
-
-def _has_non_modifier(tokens: list[str]) -> bool:
-    return any(token not in {"ctrl", "alt", "shift", "meta"} for token in tokens)
-
-
-def _format_hotkey(tokens: list[str], backend: str) -> str:
-    modifiers: list[str] = []
-    keys: list[str] = []
-    for token in tokens:
-        normalized = _MODIFIER_ALIASES.get(token, token)
-        if normalized in {"ctrl", "alt", "shift", "meta"}:
-            modifiers.append(normalized)
-        else:
-            keys.append(normalized)
-
-    if backend == "keyboard":
-        modifier_map = {
-            "ctrl": "ctrl",
-            "alt": "alt",
-            "shift": "shift",
-            "meta": "windows",
-        }
-    else:
-        modifier_map = {
-            "ctrl": "<ctrl>",
-            "alt": "<alt>",
-            "shift": "<shift>",
-            "meta": "<cmd>",
-        }
-
-    parts = [modifier_map[mod] for mod in modifiers] + keys
-    return "+".join(parts)
+        self._machine = None
+
+    def _dispatch(self, action: HotkeyAction) -> None:
+        counter = self._triggers.get(action)
+        if counter is not None:
+            counter.inc()
+        self._on_action(action)
+
+    def _dispatch_release(self, action: HotkeyAction | None) -> None:
+        if action is not None and self._on_release is not None:
+            self._on_release(action)
+
+    def _pynput_code(self, key: Any) -> int:
+        char = getattr(key, "char", None)
+        if char is not None:
+            code = self._char_table.get(char)
+            if code is not None:
+                return code
+        vk = getattr(key, "vk", None)
+        if vk is not None:
+            code = self._vk_table.get(vk)
+            if code is not None:
+                return code
+        return self._key_table.get(key, UNKNOWN_KEY)
+
+    def _handle_pynput_press(self, key: Any) -> None:
+        machine = self._machine
+        if machine is None:
+            return
+        action = machine.press(self._pynput_code(key))
+        if action is not None:
+            self._dispatch(action)
+
+    def _handle_pynput_release(self, key: Any) -> None:
+        machine = self._machine
+        if machine is not None:
+            self._dispatch_release(machine.release(self._pynput_code(key)))
+
+    def _handle_keyboard_event(self, event: Any) -> None:
+        machine = self._machine
+        if machine is None:
+            return
+        code = self._key_table.get(event.name, UNKNOWN_KEY)
+        if event.event_type == "up":
+            self._dispatch_release(machine.release(code))
+            return
+        action = machine.press(code)
+        if action is not None:
+            self._dispatch(action)
+
+
+def _key_codes(compiled: CompiledHotkeys, ignored_keys: Iterable[str]) -> dict[str, int]:
+    """Map bound keys to their ids and ignored keys to :data:`IGNORED_KEY` (bindings win)."""
+    codes = dict.fromkeys(ignored_keys, IGNORED_KEY)
+    codes.update(compiled.key_ids)
+    return codes
+
+
+def _pynput_tables(
+    compiled: CompiledHotkeys, ignored_keys: Iterable[str] = ()
+) -> tuple[dict[Any, int], dict[str, int], dict[int, int]]:
+    ignored = frozenset(ignored_keys)
+    key_codes = _key_codes(compiled, ignored)
+    special: dict[Any, int] = {}
+    for member in pynput_keyboard.Key:
+        modifier = _PYNPUT_MODIFIERS.get(member.name)
+        if modifier is not None:
+            special[member] = IGNORED_KEY if modifier in ignored else MODIFIER_FLAG | MODIFIER_BITS[modifier]
+        elif member.name in key_codes:
+            special[member] = key_codes[member.name]
+
+    chars: dict[str, int] = {}
+    vks: dict[int, int] = {}
+    for name, key_id in key_codes.items():
+        if len(name) != 1:
+            continue
+        chars[name] = key_id
+        chars[name.upper()] = key_id
+        if "a" <= name <= "z":
+            # Ctrl+letter arrives as the corresponding control character.
+            chars[chr(ord(name) - ord("a") + 1)] = key_id
+        if name.isascii() and name.isalnum():
+            # Windows virtual-key codes for letters and digits.
+            vks[ord(name.upper())] = key_id
+    return special, chars, vks
+
+
+def _keyboard_table(compiled: CompiledHotkeys, ignored_keys: Iterable[str] = ()) -> dict[Any, int]:
+    ignored = frozenset(ignored_keys)
+    table: dict[Any, int] = {
+        name: IGNORED_KEY if mod in ignored else MODIFIER_FLAG | MODIFIER_BITS[mod]
+        for name, mod in _KEYBOARD_MODIFIERS.items()
+    }
+    for name, key_id in _key_codes(compiled, ignored).items():
+        table[name] = key_id
+        table[name.replace("_", " ")] = key_id
+        if len(name) == 1:
+            table[name.upper()] = key_id
+    return table
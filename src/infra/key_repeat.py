@@ -0,0 +1,268 @@
+"""Keyboard backends that repeat a key (or key set) in place of mouse clicks."""
+
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from ..domain.clicker_loop import ClickBackend
+from .hotkey_bindings import MODIFIER_BITS, HotkeyAction, normalize_key_name, parse_hotkey
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - platform dependent
+    fcntl = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency
+    from pynput import keyboard as pynput_keyboard
+except ImportError:  # pragma: no cover - optional dependency
+    pynput_keyboard = None
+
+try:  # pragma: no cover - optional dependency
+    import keyboard as keyboard_module
+except ImportError:  # pragma: no cover - optional dependency
+    keyboard_module = None
+
+KEY_BACKENDS = ("pynput", "keyboard", "uinput")
+REPEAT_KEY_SEPARATOR = ", "
+
+_PYNPUT_NAMES = {"meta": "cmd"}
+_KEYBOARD_NAMES = {"meta": "windows", "+": "plus", ",": "comma"}
+
+# Linux input-event-codes.h
+_EV_SYN = 0x00
+_EV_KEY = 0x01
+_SYN_REPORT = 0
+_BUS_USB = 0x03
+_UI_DEV_CREATE = 0x5501
+_UI_DEV_DESTROY = 0x5502
+_UI_DEV_SETUP = 0x405C5503
+_UI_SET_EVBIT = 0x40045564
+_UI_SET_KEYBIT = 0x40045565
+_INPUT_EVENT = struct.Struct("@llHHi")
+_UINPUT_SETUP = struct.Struct("@HHHH80sI")
+_UINPUT_PATH = "/dev/uinput"
+
+
+def _linux_key_codes() -> dict[str, int]:
+    codes = {
+        "esc": 1,
+        "-": 12,
+        "=": 13,
+        "backspace": 14,
+        "tab": 15,
+        "[": 26,
+        "]": 27,
+        "enter": 28,
+        "ctrl": 29,
+        ";": 39,
+        "'": 40,
+        "`": 41,
+        "shift": 42,
+        "\\": 43,
+        ",": 51,
+        ".": 52,
+        "/": 53,
+        "alt": 56,
+        "space": 57,
+        "caps_lock": 58,
+        "print_screen": 99,
+        "home": 102,
+        "up": 103,
+        "page_up": 104,
+        "left": 105,
+        "right": 106,
+        "end": 107,
+        "down": 108,
+        "page_down": 109,
+        "insert": 110,
+        "delete": 111,
+        "meta": 125,
+        "f11": 87,
+        "f12": 88,
+    }
+    for offset, digit in enumerate("1234567890"):
+        codes[digit] = 2 + offset
+    for row, first in (("qwertyuiop", 16), ("asdfghjkl", 30), ("zxcvbnm", 44)):
+        for offset, letter in enumerate(row):
+            codes[letter] = first + offset
+    for number in range(1, 11):
+        codes[f"f{number}"] = 58 + number
+    for number in range(13, 25):
+        codes[f"f{number}"] = 170 + number
+    return codes
+
+
+LINUX_KEY_CODES = _linux_key_codes()
+
+
+@dataclass(frozen=True)
+class KeyRepeatConfig:
+    """Keys pressed together on every tick and the backend sending them.
+
+    An empty ``backend`` picks the first available one in :data:`KEY_BACKENDS`.
+    """
+
+    keys: tuple[str, ...]
+    backend: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.keys:
+            raise ValueError("連打するキーを指定してください。")
+        if self.backend and self.backend not in KEY_BACKENDS:
+            raise ValueError(f"unknown key backend: {self.backend}")
+
+
+def parse_repeat_keys(text: str) -> tuple[str, ...]:
+    """Parse ``"z, x"`` style text into canonical key names without duplicates."""
+    keys: list[str] = []
+    for part in text.split(","):
+        if not part.strip():
+            continue
+        key = normalize_key_name(part)
+        if key not in keys:
+            keys.append(key)
+    return tuple(keys)
+
+
+def format_repeat_keys(keys: Iterable[str]) -> str:
+    """Format key names for storage and display."""
+    return REPEAT_KEY_SEPARATOR.join(keys)
+
+
+def exclude_hotkey_keys(keys: Iterable[str], bindings: Mapping[HotkeyAction, str]) -> tuple[str, ...]:
+    """Drop keys (and modifiers) used by any hotkey so repeated input cannot trigger it."""
+    reserved: set[str] = set()
+    for text in bindings.values():
+        if not text.strip():
+            continue
+        try:
+            chords = parse_hotkey(text)
+        except ValueError:
+            continue
+        for chord in chords:
+            reserved.add(chord.key)
+            reserved.update(name for name, bit in MODIFIER_BITS.items() if chord.modifiers & bit)
+    return tuple(key for key in keys if key not in reserved)
+
+
+def resolve_key_backend(config: KeyRepeatConfig) -> ClickBackend:
+    """Build a backend that taps ``config.keys`` once per call."""
+    if config.backend == "pynput" or (not config.backend and pynput_keyboard is not None):
+        return _pynput_backend(config.keys)
+    if config.backend == "keyboard" or (not config.backend and keyboard_module is not None):
+        return _keyboard_backend(config.keys)
+    if config.backend == "uinput" or (not config.backend and sys.platform.startswith("linux")):
+        return _uinput_backend(config.keys)
+    raise RuntimeError("pynput、keyboard、uinput のいずれも利用できません。")
+
+
+def _pynput_backend(keys: tuple[str, ...]) -> ClickBackend:
+    if pynput_keyboard is None:
+        raise RuntimeError("pynput がインストールされていません。")
+    resolved: list[Any] = []
+    for key in keys:
+        if len(key) == 1:
+            resolved.append(key)
+            continue
+        member = getattr(pynput_keyboard.Key, _PYNPUT_NAMES.get(key, key), None)
+        if member is None:
+            raise ValueError(f"pynput で送信できないキーです: {key}")
+        resolved.append(member)
+    controller = pynput_keyboard.Controller()
+    press = controller.press
+    release = controller.release
+    released = tuple(reversed(resolved))
+
+    def tap() -> None:
+        for key in resolved:
+            press(key)
+        for key in released:
+            release(key)
+
+    return ClickBackend(click=tap, name="pynput-keyboard")
+
+
+def _keyboard_backend(keys: tuple[str, ...]) -> ClickBackend:
+    if keyboard_module is None:
+        raise RuntimeError("keyboard モジュールがインストールされていません。")
+    names = [_KEYBOARD_NAMES.get(key, key.replace("_", " ")) for key in keys]
+    # Resolve scan codes once. send() would re-parse the parsed hotkey and
+    # collapse a multi-key step into its first key, so press each key itself.
+    codes = [key_codes[0] for step in keyboard_module.parse_hotkey(names) for key_codes in step]
+    press = keyboard_module.press
+    release = keyboard_module.release
+
+    def tap() -> None:
+        for code in codes:
+            press(code)
+        for code in reversed(codes):
+            release(code)
+
+    return ClickBackend(click=tap, name="keyboard")
+
+
+def _uinput_backend(keys: tuple[str, ...]) -> ClickBackend:
+    device = UinputKeyboard(keys)
+    return ClickBackend(click=device.tap, name="uinput", close=device.close)
+
+
+def encode_key_batch(codes: Iterable[int]) -> bytes:
+    """Encode press-all then release-all events for ``codes`` as one uinput write."""
+    codes = tuple(codes)
+    events = [_INPUT_EVENT.pack(0, 0, _EV_KEY, code, 1) for code in codes]
+    events.append(_INPUT_EVENT.pack(0, 0, _EV_SYN, _SYN_REPORT, 0))
+    events.extend(_INPUT_EVENT.pack(0, 0, _EV_KEY, code, 0) for code in reversed(codes))
+    events.append(_INPUT_EVENT.pack(0, 0, _EV_SYN, _SYN_REPORT, 0))
+    return b"".join(events)
+
+
+class UinputKeyboard:
+    """Virtual Linux keyboard that sends a whole key tap in a single ``write``.
+
+    Requires write access to ``/dev/uinput`` (usually membership of the
+    ``input`` group or a udev rule).
+    """
+
+    def __init__(self, keys: Iterable[str], path: str = _UINPUT_PATH) -> None:
+        codes: list[int] = []
+        for key in keys:
+            code = LINUX_KEY_CODES.get(key)
+            if code is None:
+                raise ValueError(f"uinput で送信できないキーです: {key}")
+            codes.append(code)
+        self._payload = encode_key_batch(codes)
+        if fcntl is None:
+            raise RuntimeError("uinput は Linux でのみ利用できます。")
+        try:
+            self._fd = os.open(path, os.O_WRONLY | os.O_NONBLOCK)
+        except OSError as exc:
+            raise RuntimeError(f"{path} を開けません: {exc.strerror}") from exc
+        try:
+            fcntl.ioctl(self._fd, _UI_SET_EVBIT, _EV_KEY)
+            for code in codes:
+                fcntl.ioctl(self._fd, _UI_SET_KEYBIT, code)
+            setup = _UINPUT_SETUP.pack(_BUS_USB, 0x1209, 0x5244, 1, b"renda-chan keyboard", 0)
+            fcntl.ioctl(self._fd, _UI_DEV_SETUP, setup)
+            fcntl.ioctl(self._fd, _UI_DEV_CREATE)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def tap(self) -> None:
+        """Press and release all keys."""
+        os.write(self._fd, self._payload)
+
+    def close(self) -> None:
+        """Destroy the virtual device."""
+        if self._fd < 0:
+            return
+        try:
+            fcntl.ioctl(self._fd, _UI_DEV_DESTROY)
+        finally:
+            os.close(self._fd)
+            self._fd = -1
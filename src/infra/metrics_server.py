@@ -0,0 +1,97 @@
+"""Optional localhost HTTP endpoint exposing metrics and debug dumps."""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from ..core.metrics import MetricsRegistry
+from ..core.profiling import StackSampler, dump_stacks
+
+_TEXT_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+_MAX_SAMPLE_SECONDS = 30.0
+
+
+class MetricsServer:
+    """Serve ``/metrics``, ``/debug/stacks`` and ``/debug/profile`` on localhost."""
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        port: int,
+        host: str = "127.0.0.1",
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self._registry = registry
+        self._logger = logger or logging.getLogger(__name__)
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        """Return the bound port (useful when constructed with port 0)."""
+        return int(self._server.server_address[1])
+
+    def start(self) -> None:
+        """Serve requests on a daemon thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, name="renda-metrics", daemon=True)
+        self._thread.start()
+        self._logger.info("Metrics endpoint listening on 127.0.0.1:%d", self.port)
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        registry = self._registry
+        logger = self._logger
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                url = urlsplit(self.path)
+                if url.path == "/metrics":
+                    self._reply(200, registry.render())
+                elif url.path == "/debug/stacks":
+                    self._reply(200, dump_stacks())
+                elif url.path == "/debug/profile":
+                    try:
+                        seconds = _sample_seconds(url.query)
+                    except ValueError as exc:
+                        self._reply(400, f"{exc}\n")
+                        return
+                    self._reply(200, StackSampler().sample_for(seconds))
+                else:
+                    self._reply(404, "not found\n")
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug("metrics endpoint: " + format, *args)
+
+            def _reply(self, status: int, body: str) -> None:
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", _TEXT_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+def _sample_seconds(query: str) -> float:
+    """Return the clamped ``seconds`` query value; raise ``ValueError`` unless it is a finite number."""
+    values = parse_qs(query).get("seconds", ["1"])
+    try:
+        seconds = float(values[0])
+    except ValueError:
+        seconds = math.nan
+    if not math.isfinite(seconds):
+        raise ValueError("seconds must be a finite number")
+    return min(max(seconds, 0.0), _MAX_SAMPLE_SECONDS)
@@ -0,0 +1,54 @@
+"""Screen capture frame sources for the screen-change trigger."""
+
+from __future__ import annotations
+
+from importlib import import_module, util
+from typing import Any
+
+from ..domain.screen_trigger import FrameSource, Region, np
+
+
+class MssFrameSource:
+    """Capture a region with ``mss`` (BGRA frames, no copy beyond the grab itself).
+
+    ``mss`` handles are bound to the creating thread, so build the source on
+    the thread that grabs from it.
+    """
+
+    def __init__(self, region: Region) -> None:
+        self._screen = import_module("mss").mss()
+        self._monitor = {"left": region.left, "top": region.top, "width": region.width, "height": region.height}
+
+    def grab(self) -> Any:
+        """Capture the region as a ``height x width x 4`` uint8 array."""
+        return np.asarray(self._screen.grab(self._monitor))
+
+    def close(self) -> None:
+        """Release the capture handle."""
+        self._screen.close()
+
+
+class ImageGrabFrameSource:
+    """Capture a region with Pillow's ``ImageGrab`` (slower fallback, RGB frames)."""
+
+    def __init__(self, region: Region) -> None:
+        self._grab = import_module("PIL.ImageGrab").grab
+        self._bbox = (region.left, region.top, region.left + region.width, region.top + region.height)
+
+    def grab(self) -> Any:
+        """Capture the region as a ``height x width x 3`` uint8 array."""
+        return np.asarray(self._grab(bbox=self._bbox))
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def resolve_frame_source(region: Region) -> FrameSource:
+    """Select an available capture backend for ``region`` (mss preferred, fallback to Pillow)."""
+    if np is None:
+        raise RuntimeError("画面変化トリガーには numpy をインストールしてください。")
+    if util.find_spec("mss") is not None:
+        return MssFrameSource(region)
+    if util.find_spec("PIL") is not None:
+        return ImageGrabFrameSource(region)
+    raise RuntimeError("画面キャプチャには mss または Pillow のいずれかをインストールしてください。")
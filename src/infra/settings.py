@@ -3,9 +3,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from PyQt6.QtCore import QSettings
 
+from ..domain.jitter import JITTER_DISTRIBUTIONS, JitterConfig
+from ..domain.screen_trigger import Region, ScreenTriggerConfig, format_region, parse_region
+from .hotkey_bindings import HotkeyAction
+from .key_repeat import KEY_BACKENDS, KeyRepeatConfig, format_repeat_keys, parse_repeat_keys
+
+if TYPE_CHECKING:
+    from ..core.metrics import MetricsRegistry
+
+TRIGGER_TOGGLE = "toggle"
+TRIGGER_HOLD = "hold"
+TRIGGER_MODES = (TRIGGER_TOGGLE, TRIGGER_HOLD)
+MAX_JITTER_PERCENT = 50
+INPUT_MOUSE = "mouse"
+INPUT_KEYBOARD = "keyboard"
+INPUT_DEVICES = (INPUT_MOUSE, INPUT_KEYBOARD)
+
 
 @dataclass(frozen=True)
 class AppSettings:
@@ -13,6 +30,47 @@ class AppSettings:
 
     interval_ms: int = 100
     start_stop_hotkey: str = ""
+    pause_hotkey: str = ""
+    speed_up_hotkey: str = ""
+    slow_down_hotkey: str = ""
+    profile_hotkey: str = ""
+    interval_profiles: tuple[int, ...] = (100, 50, 10)
+    trigger_mode: str = TRIGGER_TOGGLE
+    jitter_distribution: str = ""
+    jitter_percent: int = 10
+    input_device: str = INPUT_MOUSE
+    repeat_keys: tuple[str, ...] = ()
+    key_backend: str = ""
+    low_power: bool = False
+    screen_region: Region | None = None
+
+    def hotkey_bindings(self) -> dict[HotkeyAction, str]:
+        """Return the configured hotkey text for each action."""
+        return {
+            HotkeyAction.TOGGLE: self.start_stop_hotkey,
+            HotkeyAction.PAUSE: self.pause_hotkey,
+            HotkeyAction.SPEED_UP: self.speed_up_hotkey,
+            HotkeyAction.SLOW_DOWN: self.slow_down_hotkey,
+            HotkeyAction.NEXT_PROFILE: self.profile_hotkey,
+        }
+
+    def jitter_config(self) -> JitterConfig | None:
+        """Return the interval randomization, or ``None`` for a fixed interval."""
+        if not self.jitter_distribution or self.jitter_percent <= 0:
+            return None
+        return JitterConfig(distribution=self.jitter_distribution, spread=self.jitter_percent / 100.0)
+
+    def key_repeat_config(self) -> KeyRepeatConfig | None:
+        """Return the keys to repeat, or ``None`` when clicking the mouse."""
+        if self.input_device != INPUT_KEYBOARD or not self.repeat_keys:
+            return None
+        return KeyRepeatConfig(keys=self.repeat_keys, backend=self.key_backend)
+
+    def screen_trigger_config(self) -> ScreenTriggerConfig | None:
+        """Return the screen-change trigger, or ``None`` for interval clicking."""
+        if self.screen_region is None:
+            return None
+        return ScreenTriggerConfig(region=self.screen_region)
 
 
 class SettingsRepository:
@@ -20,21 +78,100 @@ class SettingsRepository:
 
     _INTERVAL_KEY = "interval_ms"
     _HOTKEY_KEY = "start_stop_hotkey"
+    _PAUSE_HOTKEY_KEY = "pause_hotkey"
+    _SPEED_UP_HOTKEY_KEY = "speed_up_hotkey"
+    _SLOW_DOWN_HOTKEY_KEY = "slow_down_hotkey"
+    _PROFILE_HOTKEY_KEY = "profile_hotkey"
+    _PROFILES_KEY = "interval_profiles"
+    _TRIGGER_MODE_KEY = "trigger_mode"
+    _JITTER_DISTRIBUTION_KEY = "jitter_distribution"
+    _JITTER_PERCENT_KEY = "jitter_percent"
+    _INPUT_DEVICE_KEY = "input_device"
+    _REPEAT_KEYS_KEY = "repeat_keys"
+    _KEY_BACKEND_KEY = "key_backend"
+    _LOW_POWER_KEY = "low_power"
+    _SCREEN_REGION_KEY = "screen_region"
 
-    def __init__(self) -> None:
+    def __init__(self, metrics: MetricsRegistry | None = None) -> None:
         self._settings = QSettings("renda-chan", "renda-chan")
+        self._writes = (
+            metrics.counter("renda_settings_writes_total", "Settings save operations.") if metrics is not None else None
+        )
 
     def load(self) -> AppSettings:
         """Load settings from persistent storage."""
         interval_ms = self._settings.value(self._INTERVAL_KEY, AppSettings.interval_ms, type=int)
-        hotkey = self._settings.value(self._HOTKEY_KEY, "", type=str)
         if not isinstance(interval_ms, int) or interval_ms <= 0:
             interval_ms = AppSettings.interval_ms
-        if not isinstance(hotkey, str):
-            hotkey = ""
-        return AppSettings(interval_ms=interval_ms, start_stop_hotkey=hotkey)
+        profiles = parse_interval_profiles(self._settings.value(self._PROFILES_KEY, "", type=str))
+        trigger_mode = self._load_str(self._TRIGGER_MODE_KEY)
+        if trigger_mode not in TRIGGER_MODES:
+            trigger_mode = AppSettings.trigger_mode
+        jitter_distribution = self._load_str(self._JITTER_DISTRIBUTION_KEY)
+        if jitter_distribution not in JITTER_DISTRIBUTIONS:
+            jitter_distribution = AppSettings.jitter_distribution
+        jitter_percent = self._settings.value(self._JITTER_PERCENT_KEY, AppSettings.jitter_percent, type=int)
+        if not isinstance(jitter_percent, int) or not 0 <= jitter_percent <= MAX_JITTER_PERCENT:
+            jitter_percent = AppSettings.jitter_percent
+        input_device = self._load_str(self._INPUT_DEVICE_KEY)
+        if input_device not in INPUT_DEVICES:
+            input_device = AppSettings.input_device
+        key_backend = self._load_str(self._KEY_BACKEND_KEY)
+        if key_backend not in KEY_BACKENDS:
+            key_backend = AppSettings.key_backend
+        return AppSettings(
+            interval_ms=interval_ms,
+            start_stop_hotkey=self._load_str(self._HOTKEY_KEY),
+            pause_hotkey=self._load_str(self._PAUSE_HOTKEY_KEY),
+            speed_up_hotkey=self._load_str(self._SPEED_UP_HOTKEY_KEY),
+            slow_down_hotkey=self._load_str(self._SLOW_DOWN_HOTKEY_KEY),
+            profile_hotkey=self._load_str(self._PROFILE_HOTKEY_KEY),
+            interval_profiles=profiles or AppSettings.interval_profiles,
+            trigger_mode=trigger_mode,
+            jitter_distribution=jitter_distribution,
+            jitter_percent=jitter_percent,
+            input_device=input_device,
+            repeat_keys=parse_repeat_keys(self._load_str(self._REPEAT_KEYS_KEY)),
+            key_backend=key_backend,
+            low_power=self._settings.value(self._LOW_POWER_KEY, AppSettings.low_power, type=bool) is True,
+            screen_region=parse_region(self._load_str(self._SCREEN_REGION_KEY)),
+        )
 
     def save(self, settings: AppSettings) -> None:
         """Persist settings to storage."""
         self._settings.setValue(self._INTERVAL_KEY, settings.interval_ms)
         self._settings.setValue(self._HOTKEY_KEY, settings.start_stop_hotkey)
+        self._settings.setValue(self._PAUSE_HOTKEY_KEY, settings.pause_hotkey)
+        self._settings.setValue(self._SPEED_UP_HOTKEY_KEY, settings.speed_up_hotkey)
+        self._settings.setValue(self._SLOW_DOWN_HOTKEY_KEY, settings.slow_down_hotkey)
+        self._settings.setValue(self._PROFILE_HOTKEY_KEY, settings.profile_hotkey)
+        self._settings.setValue(self._PROFILES_KEY, format_interval_profiles(settings.interval_profiles))
+        self._settings.setValue(self._TRIGGER_MODE_KEY, settings.trigger_mode)
+        self._settings.setValue(self._JITTER_DISTRIBUTION_KEY, settings.jitter_distribution)
+        self._settings.setValue(self._JITTER_PERCENT_KEY, settings.jitter_percent)
+        self._settings.setValue(self._INPUT_DEVICE_KEY, settings.input_device)
+        self._settings.setValue(self._REPEAT_KEYS_KEY, format_repeat_keys(settings.repeat_keys))
+        self._settings.setValue(self._KEY_BACKEND_KEY, settings.key_backend)
+        self._settings.setValue(self._LOW_POWER_KEY, settings.low_power)
+        self._settings.setValue(self._SCREEN_REGION_KEY, format_region(settings.screen_region))
+        if self._writes is not None:
+            self._writes.inc()
+
+    def _load_str(self, key: str) -> str:
+        value = self._settings.value(key, "", type=str)
+        return value if isinstance(value, str) else ""
+
+
+def parse_interval_profiles(text: str) -> tuple[int, ...]:
+    """Parse comma separated interval presets, skipping invalid entries."""
+    profiles: list[int] = []
+    for part in text.split(","):
+        part = part.strip()
+        if part.isdigit() and int(part) > 0:
+            profiles.append(int(part))
+    return tuple(profiles)
+
+
+def format_interval_profiles(profiles: tuple[int, ...]) -> str:
+    """Format interval presets for storage and display."""
+    return ", ".join(str(value) for value in profiles)
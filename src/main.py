@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import os
 import sys
 
 from PyQt6.QtWidgets import QApplication
 
 from .core.container import build_container
+from .core.logging import shutdown_logging
 
 APP_NAME = "renda-chan"
 
@@ -21,7 +23,13 @@ def main() -> int:
     container.window.show()
 
     exit_code = app.exec()
-    container.coordinator.shutdown()
+    clean = container.coordinator.shutdown()
+    if container.metrics_server is not None:
+        container.metrics_server.stop()
+    if not clean:
+        # A backend call is stuck on the worker thread; normal interpreter exit would wait on it forever.
+        shutdown_logging()
+        os._exit(exit_code)
     return exit_code
 
 
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ..domain.simulation import ClickSimulation
+from ..infra.click_trace import (
+    HEADER_SIZE,
+    RECORD,
+    ClickTracer,
+    TraceRecord,
+    TraceRecorder,
+    iter_trace,
+    read_trace_header,
+)
+from ..trace_analyzer import analyze_trace, format_report, main
+
+
+def _read(path: Path) -> list[TraceRecord]:
+    with path.open("rb") as stream:
+        header = read_trace_header(stream)
+        return list(iter_trace(stream, header.records, chunk_records=3))
+
+
+def test_recorder_round_trips_records_across_ring_wraps(tmp_path: Path) -> None:
+    path = tmp_path / "run.rtrace"
+    expected = [TraceRecord(i * 0.01, i * 0.01 + 0.001, 0.0005) for i in range(100)]
+
+    with TraceRecorder(path, capacity=8, flush_interval_s=0.001) as recorder:
+        for index, record in enumerate(expected):
+            recorder.record(*record)
+            if index % 4 == 3:
+                recorder._drain()
+
+    assert recorder.dropped == 0
+    assert path.stat().st_size == HEADER_SIZE + len(expected) * RECORD.size
+    assert _read(path) == expected
+
+
+def test_recorder_drops_oldest_records_when_the_ring_overflows(tmp_path: Path) -> None:
+    path = tmp_path / "run.rtrace"
+
+    with TraceRecorder(path, capacity=4, flush_interval_s=60.0) as recorder:
+        for i in range(10):
+            recorder.record(float(i), float(i), 0.0)
+
+    assert recorder.dropped == 6
+    assert [record.scheduled for record in _read(path)] == [6.0, 7.0, 8.0, 9.0]
+
+
+def test_recorder_rejects_non_power_of_two_capacity(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="power of two"):
+        TraceRecorder(tmp_path / "run.rtrace", capacity=6)
+
+
+def test_read_trace_header_rejects_foreign_files(tmp_path: Path) -> None:
+    path = tmp_path / "other.rtrace"
+    path.write_bytes(b"x" * HEADER_SIZE)
+
+    with path.open("rb") as stream, pytest.raises(ValueError, match="not a renda-chan trace"):
+        read_trace_header(stream)
+
+
+def test_loop_trace_feeds_the_analyzer(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "run.rtrace"
+    costs = iter([0.001] * 10 + [0.5] + [0.001] * 19)
+    simulation = ClickSimulation(cost=lambda: next(costs), lateness=0.002)
+
+    with TraceRecorder(path) as recorder:
+        summary = simulation.loop.run(100, max_clicks=30, trace=recorder.record)
+
+    records = _read(path)
+    assert len(records) == summary.clicks == 30
+    assert records[10].cost == pytest.approx(0.5)
+    assert records[1].actual - records[1].scheduled == pytest.approx(0.002)
+
+    report = analyze_trace(path, window_s=1.0, top=3)
+    assert report.records == 30
+    assert report.outliers[0].index == 11
+    assert report.outliers[0].interval_s == pytest.approx(0.5)
+    assert [window.start_s for window in report.drift] == [0.0, 1.0, 2.0, 3.0]
+    assert report.drift[1].max_lateness_s == pytest.approx(0.002)
+    merged = analyze_trace(path, window_s=1.0, top=3, max_windows=2)
+    assert merged.window_s == 2.0
+    assert [window.start_s for window in merged.drift] == [0.0, 2.0]
+    assert sum(window.clicks for window in merged.drift) == 30
+    assert merged.drift[0].max_lateness_s == pytest.approx(max(window.max_lateness_s for window in report.drift[:2]))
+    assert "interval histogram" in format_report(report)
+
+    assert main([str(path), "--top", "1"]) == 0
+    assert "outliers" in capsys.readouterr().out
+
+
+def test_drift_windows_stay_capped_for_sparse_clicks(tmp_path: Path) -> None:
+    path = tmp_path / "run.rtrace"
+    with TraceRecorder(path, capacity=256, flush_interval_s=60.0) as recorder:
+        for i in range(200):
+            recorder.record(i * 2.0, i * 2.0 + 0.001, 0.0)
+
+    report = analyze_trace(path, window_s=1.0, max_windows=8)
+    assert len(report.drift) <= 8
+    assert report.window_s >= 398.0 / 8
+    assert sum(window.clicks for window in report.drift) == 200
+
+    single = analyze_trace(path, window_s=1.0, max_windows=1)
+    assert len(single.drift) == 1
+    assert single.drift[0].clicks == 200
+
+
+def test_drain_skips_the_slot_being_overwritten(tmp_path: Path) -> None:
+    path = tmp_path / "run.rtrace"
+    with TraceRecorder(path, capacity=4, flush_interval_s=60.0) as recorder:
+        for value in range(4):
+            recorder.record(float(value), 0.0, 0.0)
+        # Record 0 shares its slot with record 4, which the click thread may be storing.
+        recorder._drain()
+
+    assert recorder.dropped == 1
+    assert [record.scheduled for record in _read(path)] == [1.0, 2.0, 3.0]
+
+
+def test_tracer_sessions_in_the_same_second_get_separate_files(tmp_path: Path) -> None:
+    tracer = ClickTracer(tmp_path, capacity=8)
+    for value in (1.0, 2.0):
+        with tracer.session("run") as recorder:
+            recorder.record(value, value, 0.0)
+
+    paths = sorted(tmp_path.iterdir())
+    assert len(paths) == 2
+    assert sorted(_read(path)[0].scheduled for path in paths) == [1.0, 2.0]
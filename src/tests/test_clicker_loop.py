@@ -5,6 +5,7 @@ import threading
 import pytest
 
 from ..domain.clicker_loop import ClickBackend, ClickLoop
+from ..domain.simulation import ClickSimulation
 
 
 def test_click_loop_runs_until_wait_requests_stop() -> None:
@@ -55,3 +56,52 @@ def test_click_loop_rejects_non_positive_interval() -> None:
 
     with pytest.raises(ValueError, match="interval_ms must be positive"):
         loop.run(0)
+
+
+def test_click_loop_pause_holds_until_resumed() -> None:
+    clicks: list[str] = []
+    stop_event = threading.Event()
+    paused = threading.Event()
+
+    def wait(_: float) -> bool:
+        if len(clicks) == 1:
+            loop.pause()
+            paused.set()
+        return stop_event.is_set()
+
+    loop = ClickLoop(
+        ClickBackend(click=lambda: clicks.append("click"), name="test"),
+        stop_event=stop_event,
+        wait=wait,
+    )
+    thread = threading.Thread(target=loop.run, args=(1,))
+
+    thread.start()
+    assert paused.wait(timeout=1)
+    assert clicks == ["click"]
+    loop.stop()
+    thread.join(timeout=1)
+
+    assert not thread.is_alive()
+    assert clicks == ["click"]
+
+
+def test_click_loop_set_interval_applies_to_next_wait() -> None:
+    simulation = ClickSimulation(record=True)
+    simulation.clock.call_at(0.15, lambda: simulation.loop.set_interval(250))
+
+    simulation.loop.run(100, max_clicks=4)
+
+    assert simulation.backend.times is not None
+    assert list(simulation.backend.times) == pytest.approx([0.0, 0.1, 0.2, 0.45])
+
+
+def test_click_loop_stop_after_arm_prevents_next_run() -> None:
+    clicks: list[str] = []
+    loop = ClickLoop(ClickBackend(click=lambda: clicks.append("click"), name="test"))
+
+    loop.arm()
+    loop.stop()
+    loop.run(1)
+
+    assert clicks == []
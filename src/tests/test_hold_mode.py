@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from ..core.app import AppCoordinator
+from ..infra import hotkey_service
+from ..infra.hotkey_bindings import HotkeyAction
+from ..infra.hotkey_service import HotkeyService
+
+
+class FakeClicker:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def start(self, interval_ms: int, jitter: object = None) -> None:
+        self.calls.append("start")
+
+    def stop(self) -> None:
+        self.calls.append("stop")
+
+
+def _hold_coordinator(clicker: FakeClicker) -> Any:
+    return SimpleNamespace(
+        _hold_mode=True,
+        _clicker=clicker,
+        _interval_ms=10,
+        _jitter=None,
+        _hold_lock=threading.Lock(),
+        _pending_hold_stop=None,
+    )
+
+
+def _hooked_service(monkeypatch: pytest.MonkeyPatch, coordinator: Any) -> list[Any]:
+    hooks: list[Any] = []
+
+    def hook(handler: Any) -> Any:
+        hooks.append(handler)
+        return handler
+
+    monkeypatch.setattr(hotkey_service, "pynput_keyboard", None)
+    monkeypatch.setattr(hotkey_service, "keyboard_module", SimpleNamespace(hook=hook, unhook=hooks.remove))
+    service = HotkeyService(
+        lambda action: AppCoordinator.handle_hotkey(coordinator, action),
+        on_release=lambda action: AppCoordinator.handle_hotkey_release(coordinator, action),
+    )
+    service.register({HotkeyAction.TOGGLE: "F6"}, hold_actions=[HotkeyAction.TOGGLE])
+    return hooks
+
+
+def _send(hooks: list[Any], event_type: str) -> None:
+    hooks[0](SimpleNamespace(name="f6", event_type=event_type))
+
+
+def test_hold_auto_repeat_as_release_press_pairs_keeps_one_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    clicker = FakeClicker()
+    coordinator = _hold_coordinator(clicker)
+    hooks = _hooked_service(monkeypatch, coordinator)
+
+    _send(hooks, "down")
+    for _ in range(3):
+        # X11 auto-repeat: a release immediately followed by a press.
+        _send(hooks, "up")
+        _send(hooks, "down")
+    _send(hooks, "down")  # repeat delivered as a plain key-down
+    assert clicker.calls == ["start"]
+
+    _send(hooks, "up")
+    pending = coordinator._pending_hold_stop
+    assert pending is not None
+    pending.join()
+
+    assert clicker.calls == ["start", "stop"]
+    assert coordinator._pending_hold_stop is None
+
+
+def test_press_after_the_debounced_stop_starts_a_new_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    clicker = FakeClicker()
+    coordinator = _hold_coordinator(clicker)
+    hooks = _hooked_service(monkeypatch, coordinator)
+
+    _send(hooks, "down")
+    _send(hooks, "up")
+    coordinator._pending_hold_stop.join()
+    _send(hooks, "down")
+
+    assert clicker.calls == ["start", "stop", "start"]
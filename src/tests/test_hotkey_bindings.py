@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from ..infra import hotkey_service
+from ..infra.hotkey_bindings import (
+    IGNORED_KEY,
+    MODIFIER_BITS,
+    MODIFIER_FLAG,
+    UNKNOWN_KEY,
+    Chord,
+    HotkeyAction,
+    HotkeyStateMachine,
+    compile_hotkeys,
+    parse_hotkey,
+)
+from ..infra.hotkey_service import HotkeyService, _keyboard_table
+
+CTRL = MODIFIER_FLAG | MODIFIER_BITS["ctrl"]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def tap(machine: HotkeyStateMachine, code: int) -> HotkeyAction | None:
+    action = machine.press(code)
+    machine.release(code)
+    return action
+
+
+def test_parse_hotkey_supports_sequences_and_aliases() -> None:
+    assert parse_hotkey("Ctrl+K, S") == (Chord(MODIFIER_BITS["ctrl"], "k"), Chord(0, "s"))
+    assert parse_hotkey("Cmd+PgUp") == (Chord(MODIFIER_BITS["meta"], "page_up"),)
+
+
+@pytest.mark.parametrize(
+    ("hotkey", "message"),
+    [
+        ("Esc", "Esc"),
+        ("Ctrl+Shift", "修飾キーのみ"),
+        ("Ctrl+A+B", "1 つ"),
+    ],
+)
+def test_parse_hotkey_rejects_invalid_input(hotkey: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        parse_hotkey(hotkey)
+
+
+def test_compile_rejects_duplicates_and_prefix_clashes() -> None:
+    with pytest.raises(ValueError, match="重複"):
+        compile_hotkeys({HotkeyAction.TOGGLE: "F6", HotkeyAction.PAUSE: "F6"})
+    with pytest.raises(ValueError, match="先頭"):
+        compile_hotkeys({HotkeyAction.TOGGLE: "Ctrl+K, S", HotkeyAction.PAUSE: "Ctrl+K"})
+    with pytest.raises(ValueError, match="始まって"):
+        compile_hotkeys({HotkeyAction.PAUSE: "Ctrl+K", HotkeyAction.TOGGLE: "Ctrl+K, S"})
+
+
+def test_machine_fires_single_chord_only_with_matching_modifiers() -> None:
+    compiled = compile_hotkeys({HotkeyAction.TOGGLE: "Ctrl+F6"})
+    machine = HotkeyStateMachine(compiled)
+    f6 = compiled.key_ids["f6"]
+
+    assert tap(machine, f6) is None
+    machine.press(CTRL)
+    assert tap(machine, f6) is HotkeyAction.TOGGLE
+    machine.release(CTRL)
+    assert tap(machine, f6) is None
+
+
+def test_machine_advances_sequences_and_filters_auto_repeat() -> None:
+    compiled = compile_hotkeys(
+        {
+            HotkeyAction.SPEED_UP: "Ctrl+K, Up",
+            HotkeyAction.SLOW_DOWN: "Ctrl+K, Down",
+            HotkeyAction.TOGGLE: "F6",
+        }
+    )
+    machine = HotkeyStateMachine(compiled)
+    k, up, f6 = compiled.key_ids["k"], compiled.key_ids["up"], compiled.key_ids["f6"]
+
+    machine.press(CTRL)
+    assert tap(machine, k) is None
+    machine.release(CTRL)
+    assert tap(machine, up) is HotkeyAction.SPEED_UP
+
+    assert machine.press(f6) is HotkeyAction.TOGGLE
+    assert machine.press(f6) is None
+    machine.release(f6)
+    assert machine.press(f6) is HotkeyAction.TOGGLE
+
+
+def test_machine_resets_sequence_after_timeout_or_other_key() -> None:
+    clock = FakeClock()
+    compiled = compile_hotkeys({HotkeyAction.NEXT_PROFILE: "Ctrl+K, P"})
+    machine = HotkeyStateMachine(compiled, sequence_timeout_s=1.0, clock=clock)
+    k, p = compiled.key_ids["k"], compiled.key_ids["p"]
+
+    machine.press(CTRL)
+    tap(machine, k)
+    machine.release(CTRL)
+    clock.now = 1.5
+    assert tap(machine, p) is None
+
+    machine.press(CTRL)
+    tap(machine, k)
+    machine.release(CTRL)
+    tap(machine, UNKNOWN_KEY)
+    assert tap(machine, p) is None
+
+    machine.press(CTRL)
+    tap(machine, k)
+    machine.release(CTRL)
+    assert tap(machine, p) is HotkeyAction.NEXT_PROFILE
+
+
+def test_machine_keeps_sequence_across_ignored_keys() -> None:
+    compiled = compile_hotkeys({HotkeyAction.TOGGLE: "Ctrl+K, S"})
+    machine = HotkeyStateMachine(compiled)
+    k, s = compiled.key_ids["k"], compiled.key_ids["s"]
+
+    machine.press(CTRL)
+    tap(machine, k)
+    machine.release(CTRL)
+    for _ in range(5):
+        assert tap(machine, IGNORED_KEY) is None
+
+    assert tap(machine, s) is HotkeyAction.TOGGLE
+
+
+def test_keyboard_table_maps_repeat_keys_to_ignored_code() -> None:
+    compiled = compile_hotkeys({HotkeyAction.TOGGLE: "Ctrl+K, S"})
+
+    table = _keyboard_table(compiled, ("z", "page_down", "k"))
+
+    assert table["z"] == table["Z"] == table["page down"] == IGNORED_KEY
+    assert table["k"] == compiled.key_ids["k"]
+    assert "x" not in table
+
+
+def test_repeated_modifiers_do_not_spoil_hotkey_chords() -> None:
+    compiled = compile_hotkeys({HotkeyAction.TOGGLE: "Ctrl+K"})
+    table = _keyboard_table(compiled, ("shift",))
+    machine = HotkeyStateMachine(compiled)
+
+    assert table["shift"] == table["left shift"] == table["right shift"] == IGNORED_KEY
+    assert table["ctrl"] == CTRL
+    machine.press(table["shift"])
+    machine.press(table["ctrl"])
+    assert machine.press(table["k"]) is HotkeyAction.TOGGLE
+
+
+def test_machine_reports_hold_release_once_and_ignores_repeats() -> None:
+    compiled = compile_hotkeys({HotkeyAction.TOGGLE: "Ctrl+F6"}, hold_actions=[HotkeyAction.TOGGLE])
+    machine = HotkeyStateMachine(compiled)
+    f6 = compiled.key_ids["f6"]
+
+    machine.press(CTRL)
+    assert machine.press(f6) is HotkeyAction.TOGGLE
+    assert machine.press(f6) is None
+    assert machine.press(f6) is None
+    machine.release(CTRL)
+    assert machine.release(f6) is HotkeyAction.TOGGLE
+    assert machine.release(f6) is None
+
+
+def test_compile_rejects_sequence_for_hold_action() -> None:
+    with pytest.raises(ValueError, match="シーケンス"):
+        compile_hotkeys({HotkeyAction.TOGGLE: "Ctrl+K, S"}, hold_actions=[HotkeyAction.TOGGLE])
+
+
+def test_failed_registration_keeps_the_previous_hotkeys(monkeypatch: pytest.MonkeyPatch) -> None:
+    hooks: list[Any] = []
+
+    def hook(handler: Any) -> Any:
+        hooks.append(handler)
+        return handler
+
+    fake_keyboard = SimpleNamespace(hook=hook, unhook=hooks.remove)
+    monkeypatch.setattr(hotkey_service, "pynput_keyboard", None)
+    monkeypatch.setattr(hotkey_service, "keyboard_module", fake_keyboard)
+    fired: list[HotkeyAction] = []
+    service = HotkeyService(fired.append)
+    service.register({HotkeyAction.TOGGLE: "F6"})
+
+    with pytest.raises(ValueError, match="重複"):
+        service.register({HotkeyAction.TOGGLE: "F7", HotkeyAction.PAUSE: "F7"})
+
+    assert len(hooks) == 1
+    hooks[0](SimpleNamespace(name="f6", event_type="down"))
+    assert fired == [HotkeyAction.TOGGLE]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import statistics
+
+import pytest
+
+from ..domain.jitter import JITTER_DISTRIBUTIONS, REFILL_CHUNK, IntervalSampler, JitterConfig
+from ..domain.simulation import ClickSimulation
+
+BACKENDS = [pytest.param(False, id="stdlib"), pytest.param(True, id="numpy")]
+
+
+def _sampler(config: JitterConfig, use_numpy: bool, block_size: int = 1024) -> IntervalSampler:
+    if use_numpy:
+        pytest.importorskip("numpy")
+    return IntervalSampler(config, block_size=block_size, use_numpy=use_numpy)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+@pytest.mark.parametrize("distribution", JITTER_DISTRIBUTIONS)
+def test_sampler_matches_requested_mean_and_spread(distribution: str, use_numpy: bool) -> None:
+    config = JitterConfig(distribution=distribution, spread=0.1, lower=0.2, upper=5.0, seed=1234)
+    values = _sampler(config, use_numpy).take(20_000)
+
+    expected_stdev = 0.1 if distribution != "uniform" else 0.1 / 3**0.5
+    assert statistics.fmean(values) == pytest.approx(1.0, abs=0.005)
+    assert statistics.stdev(values) == pytest.approx(expected_stdev, rel=0.05)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_sampler_is_reproducible_across_block_swaps(use_numpy: bool) -> None:
+    config = JitterConfig(distribution="normal", spread=0.2, seed=42)
+
+    first = _sampler(config, use_numpy, block_size=16).take(100)
+    second = _sampler(config, use_numpy, block_size=16).take(100)
+    other_seed = _sampler(JitterConfig(distribution="normal", spread=0.2, seed=43), use_numpy, block_size=16).take(100)
+
+    assert first == second
+    assert first != other_seed
+    assert len(set(first)) == len(first)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_sampler_clips_to_bounds(use_numpy: bool) -> None:
+    config = JitterConfig(distribution="lognormal", spread=1.0, lower=0.8, upper=1.2, seed=7)
+
+    values = _sampler(config, use_numpy).take(5_000)
+
+    assert min(values) == pytest.approx(0.8)
+    assert max(values) == pytest.approx(1.2)
+
+
+def test_jitter_config_rejects_invalid_values() -> None:
+    with pytest.raises(ValueError, match="unknown jitter distribution"):
+        JitterConfig(distribution="poisson")
+    with pytest.raises(ValueError, match="bounds"):
+        JitterConfig(lower=1.1)
+
+
+def test_click_loop_scales_intervals_by_jitter_factors() -> None:
+    simulation = ClickSimulation(record=True)
+
+    simulation.loop.run(100, JitterConfig(distribution="uniform", spread=0.2, seed=5), max_clicks=2_001)
+
+    assert simulation.backend.times is not None
+    times = simulation.backend.times
+    waits = [later - earlier for earlier, later in zip(times, times[1:], strict=False)]
+    assert min(waits) >= 0.08
+    assert max(waits) <= 0.12
+    assert statistics.fmean(waits) == pytest.approx(0.1, rel=0.01)
+    assert len(set(waits)) > 1_000
+
+
+def test_refill_generates_one_chunk_per_call() -> None:
+    sampler = IntervalSampler(JitterConfig(seed=3), block_size=REFILL_CHUNK * 3, use_numpy=False)
+    reference = IntervalSampler(JitterConfig(seed=3), block_size=REFILL_CHUNK * 3, use_numpy=False)
+
+    values = [sampler.next_factor() for _ in range(REFILL_CHUNK * 3 + 1)]
+    sampler.refill()
+
+    assert sampler._filled == REFILL_CHUNK
+    assert values + [sampler.next_factor() for _ in range(REFILL_CHUNK * 3)] == reference.take(REFILL_CHUNK * 6 + 1)
+
+
+def test_refill_time_is_taken_out_of_the_wait(monkeypatch: pytest.MonkeyPatch) -> None:
+    simulation = ClickSimulation(record=True)
+    original = IntervalSampler.refill
+
+    def slow_refill(self: IntervalSampler) -> None:
+        original(self)
+        simulation.clock.advance(0.005)
+
+    monkeypatch.setattr(IntervalSampler, "refill", slow_refill)
+
+    simulation.loop.run(20, JitterConfig(distribution="uniform", spread=0.0, seed=1), max_clicks=50)
+
+    assert simulation.backend.times is not None
+    times = simulation.backend.times
+    waits = [later - earlier for earlier, later in zip(times, times[1:], strict=False)]
+    assert max(waits) == pytest.approx(0.02)
+    assert min(waits) == pytest.approx(0.02)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import struct
+from types import SimpleNamespace
+
+import pytest
+
+from ..domain.clicker_loop import ClickBackend
+from ..domain.simulation import ClickSimulation
+from ..infra import key_repeat
+from ..infra.hotkey_bindings import HotkeyAction
+from ..infra.key_repeat import (
+    LINUX_KEY_CODES,
+    KeyRepeatConfig,
+    encode_key_batch,
+    exclude_hotkey_keys,
+    format_repeat_keys,
+    parse_repeat_keys,
+    resolve_key_backend,
+)
+
+
+def test_parse_repeat_keys_normalizes_and_deduplicates() -> None:
+    keys = parse_repeat_keys(" Z, Return,z , Escape, PgDn ,")
+
+    assert keys == ("z", "enter", "esc", "page_down")
+    assert format_repeat_keys(keys) == "z, enter, esc, page_down"
+
+
+def test_exclude_hotkey_keys_drops_hotkey_keys_and_modifiers() -> None:
+    bindings = {
+        HotkeyAction.TOGGLE: "Ctrl+Z",
+        HotkeyAction.PAUSE: "K, S",
+        HotkeyAction.SPEED_UP: "not+a+valid+hotkey",
+        HotkeyAction.SLOW_DOWN: "",
+    }
+
+    kept = exclude_hotkey_keys(("z", "x", "ctrl", "shift", "k", "s"), bindings)
+
+    assert kept == ("x", "shift")
+
+
+def test_key_repeat_config_rejects_empty_keys_and_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="連打するキー"):
+        KeyRepeatConfig(keys=())
+    with pytest.raises(ValueError, match="unknown key backend"):
+        KeyRepeatConfig(keys=("z",), backend="xdotool")
+
+
+def test_encode_key_batch_presses_all_then_releases_in_reverse() -> None:
+    event = struct.Struct("@llHHi")
+    codes = (LINUX_KEY_CODES["z"], LINUX_KEY_CODES["x"])
+
+    payload = encode_key_batch(codes)
+
+    events = [fields[2:] for fields in event.iter_unpack(payload)]
+    assert events == [
+        (1, 44, 1),
+        (1, 45, 1),
+        (0, 0, 0),
+        (1, 45, 0),
+        (1, 44, 0),
+        (0, 0, 0),
+    ]
+
+
+def test_loop_set_backend_applies_from_next_run() -> None:
+    simulation = ClickSimulation()
+    taps: list[str] = []
+    simulation.loop.set_backend(ClickBackend(click=lambda: taps.append("z"), name="keys"))
+
+    summary = simulation.loop.run(10, max_clicks=5)
+
+    assert summary.clicks == 5
+    assert taps == ["z"] * 5
+    assert simulation.backend.clicks == 0
+
+
+def test_keyboard_backend_presses_every_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[tuple[str, int]] = []
+    stub = SimpleNamespace(
+        # keyboard.parse_hotkey(["z", "x"]): one step holding both keys' scan codes.
+        parse_hotkey=lambda names: (((44,), (45,)),),
+        press=lambda code: events.append(("press", code)),
+        release=lambda code: events.append(("release", code)),
+    )
+    monkeypatch.setattr(key_repeat, "keyboard_module", stub)
+
+    backend = resolve_key_backend(KeyRepeatConfig(keys=("z", "x"), backend="keyboard"))
+    backend.click()
+
+    assert backend.name == "keyboard"
+    assert events == [("press", 44), ("press", 45), ("release", 45), ("release", 44)]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+import logging
+import queue
+
+from ..core.logging import DroppingQueueHandler, JsonFormatter, TextFormatter
+
+
+def _record(**extra: object) -> logging.LogRecord:
+    return logging.getLogger("renda.test").makeRecord(
+        "renda.test", logging.INFO, __file__, 1, "Click run summary", (), None, extra=extra
+    )
+
+
+def test_json_formatter_emits_extra_fields() -> None:
+    record = _record(clicks=10, cpu_per_click_us=12.5, context_switches=None)
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "Click run summary"
+    assert payload["clicks"] == 10
+    assert payload["cpu_per_click_us"] == 12.5
+    assert payload["context_switches"] is None
+    assert "args" not in payload and "levelno" not in payload
+
+
+def test_text_formatter_appends_extra_fields() -> None:
+    line = TextFormatter(fmt="%(levelname)s %(message)s").format(_record(clicks=10, wakeups=9))
+
+    assert line == "INFO Click run summary clicks=10 wakeups=9"
+
+
+def test_extra_fields_survive_the_log_queue() -> None:
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    DroppingQueueHandler(log_queue).handle(_record(timer_slack_ms=10.0))
+
+    payload = json.loads(JsonFormatter().format(log_queue.get_nowait()))
+
+    assert payload["timer_slack_ms"] == 10.0
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import threading
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from ..core.metrics import Histogram, MetricsRegistry
+from ..core.profiling import RunProfiler
+from ..domain.clicker_loop import ClickBackend, ClickLoop
+from ..infra.metrics_server import MetricsServer
+
+
+def test_registry_renders_counters_and_histograms() -> None:
+    registry = MetricsRegistry()
+    registry.counter("renda_test_total", "Test counter.", action="toggle").inc(3)
+    histogram = registry.histogram("renda_test_seconds", "Test histogram.", buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5.0)
+
+    text = registry.render()
+
+    assert "# TYPE renda_test_total counter" in text
+    assert 'renda_test_total{action="toggle"} 3' in text
+    assert 'renda_test_seconds_bucket{le="0.1"} 1' in text
+    assert 'renda_test_seconds_bucket{le="1.0"} 2' in text
+    assert 'renda_test_seconds_bucket{le="+Inf"} 3' in text
+    assert "renda_test_seconds_count 3" in text
+
+
+def test_registry_returns_same_metric_for_same_labels() -> None:
+    registry = MetricsRegistry()
+
+    first = registry.counter("renda_test_total", "Test counter.", action="a")
+    second = registry.counter("renda_test_total", "Test counter.", action="a")
+
+    assert first is second
+    with pytest.raises(ValueError, match="already registered"):
+        registry.histogram("renda_test_total", "Clash.")
+
+
+def test_histogram_rejects_empty_buckets() -> None:
+    with pytest.raises(ValueError, match="buckets must not be empty"):
+        Histogram(())
+
+
+def test_click_loop_records_clicks_and_cost() -> None:
+    registry = MetricsRegistry()
+    stop_event = threading.Event()
+    remaining = [3]
+
+    def wait(_: float) -> bool:
+        remaining[0] -= 1
+        return remaining[0] == 0
+
+    loop = ClickLoop(ClickBackend(click=lambda: None, name="test"), stop_event=stop_event, wait=wait, metrics=registry)
+
+    loop.run(1)
+
+    assert registry.counter("renda_clicks_total", "", backend="test").value == 3
+    assert registry.counter("renda_click_runs_total", "", backend="test").value == 1
+    assert registry.histogram("renda_click_cost_seconds", "", backend="test").count == 3
+    assert registry.histogram("renda_click_lateness_seconds", "", backend="test").count == 3
+
+
+def test_click_loop_counts_backend_errors() -> None:
+    registry = MetricsRegistry()
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    loop = ClickLoop(ClickBackend(click=fail, name="test"), metrics=registry)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        loop.run(1)
+
+    assert registry.counter("renda_click_errors_total", "", backend="test").value == 1
+
+
+def test_metrics_server_serves_exposition_on_localhost() -> None:
+    registry = MetricsRegistry()
+    registry.counter("renda_test_total", "Test counter.").inc()
+    server = MetricsServer(registry, port=0)
+    server.start()
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+            body = response.read().decode("utf-8")
+    finally:
+        server.stop()
+
+    assert "renda_test_total 1" in body
+
+
+@pytest.mark.parametrize("seconds", ["nan", "inf", "abc"])
+def test_metrics_server_rejects_invalid_profile_durations(seconds: str) -> None:
+    server = MetricsServer(MetricsRegistry(), port=0)
+    server.start()
+    try:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"http://127.0.0.1:{server.port}/debug/profile?seconds={seconds}", timeout=5)
+    finally:
+        server.stop()
+
+    assert error.value.code == 400
+    error.value.close()
+
+
+def test_profiler_sessions_in_the_same_second_get_separate_files(tmp_path: Path) -> None:
+    profiler = RunProfiler("cprofile", tmp_path)
+    for _ in range(2):
+        with profiler.session("run"):
+            pass
+
+    assert len(list(tmp_path.glob("run-*.prof"))) == 2
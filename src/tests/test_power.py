@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import sys
+import time
+
+import pytest
+
+from ..core.metrics import MetricsRegistry
+from ..domain.power import (
+    MAX_TIMER_SLACK_S,
+    CpuSample,
+    _prctl,
+    low_power_slack,
+    timer_slack,
+    timer_slack_supported,
+)
+from ..domain.simulation import ClickSimulation
+
+linux_only = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="timer slack is Linux only")
+
+
+def test_low_power_slack_only_applies_to_long_intervals() -> None:
+    assert low_power_slack(0.1) == 0.0
+    assert low_power_slack(0.5) == pytest.approx(0.01)
+    assert low_power_slack(60.0) == MAX_TIMER_SLACK_S
+
+
+@linux_only
+def test_timer_slack_is_restored_after_the_block() -> None:
+    prctl = _prctl()
+    assert prctl is not None
+    before = prctl(30, 0, 0, 0, 0)
+
+    with timer_slack(0.01) as applied:
+        inside = prctl(30, 0, 0, 0, 0)
+
+    assert applied == 0.01
+    assert inside == 10_000_000
+    assert prctl(30, 0, 0, 0, 0) == before
+
+
+def test_timer_slack_support_matches_the_platform() -> None:
+    assert timer_slack_supported() == (_prctl() is not None)
+    if not sys.platform.startswith("linux"):
+        assert not timer_slack_supported()
+
+
+def test_timer_slack_is_a_no_op_for_zero() -> None:
+    with timer_slack(0.0) as applied:
+        assert applied == 0.0
+
+
+def test_cpu_sample_difference() -> None:
+    earlier = CpuSample(thread_cpu_s=1.0, context_switches=10)
+
+    delta = CpuSample(thread_cpu_s=1.5, context_switches=13) - earlier
+
+    assert delta == CpuSample(thread_cpu_s=0.5, context_switches=3)
+    assert (CpuSample(2.0, None) - earlier).context_switches is None
+
+
+def test_run_summary_reports_cpu_and_wakeups() -> None:
+    registry = MetricsRegistry()
+    simulation = ClickSimulation(metrics=registry)
+
+    summary = simulation.loop.run(1000, max_clicks=20, low_power=True)
+
+    assert summary.clicks == 20
+    assert summary.wakeups == simulation.wait.wakeups == 19
+    assert summary.cpu_s >= 0.0
+    assert summary.cpu_per_click_s == pytest.approx(summary.cpu_s / 20)
+    if sys.platform.startswith("linux"):
+        assert summary.timer_slack_s == pytest.approx(0.02)
+        assert summary.context_switches is not None
+    assert registry.counter("renda_click_loop_wakeups_total", "", backend="simulated").value == 19
+
+
+def test_scheduled_start_wait_is_not_charged_to_run_cpu() -> None:
+    simulation = ClickSimulation()
+    simulated_wait = simulation.wait
+
+    def busy_wait(timeout: float) -> bool:
+        if timeout > 0:
+            spin_until = time.thread_time() + 0.05
+            while time.thread_time() < spin_until:
+                pass
+        return simulated_wait(timeout)
+
+    simulation.loop._wait = busy_wait
+
+    summary = simulation.loop.run(100, max_clicks=1, start_at=1.0)
+
+    assert summary.clicks == 1
+    assert summary.cpu_s < 0.04
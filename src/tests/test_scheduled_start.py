@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from ..core.app import AppCoordinator
+from ..core.logging import JsonFormatter, TextFormatter
+from ..domain.clicker_loop import START_SPIN_S, wall_to_clock
+from ..domain.screen_trigger import TriggerSummary
+from ..domain.simulation import ClickSimulation
+
+
+def test_scheduled_start_clicks_at_the_target_time() -> None:
+    simulation = ClickSimulation(record=True)
+
+    summary = simulation.loop.run(100, max_clicks=3, start_at=5.0)
+
+    assert summary.start_error_s is not None
+    assert 0.0 <= summary.start_error_s < 1e-5
+    assert simulation.backend.times is not None
+    assert simulation.backend.times[0] == pytest.approx(5.0, abs=1e-5)
+    assert simulation.wait.polls > 0
+    assert simulation.wait.wakeups == 1 + 2
+
+
+def test_scheduled_start_polls_only_inside_the_spin_window() -> None:
+    simulation = ClickSimulation(lateness=0.005)
+
+    summary = simulation.loop.run(100, max_clicks=1, start_at=10.0)
+
+    assert summary.start_error_s is not None
+    assert 0.0 <= summary.start_error_s < 1e-5
+    assert simulation.wait.polls <= (START_SPIN_S + 1e-6) / 1e-6 + 1
+
+
+def test_stop_during_the_wait_cancels_the_run() -> None:
+    simulation = ClickSimulation()
+    simulation.stop_at(2.0)
+
+    summary = simulation.loop.run(100, start_at=5.0)
+
+    assert summary.clicks == 0
+    assert summary.start_error_s is None
+    assert simulation.backend.clicks == 0
+    assert simulation.clock.now == pytest.approx(2.0)
+
+
+def test_unscheduled_run_has_no_start_error() -> None:
+    summary = ClickSimulation().loop.run(100, max_clicks=1)
+
+    assert summary.start_error_s is None
+
+
+def test_wall_to_clock_pairs_the_wall_reading_with_the_midpoint() -> None:
+    readings = itertools.count(100.0, 0.5)
+
+    deadline = wall_to_clock(1_700_000_060.0, clock=lambda: next(readings), wall_clock=lambda: 1_700_000_000.0)
+
+    assert deadline == pytest.approx(100.25 + 60.0)
+
+
+def test_run_summary_log_includes_the_start_error(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO)
+    summary = ClickSimulation(lateness=0.0005).loop.run(100, max_clicks=1, start_at=1.0)
+    assert summary.start_error_s is not None
+
+    coordinator = SimpleNamespace(_logger=logging.getLogger("renda.test"))
+    AppCoordinator._handle_run_finished(coordinator, summary)  # type: ignore[arg-type]
+
+    start_record = next(record for record in caplog.records if record.getMessage() == "Scheduled start error")
+    expected = round(summary.start_error_s * 1000, 3)
+    assert json.loads(JsonFormatter().format(start_record))["start_error_ms"] == expected
+    assert f"start_error_ms={expected}" in TextFormatter().format(start_record)
+    summary_line = TextFormatter().format(caplog.records[-1])
+    assert "clicks=1" in summary_line and "cpu_per_click_us=" in summary_line
+
+
+def test_trigger_summary_log_includes_the_start_error(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.INFO)
+    summary = TriggerSummary(frames=10, clicks=1, elapsed_s=0.1, max_latency_s=0.002, start_error_s=0.00004)
+
+    coordinator = SimpleNamespace(_logger=logging.getLogger("renda.test"))
+    AppCoordinator._handle_run_finished(coordinator, summary)  # type: ignore[arg-type]
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == ["Scheduled start error", "Screen trigger summary"]
+    assert "start_error_ms=0.04" in TextFormatter().format(caplog.records[0])
+
+
+def test_scheduled_start_ends_the_coarse_wait_despite_rounding() -> None:
+    # 1.0 - 0.98 is a rounding error above START_SPIN_S.
+    simulation = ClickSimulation()
+
+    summary = simulation.loop.run(100, max_clicks=1, start_at=1.0)
+
+    assert summary.clicks == 1
+    assert simulation.wait.wakeups == 1
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from ..core.metrics import MetricsRegistry
+from ..domain.clicker_loop import ClickBackend
+from ..domain.screen_trigger import (
+    ChangeDetector,
+    Region,
+    ScreenTrigger,
+    ScreenTriggerConfig,
+    SyntheticFrameSource,
+    format_region,
+    parse_region,
+)
+from ..domain.simulation import SimulatedWait, VirtualClock
+
+np = pytest.importorskip("numpy")
+
+_REGION = Region(0, 0, 64, 64)
+
+
+def _trigger(
+    clock: VirtualClock, clicks: list[float], metrics: MetricsRegistry | None = None, lateness: float = 0.0
+) -> ScreenTrigger:
+    stop_event = threading.Event()
+    return ScreenTrigger(
+        ClickBackend(click=lambda: clicks.append(clock.now), name="simulated"),
+        stop_event=stop_event,
+        wait=SimulatedWait(clock, stop_event, lateness=lateness),
+        metrics=metrics,
+        clock=clock,
+    )
+
+
+def test_parse_region_round_trip() -> None:
+    assert parse_region(" 10, 20,300 , 40") == Region(10, 20, 300, 40)
+    assert format_region(Region(10, 20, 300, 40)) == "10, 20, 300, 40"
+    assert parse_region("") is None
+    assert parse_region("1, 2, 3") is None
+    assert parse_region("1, 2, 0, 4") is None
+    assert format_region(None) == ""
+
+
+def test_detector_compares_against_the_previous_frame() -> None:
+    detector = ChangeDetector(ScreenTriggerConfig(_REGION, threshold=24, min_changed=0.05))
+    dark = np.zeros((64, 64, 4), dtype=np.uint8)
+    lit = dark.copy()
+    lit[:16, :16, :3] = 200
+    speck = dark.copy()
+    speck[:4, :4, :3] = 200
+
+    assert detector.update(dark) is False
+    assert detector.update(dark) is False
+    assert detector.update(lit) is True
+    assert detector.update(lit) is False
+    assert detector.update(dark) is True
+    assert detector.update(speck) is False
+
+
+def test_detector_ignores_changes_below_the_threshold() -> None:
+    detector = ChangeDetector(ScreenTriggerConfig(_REGION, threshold=24))
+    frame = np.full((64, 64, 3), 100, dtype=np.uint8)
+
+    detector.update(frame)
+
+    assert detector.update(frame + 20) is False
+    assert detector.update(frame + 60) is True
+
+
+def test_detector_sees_colour_only_changes() -> None:
+    detector = ChangeDetector(ScreenTriggerConfig(_REGION))
+    red = np.zeros((64, 64, 4), dtype=np.uint8)
+    red[..., 2] = 255
+    green = np.zeros((64, 64, 4), dtype=np.uint8)
+    green[..., 1] = 255
+
+    detector.update(red)
+
+    assert detector.update(green) is True
+    assert detector.update(green) is False
+
+
+def test_trigger_clicks_once_per_change() -> None:
+    clock = VirtualClock()
+    clicks: list[float] = []
+    registry = MetricsRegistry()
+    source = SyntheticFrameSource(64, 64, period_s=0.1, clock=clock)
+
+    summary = _trigger(clock, clicks, registry).run(source, ScreenTriggerConfig(_REGION, max_fps=100), max_clicks=4)
+
+    assert summary.clicks == 4
+    assert clicks == pytest.approx([0.1, 0.2, 0.3, 0.4], abs=0.011)
+    assert summary.frames == source.frames
+    assert summary.fps == pytest.approx(100, rel=0.05)
+    assert registry.counter("renda_screen_trigger_frames_total", "").value == summary.frames
+    assert registry.counter("renda_clicks_total", "", backend="simulated").value == 4
+
+
+def test_change_during_the_minimum_gap_is_clicked_when_it_ends() -> None:
+    clock = VirtualClock()
+    clicks: list[float] = []
+    source = SyntheticFrameSource(64, 64, period_s=0.05, clock=clock)
+
+    _trigger(clock, clicks).run(source, ScreenTriggerConfig(_REGION, max_fps=1000), min_gap_ms=80, max_clicks=3)
+
+    assert clicks[0] == pytest.approx(0.05, abs=1e-3)
+    assert clicks[1] == pytest.approx(0.13, abs=1e-3)
+    assert clicks[2] == pytest.approx(0.21, abs=1e-3)
+
+
+def test_stop_ends_the_run() -> None:
+    clock = VirtualClock()
+    clicks: list[float] = []
+    trigger = _trigger(clock, clicks)
+    clock.call_at(0.25, trigger.stop)
+
+    summary = trigger.run(SyntheticFrameSource(64, 64, period_s=0.1, clock=clock), ScreenTriggerConfig(_REGION))
+
+    assert summary.clicks == 2
+    assert summary.elapsed_s == pytest.approx(0.25)
+
+
+def test_scheduled_start_begins_watching_at_the_target_time() -> None:
+    clock = VirtualClock()
+    clicks: list[float] = []
+    source = SyntheticFrameSource(64, 64, period_s=0.1, start=5.0, clock=clock)
+
+    summary = _trigger(clock, clicks, lateness=0.005).run(
+        source, ScreenTriggerConfig(_REGION, max_fps=1000), max_clicks=1, start_at=5.0
+    )
+
+    assert summary.start_error_s is not None
+    assert 0.0 <= summary.start_error_s < 1e-5
+    assert clicks[0] == pytest.approx(5.1, abs=0.01)
+
+
+def test_stop_during_the_scheduled_wait_cancels_the_run() -> None:
+    clock = VirtualClock()
+    clicks: list[float] = []
+    trigger = _trigger(clock, clicks)
+    clock.call_at(2.0, trigger.stop)
+
+    summary = trigger.run(SyntheticFrameSource(64, 64, clock=clock), ScreenTriggerConfig(_REGION), start_at=5.0)
+
+    assert summary.frames == 0
+    assert summary.start_error_s is None
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_config_rejects_an_uncapped_frame_rate() -> None:
+    with pytest.raises(ValueError, match="max_fps"):
+        ScreenTriggerConfig(_REGION, max_fps=0)
+
+
+def test_failing_click_is_counted_and_clears_the_in_flight_marker() -> None:
+    clock = VirtualClock()
+    registry = MetricsRegistry()
+
+    def click() -> None:
+        raise OSError("backend gone")
+
+    stop_event = threading.Event()
+    trigger = ScreenTrigger(
+        ClickBackend(click=click, name="broken"),
+        stop_event=stop_event,
+        wait=SimulatedWait(clock, stop_event),
+        metrics=registry,
+        clock=clock,
+    )
+    source = SyntheticFrameSource(64, 64, period_s=0.1, clock=clock)
+
+    with pytest.raises(OSError, match="backend gone"):
+        trigger.run(source, ScreenTriggerConfig(_REGION, max_fps=100))
+
+    assert trigger.click_started is None
+    assert registry.counter("renda_click_errors_total", "", backend="broken").value == 1
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from ..domain.simulation import ClickSimulation
+
+INTERVAL_MS = 0.1  # 10,000 clicks per second
+
+
+def test_fixed_rate_schedule_does_not_drift_with_cost_and_lateness() -> None:
+    simulation = ClickSimulation(cost=30e-6, lateness=20e-6, record=True)
+    simulation.stop_at(5.0 + 50e-6)
+
+    summary = simulation.loop.run(INTERVAL_MS)
+
+    times = simulation.backend.times
+    assert times is not None
+    assert summary.clicks == 50_001
+    assert summary.missed == 0
+    assert times[-1] == pytest.approx(5.0 + 20e-6, abs=1e-7)
+    assert summary.max_lateness_s == pytest.approx(20e-6)
+
+
+def test_stall_skips_missed_slots_instead_of_bursting() -> None:
+    wakeups = [0]
+
+    def lateness() -> float:
+        wakeups[0] += 1
+        return 2 * 3600.0 if wakeups[0] == 1_000 else 0.0
+
+    simulation = ClickSimulation(lateness=lateness, record=True)
+    simulation.stop_at(2 * 3600.0 + 1.1 + 50e-6)
+
+    summary = simulation.loop.run(INTERVAL_MS)
+
+    times = simulation.backend.times
+    assert times is not None
+    assert summary.missed == pytest.approx(72_000_000, abs=1)
+    # The late click plus at most one immediate catch-up click, then the normal rate.
+    assert summary.clicks == pytest.approx(1_000 + 2 + 10_000, abs=1)
+    gaps = [later - earlier for earlier, later in zip(times[1_002:], times[1_003:], strict=False)]
+    assert min(gaps) >= INTERVAL_MS / 1000 - 1e-9
+    assert summary.elapsed_s == pytest.approx(2 * 3600.0 + 1.1, abs=1e-3)
+
+
+def test_backend_slower_than_interval_runs_back_to_back() -> None:
+    simulation = ClickSimulation(cost=150e-6)
+    simulation.stop_at(1.0)
+
+    summary = simulation.loop.run(INTERVAL_MS)
+
+    assert summary.clicks == pytest.approx(1.0 / 150e-6, abs=1)
+    assert summary.missed > 0
+    assert simulation.wait.wakeups == 0
+
+
+def test_max_clicks_limits_run() -> None:
+    simulation = ClickSimulation()
+
+    summary = simulation.loop.run(INTERVAL_MS, max_clicks=12_345)
+
+    assert summary.clicks == simulation.backend.clicks == 12_345
+    assert summary.elapsed_s == pytest.approx(12_344 * INTERVAL_MS / 1000)
+
+
+def test_stop_interrupts_long_wait_immediately() -> None:
+    simulation = ClickSimulation()
+    simulation.stop_at(2.5)
+
+    summary = simulation.loop.run(5_000)
+
+    assert summary.clicks == 1
+    assert summary.elapsed_s == pytest.approx(2.5)
+
+
+def test_max_clicks_must_be_positive() -> None:
+    simulation = ClickSimulation()
+
+    with pytest.raises(ValueError, match="max_clicks must be positive"):
+        simulation.loop.run(INTERVAL_MS, max_clicks=0)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from ..domain.clicker_loop import ClickBackend, ClickLoop
+from ..domain.simulation import VirtualClock
+from ..domain.watchdog import ClickWatchdog, HangReport
+
+
+def test_watchdog_reports_each_stuck_call_once() -> None:
+    clock = VirtualClock()
+    reports: list[HangReport | None] = []
+    costs = iter([0.5, 3.0])
+
+    def click() -> None:
+        clock.advance(next(costs))
+        reports.append(watchdog.check())
+        reports.append(watchdog.check())
+
+    loop = ClickLoop(ClickBackend(click=click, name="slow"), wait=lambda _: False, clock=clock)
+    watchdog = ClickWatchdog(loop, deadline_s=2.0, on_hang=lambda _: None, clock=clock)
+    watchdog.arm("slow")
+
+    loop.run(100, max_clicks=2)
+
+    assert reports[:2] == [None, None]
+    report = reports[2]
+    assert report is not None
+    assert report.backend == "slow"
+    assert report.elapsed_s == pytest.approx(3.0)
+    assert "in click" in report.stack
+    assert reports[3] is None
+    assert watchdog.check() is None
+
+
+def test_watchdog_thread_dumps_the_blocked_click_thread() -> None:
+    release = threading.Event()
+    hung = threading.Event()
+    reports: list[HangReport] = []
+
+    def blocking_click() -> None:
+        release.wait(5)
+
+    def on_hang(report: HangReport) -> None:
+        reports.append(report)
+        hung.set()
+
+    loop = ClickLoop(ClickBackend(click=blocking_click, name="blocking"))
+    watchdog = ClickWatchdog(loop, deadline_s=0.05, on_hang=on_hang)
+    watchdog.arm("blocking")
+    runner = threading.Thread(target=loop.run, args=(10,), kwargs={"max_clicks": 1})
+    runner.start()
+    try:
+        assert hung.wait(2)
+    finally:
+        release.set()
+        runner.join()
+        watchdog.disarm()
+        watchdog.close()
+
+    assert len(reports) == 1
+    assert reports[0].elapsed_s >= 0.05
+    assert "blocking_click" in reports[0].stack
+    assert "バックエンド: blocking" in reports[0].message()
+
+
+def test_watchdog_rejects_non_positive_deadline() -> None:
+    loop = ClickLoop(ClickBackend(click=lambda: None, name="noop"))
+
+    with pytest.raises(ValueError, match="deadline_s"):
+        ClickWatchdog(loop, deadline_s=0, on_hang=lambda _: None)
+
+
+def test_watchdog_can_watch_another_runner() -> None:
+    clock = VirtualClock()
+
+    class Runner:
+        click_started: float | None = 0.0
+        thread_id: int | None = None
+
+    loop = ClickLoop(ClickBackend(click=lambda: None, name="noop"), clock=clock)
+    watchdog = ClickWatchdog(loop, deadline_s=1.0, on_hang=lambda _: None, clock=clock)
+    watchdog.arm("trigger", Runner())
+    clock.advance(1.5)
+
+    report = watchdog.check()
+
+    assert report is not None
+    assert report.backend == "trigger"
+    assert report.stack == "(stack unavailable)"
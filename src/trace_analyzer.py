@@ -0,0 +1,206 @@
+"""Offline analyzer for click trace files (``python -m src.trace_analyzer``)."""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import math
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .infra.click_trace import iter_trace, read_trace_header
+
+INTERVAL_EDGES_MS = (0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0, 1000.0)
+MAX_DRIFT_WINDOWS = 1024
+_BAR_WIDTH = 40
+_BASELINE_WEIGHT = 0.1
+
+
+@dataclass(frozen=True)
+class Outlier:
+    """A click whose interval strayed furthest from the typical interval before it."""
+
+    index: int
+    offset_s: float
+    interval_s: float
+    typical_s: float
+
+
+@dataclass
+class DriftWindow:
+    """Lateness (actual minus scheduled time) aggregated over one time window."""
+
+    start_s: float
+    clicks: int = 0
+    total_lateness_s: float = 0.0
+    max_lateness_s: float = 0.0
+
+    @property
+    def mean_lateness_s(self) -> float:
+        return self.total_lateness_s / self.clicks if self.clicks else 0.0
+
+
+@dataclass
+class TraceReport:
+    """Streaming summary of a trace file."""
+
+    started_wall: float
+    window_s: float = 1.0
+    records: int = 0
+    duration_s: float = 0.0
+    interval_counts: list[int] = field(default_factory=lambda: [0] * (len(INTERVAL_EDGES_MS) + 1))
+    drift: list[DriftWindow] = field(default_factory=list)
+    outliers: list[Outlier] = field(default_factory=list)
+    total_cost_s: float = 0.0
+    max_cost_s: float = 0.0
+
+
+def analyze_trace(
+    path: Path,
+    window_s: float = 1.0,
+    top: int = 10,
+    max_windows: int = MAX_DRIFT_WINDOWS,
+) -> TraceReport:
+    """Summarize ``path`` in one pass with memory independent of the trace length.
+
+    At most ``max_windows`` drift windows are kept: when a trace needs more,
+    the window width doubles and neighbouring windows are merged, so
+    :attr:`TraceReport.window_s` may end up wider than ``window_s``.
+    """
+    if window_s <= 0:
+        raise ValueError("window_s must be positive")
+    if max_windows <= 0:
+        raise ValueError("max_windows must be positive")
+    with path.open("rb") as stream:
+        header = read_trace_header(stream)
+        report = TraceReport(started_wall=header.started_wall, window_s=window_s)
+        heap: list[tuple[float, int, Outlier]] = []
+        first_actual = previous_actual = previous_scheduled = 0.0
+        # Moving average of recent intervals; skipped slots widen the scheduled gap
+        # too, so stalls only stand out against what the run normally did.
+        typical = 0.0
+        window: DriftWindow | None = None
+
+        for index, record in enumerate(iter_trace(stream, header.records)):
+            if index == 0:
+                first_actual = record.actual
+            else:
+                interval = record.actual - previous_actual
+                if index == 1:
+                    typical = record.scheduled - previous_scheduled
+                report.interval_counts[_bucket(interval * 1000.0)] += 1
+                error = abs(interval - typical)
+                outlier = Outlier(index, record.actual - first_actual, interval, typical)
+                if len(heap) < top:
+                    heapq.heappush(heap, (error, index, outlier))
+                elif top and error > heap[0][0]:
+                    heapq.heapreplace(heap, (error, index, outlier))
+                typical += (interval - typical) * _BASELINE_WEIGHT
+            previous_actual = record.actual
+            previous_scheduled = record.scheduled
+
+            offset = record.actual - first_actual
+            window_start = math.floor(offset / window_s) * window_s
+            if window is None or window.start_s != window_start:
+                # Sparse clicks can leave every window separate after one merge,
+                # so widen until the new click fits without exceeding the cap.
+                while len(report.drift) >= max_windows and report.drift[-1].start_s != window_start:
+                    window_s *= 2.0
+                    report.window_s = window_s
+                    report.drift = _merge_windows(report.drift, window_s)
+                    window_start = math.floor(offset / window_s) * window_s
+                if report.drift and report.drift[-1].start_s == window_start:
+                    window = report.drift[-1]
+                else:
+                    window = DriftWindow(start_s=window_start)
+                    report.drift.append(window)
+            lateness = record.actual - record.scheduled
+            window.clicks += 1
+            window.total_lateness_s += lateness
+            window.max_lateness_s = max(window.max_lateness_s, lateness)
+
+            report.total_cost_s += record.cost
+            report.max_cost_s = max(report.max_cost_s, record.cost)
+            report.records += 1
+
+        report.duration_s = previous_actual - first_actual
+        report.outliers = [entry[2] for entry in sorted(heap, reverse=True)]
+    return report
+
+
+def format_report(report: TraceReport) -> str:
+    """Render ``report`` as plain text."""
+    started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(report.started_wall))
+    lines = [f"started: {started}", f"clicks: {report.records}", f"duration: {report.duration_s:.3f} s"]
+    if report.records:
+        mean_cost = report.total_cost_s / report.records
+        lines.append(f"backend cost: mean {mean_cost * 1000:.3f} ms, max {report.max_cost_s * 1000:.3f} ms")
+
+    lines += ["", "interval histogram (ms):"]
+    peak = max(report.interval_counts) or 1
+    labels = [f"< {edge:g}" for edge in INTERVAL_EDGES_MS] + [f">= {INTERVAL_EDGES_MS[-1]:g}"]
+    for label, count in zip(labels, report.interval_counts, strict=True):
+        if count:
+            bar = "#" * max(1, round(count / peak * _BAR_WIDTH))
+            lines.append(f"  {label:>8} {count:>10} {bar}")
+
+    lines += ["", f"drift (lateness per {report.window_s:g} s window, ms):"]
+    for window in report.drift:
+        lines.append(
+            f"  {window.start_s:>10.1f}s {window.clicks:>8} clicks"
+            f"  mean {window.mean_lateness_s * 1000:>8.3f}  max {window.max_lateness_s * 1000:>8.3f}"
+        )
+
+    lines += ["", "outliers (largest deviation from the typical interval):"]
+    for outlier in report.outliers:
+        lines.append(
+            f"  #{outlier.index:<8} at {outlier.offset_s:>10.3f}s"
+            f"  interval {outlier.interval_s * 1000:>9.3f} ms (typical {outlier.typical_s * 1000:.3f} ms)"
+        )
+    return "\n".join(lines)
+
+
+def _merge_windows(windows: list[DriftWindow], window_s: float) -> list[DriftWindow]:
+    """Regroup ``windows`` (in time order) into windows ``window_s`` wide."""
+    merged: list[DriftWindow] = []
+    for window in windows:
+        start = math.floor(window.start_s / window_s) * window_s
+        if not merged or merged[-1].start_s != start:
+            merged.append(DriftWindow(start_s=start))
+        target = merged[-1]
+        target.clicks += window.clicks
+        target.total_lateness_s += window.total_lateness_s
+        target.max_lateness_s = max(target.max_lateness_s, window.max_lateness_s)
+    return merged
+
+
+def _bucket(interval_ms: float) -> int:
+    for index, edge in enumerate(INTERVAL_EDGES_MS):
+        if interval_ms < edge:
+            return index
+    return len(INTERVAL_EDGES_MS)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Print a summary of a click trace file."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.trace_analyzer", description="Analyze a renda-chan click trace."
+    )
+    parser.add_argument("trace", type=Path, help="path to a .rtrace file")
+    parser.add_argument("--window", type=float, default=1.0, help="drift window in seconds (default: 1)")
+    parser.add_argument("--top", type=int, default=10, help="number of outliers to list (default: 10)")
+    args = parser.parse_args(argv)
+    try:
+        report = analyze_trace(args.trace, window_s=args.window, top=args.top)
+    except (OSError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
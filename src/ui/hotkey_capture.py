@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PyQt6.QtCore import QEvent, QObject, Qt, pyqtSignal
+from PyQt6.QtCore import QEvent, QKeyCombination, QObject, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QKeyEvent, QKeySequence
 
 _MODIFIER_KEYS = {
@@ -11,22 +11,34 @@ _MODIFIER_KEYS = {
     Qt.Key.Key_Alt,
     Qt.Key.Key_Meta,
 }
+_CLEAR_KEYS = {Qt.Key.Key_Backspace, Qt.Key.Key_Delete}
+_MAX_CHORDS = 2
+_SEQUENCE_GRACE_MS = 800
 
 
 class HotkeyCaptureFilter(QObject):
-    """Capture the next key sequence from the event stream."""
+    """Capture the next key sequence (one chord, or two pressed in quick succession)."""
 
     hotkey_captured = pyqtSignal(QKeySequence)
+    hotkey_cleared = pyqtSignal()
 
     def __init__(self, parent: QObject | None = None) -> None:
         super().__init__(parent)
         self._capturing = False
+        self._chords: list[QKeyCombination] = []
+        self._grace_timer = QTimer(self)
+        self._grace_timer.setSingleShot(True)
+        self._grace_timer.setInterval(_SEQUENCE_GRACE_MS)
+        self._grace_timer.timeout.connect(self._finish)
 
     def start(self) -> None:
         self._capturing = True
+        self._chords.clear()
 
     def stop(self) -> None:
         self._capturing = False
+        self._chords.clear()
+        self._grace_timer.stop()
 
     def eventFilter(self, obj: QObject | None, event: QEvent | None) -> bool:
         if not self._capturing:
@@ -38,17 +50,37 @@ class HotkeyCaptureFilter(QObject):
         if key_event is None or key_event.isAutoRepeat():
             return True
 
-        sequence = self._sequence_from_event(key_event)
-        if sequence is None:
+        if not self._chords and self._is_clear_request(key_event):
+            self.stop()
+            self.hotkey_cleared.emit()
             return True
 
-        self._capturing = False
-        self.hotkey_captured.emit(sequence)
+        combination = self._combination_from_event(key_event)
+        if combination is None:
+            return True
+
+        self._chords.append(combination)
+        if len(self._chords) >= _MAX_CHORDS:
+            self._finish()
+        else:
+            self._grace_timer.start()
         return True
 
+    def _finish(self) -> None:
+        self._grace_timer.stop()
+        if not self._capturing or not self._chords:
+            return
+        sequence = QKeySequence(*self._chords)
+        self.stop()
+        self.hotkey_captured.emit(sequence)
+
+    @staticmethod
+    def _is_clear_request(event: QKeyEvent) -> bool:
+        return event.key() in _CLEAR_KEYS and event.modifiers() == Qt.KeyboardModifier.NoModifier
+
     @staticmethod
-    def _sequence_from_event(event: QKeyEvent) -> QKeySequence | None:
+    def _combination_from_event(event: QKeyEvent) -> QKeyCombination | None:
         key = event.key()
         if key in _MODIFIER_KEYS or key == Qt.Key.Key_unknown:
             return None
-        return QKeySequence(event.keyCombination())
+        return event.keyCombination()
@@ -2,34 +2,94 @@
 
 from __future__ import annotations
 
+import time
+from datetime import datetime, timedelta
 from typing import Final
 
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTime, QTimer, pyqtSignal
 from PyQt6.QtGui import QKeySequence
 from PyQt6.QtWidgets import (
     QApplication,
+    QCheckBox,
+    QComboBox,
     QFormLayout,
     QHBoxLayout,
     QLabel,
+    QLineEdit,
     QMainWindow,
     QPushButton,
     QSpinBox,
+    QTimeEdit,
     QVBoxLayout,
     QWidget,
 )
 
-from ..infra.settings import AppSettings, SettingsRepository
+from ..domain.jitter import JitterConfig
+from ..domain.power import LOW_POWER_MIN_INTERVAL_MS, timer_slack_supported
+from ..domain.screen_trigger import Region, ScreenTriggerConfig, format_region, parse_region
+from ..infra.hotkey_bindings import HotkeyAction, compile_hotkeys
+from ..infra.key_repeat import KeyRepeatConfig, format_repeat_keys, parse_repeat_keys
+from ..infra.settings import (
+    INPUT_KEYBOARD,
+    INPUT_MOUSE,
+    MAX_JITTER_PERCENT,
+    TRIGGER_HOLD,
+    TRIGGER_TOGGLE,
+    AppSettings,
+    SettingsRepository,
+    format_interval_profiles,
+    parse_interval_profiles,
+)
 from .hotkey_capture import HotkeyCaptureFilter
 
 _STYLE_RUNNING: Final[str] = "color: #15803d; font-weight: 700;"
+_STYLE_PAUSED: Final[str] = "color: #b45309; font-weight: 700;"
 _STYLE_STOPPED: Final[str] = "color: #b91c1c; font-weight: 700;"
 _STYLE_MUTED: Final[str] = "color: #6b7280;"
+_HOTKEY_LABELS: Final[dict[HotkeyAction, str]] = {
+    HotkeyAction.TOGGLE: "開始/停止ホットキー",
+    HotkeyAction.PAUSE: "一時停止ホットキー",
+    HotkeyAction.SPEED_UP: "加速ホットキー",
+    HotkeyAction.SLOW_DOWN: "減速ホットキー",
+    HotkeyAction.NEXT_PROFILE: "プロファイル切替",
+}
+_TRIGGER_MODE_LABELS: Final[dict[str, str]] = {
+    TRIGGER_TOGGLE: "押すたびに開始/停止",
+    TRIGGER_HOLD: "押している間だけクリック",
+}
+_JITTER_LABELS: Final[dict[str, str]] = {
+    "": "なし",
+    "uniform": "一様",
+    "normal": "正規",
+    "lognormal": "対数正規",
+}
+_INPUT_DEVICE_LABELS: Final[dict[str, str]] = {
+    INPUT_MOUSE: "マウス左クリック",
+    INPUT_KEYBOARD: "キーボード",
+}
+_KEY_BACKEND_LABELS: Final[dict[str, str]] = {
+    "": "自動",
+    "pynput": "pynput",
+    "keyboard": "keyboard",
+    "uinput": "uinput (Linux)",
+}
+_COUNTDOWN_REFRESH_MS: Final[int] = 100
+_MIN_INTERVAL_MS: Final[int] = 1
+_MAX_INTERVAL_MS: Final[int] = 60_000
 
 
 class MainWindow(QMainWindow):
     """Compact main window for click interval configuration."""
 
-    hotkey_changed = pyqtSignal(str)
+    hotkey_bindings_changed = pyqtSignal()
+    interval_changed = pyqtSignal(int)
+    trigger_mode_changed = pyqtSignal(str)
+    jitter_changed = pyqtSignal()
+    key_repeat_changed = pyqtSignal()
+    low_power_changed = pyqtSignal(bool)
+    screen_trigger_changed = pyqtSignal()
+    scheduled_start_requested = pyqtSignal(float)
+    schedule_cancel_requested = pyqtSignal()
 
     def __init__(self, settings_repo: SettingsRepository) -> None:
         super().__init__()
@@ -39,17 +99,67 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central)
 
         self.interval_spin = QSpinBox()
-        self.interval_spin.setRange(1, 60_000)
+        self.interval_spin.setRange(_MIN_INTERVAL_MS, _MAX_INTERVAL_MS)
         self.interval_spin.setValue(100)
         self.interval_spin.setSuffix(" ms")
         self.interval_spin.setAlignment(Qt.AlignmentFlag.AlignRight)
         self.interval_spin.setSingleStep(10)
         self.interval_spin.setFixedWidth(120)
 
-        self.hotkey_label = QLabel("未設定")
-        self.hotkey_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        self.hotkey_label.setStyleSheet(_STYLE_MUTED)
-        self.hotkey_button = QPushButton("設定")
+        self.jitter_combo = QComboBox()
+        for distribution, jitter_label in _JITTER_LABELS.items():
+            self.jitter_combo.addItem(jitter_label, distribution)
+        self.jitter_spin = QSpinBox()
+        self.jitter_spin.setRange(1, MAX_JITTER_PERCENT)
+        self.jitter_spin.setPrefix("±")
+        self.jitter_spin.setSuffix(" %")
+        self.jitter_spin.setAlignment(Qt.AlignmentFlag.AlignRight)
+
+        self.profiles_edit = QLineEdit()
+        self.profiles_edit.setPlaceholderText("100, 50, 10")
+        self.profiles_edit.setAlignment(Qt.AlignmentFlag.AlignRight)
+        self.profiles_edit.setFixedWidth(120)
+
+        self.input_device_combo = QComboBox()
+        for device, device_label in _INPUT_DEVICE_LABELS.items():
+            self.input_device_combo.addItem(device_label, device)
+        self.repeat_keys_edit = QLineEdit()
+        self.repeat_keys_edit.setPlaceholderText("z, x")
+        self.repeat_keys_edit.setFixedWidth(120)
+        self.key_backend_combo = QComboBox()
+        for key_backend, backend_label in _KEY_BACKEND_LABELS.items():
+            self.key_backend_combo.addItem(backend_label, key_backend)
+
+        self.low_power_check = QCheckBox(f"{LOW_POWER_MIN_INTERVAL_MS:g}ms 以上の間隔で待機を省電力化")
+        if not timer_slack_supported():
+            self.low_power_check.setText(f"{self.low_power_check.text()} (この OS では未対応)")
+            self.low_power_check.setToolTip("タイマースラック (Linux の PR_SET_TIMERSLACK) が使えないため無効です。")
+            self.low_power_check.setEnabled(False)
+
+        self.screen_region_edit = QLineEdit()
+        self.screen_region_edit.setPlaceholderText("x, y, 幅, 高さ (空欄で無効)")
+        self.screen_region_edit.setToolTip(
+            "指定した画面領域の表示が変化したときだけクリックします。クリック間隔は連続クリックの最小間隔になります。"
+        )
+
+        self.schedule_time_edit = QTimeEdit()
+        self.schedule_time_edit.setDisplayFormat("HH:mm:ss.zzz")
+        self.schedule_time_edit.setAlignment(Qt.AlignmentFlag.AlignRight)
+        self.schedule_time_edit.setTime(QTime(12, 0))
+        self.schedule_button = QPushButton("予約")
+
+        self.trigger_mode_combo = QComboBox()
+        for mode, mode_label in _TRIGGER_MODE_LABELS.items():
+            self.trigger_mode_combo.addItem(mode_label, mode)
+
+        self.hotkey_labels: dict[HotkeyAction, QLabel] = {}
+        self.hotkey_buttons: dict[HotkeyAction, QPushButton] = {}
+        for action in HotkeyAction:
+            label = QLabel("未設定")
+            label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            label.setStyleSheet(_STYLE_MUTED)
+            self.hotkey_labels[action] = label
+            self.hotkey_buttons[action] = QPushButton("設定")
         self.hotkey_hint_label = QLabel()
         self.hotkey_hint_label.setStyleSheet(_STYLE_MUTED)
         self.hotkey_hint_label.setVisible(False)
@@ -62,13 +172,37 @@ class MainWindow(QMainWindow):
         form_layout.setHorizontalSpacing(6)
         form_layout.setVerticalSpacing(4)
         form_layout.addRow("クリック間隔", self.interval_spin)
-
-        hotkey_row = QHBoxLayout()
-        hotkey_row.setContentsMargins(0, 0, 0, 0)
-        hotkey_row.setSpacing(6)
-        hotkey_row.addWidget(self.hotkey_label, 1)
-        hotkey_row.addWidget(self.hotkey_button)
-        form_layout.addRow("開始/停止ホットキー", hotkey_row)
+        jitter_row = QHBoxLayout()
+        jitter_row.setContentsMargins(0, 0, 0, 0)
+        jitter_row.setSpacing(6)
+        jitter_row.addWidget(self.jitter_combo, 1)
+        jitter_row.addWidget(self.jitter_spin)
+        form_layout.addRow("間隔のゆらぎ", jitter_row)
+        form_layout.addRow("間隔プロファイル", self.profiles_edit)
+        input_row = QHBoxLayout()
+        input_row.setContentsMargins(0, 0, 0, 0)
+        input_row.setSpacing(6)
+        input_row.addWidget(self.input_device_combo, 1)
+        input_row.addWidget(self.repeat_keys_edit)
+        form_layout.addRow("連打対象", input_row)
+        form_layout.addRow("キー送信方式", self.key_backend_combo)
+        form_layout.addRow("省電力モード", self.low_power_check)
+        form_layout.addRow("画面変化トリガー", self.screen_region_edit)
+        schedule_row = QHBoxLayout()
+        schedule_row.setContentsMargins(0, 0, 0, 0)
+        schedule_row.setSpacing(6)
+        schedule_row.addWidget(self.schedule_time_edit, 1)
+        schedule_row.addWidget(self.schedule_button)
+        form_layout.addRow("予約開始", schedule_row)
+        form_layout.addRow("ホットキー動作", self.trigger_mode_combo)
+
+        for action in HotkeyAction:
+            hotkey_row = QHBoxLayout()
+            hotkey_row.setContentsMargins(0, 0, 0, 0)
+            hotkey_row.setSpacing(6)
+            hotkey_row.addWidget(self.hotkey_labels[action], 1)
+            hotkey_row.addWidget(self.hotkey_buttons[action])
+            form_layout.addRow(_HOTKEY_LABELS[action], hotkey_row)
         form_layout.addRow("", self.hotkey_hint_label)
 
         status_row = QHBoxLayout()
@@ -82,19 +216,38 @@ class MainWindow(QMainWindow):
         root_layout.setSpacing(6)
         root_layout.addLayout(form_layout)
 
-        self._capturing_hotkey = False
-        self.start_stop_hotkey = ""
+        self._capturing_action: HotkeyAction | None = None
+        self._hotkeys: dict[HotkeyAction, str] = {action: "" for action in HotkeyAction}
+        self._interval_profiles: tuple[int, ...] = AppSettings.interval_profiles
+        self._repeat_keys: tuple[str, ...] = AppSettings.repeat_keys
+        self._screen_region: Region | None = AppSettings.screen_region
+        self._scheduled_wall = 0.0
+        self._countdown_timer = QTimer(self)
+        self._countdown_timer.setInterval(_COUNTDOWN_REFRESH_MS)
+        self._countdown_timer.timeout.connect(self._update_countdown)
         self._settings_repo = settings_repo
         self._hotkey_capture = HotkeyCaptureFilter(self)
         self._hotkey_capture.hotkey_captured.connect(self._handle_hotkey_captured)
+        self._hotkey_capture.hotkey_cleared.connect(self._handle_hotkey_cleared)
         app = QApplication.instance()
         if app is not None:
             app.installEventFilter(self._hotkey_capture)
 
         self._apply_settings(self._settings_repo.load())
 
-        self.hotkey_button.clicked.connect(self._toggle_hotkey_capture)
+        for action, button in self.hotkey_buttons.items():
+            button.clicked.connect(lambda _checked=False, action=action: self._toggle_hotkey_capture(action))
         self.interval_spin.valueChanged.connect(self._handle_interval_changed)
+        self.profiles_edit.editingFinished.connect(self._handle_profiles_edited)
+        self.trigger_mode_combo.currentIndexChanged.connect(self._handle_trigger_mode_changed)
+        self.jitter_combo.currentIndexChanged.connect(self._handle_jitter_changed)
+        self.jitter_spin.valueChanged.connect(self._handle_jitter_changed)
+        self.input_device_combo.currentIndexChanged.connect(self._handle_key_repeat_changed)
+        self.key_backend_combo.currentIndexChanged.connect(self._handle_key_repeat_changed)
+        self.repeat_keys_edit.editingFinished.connect(self._handle_repeat_keys_edited)
+        self.low_power_check.toggled.connect(self._handle_low_power_toggled)
+        self.screen_region_edit.editingFinished.connect(self._handle_screen_region_edited)
+        self.schedule_button.clicked.connect(self._handle_schedule_clicked)
 
         self.set_running(False)
         self.adjustSize()
@@ -102,6 +255,7 @@ class MainWindow(QMainWindow):
 
     def set_running(self, running: bool) -> None:
         """Update status label based on running state."""
+        self._clear_schedule()
         if running:
             self.status_label.setText("実行中")
             self.status_label.setStyleSheet(_STYLE_RUNNING)
@@ -109,66 +263,271 @@ class MainWindow(QMainWindow):
             self.status_label.setText("停止中")
             self.status_label.setStyleSheet(_STYLE_STOPPED)
 
-    def set_hotkey_text(self, text: str) -> None:
-        """Update hotkey display text."""
+    def set_paused(self, paused: bool) -> None:
+        """Update status label for a paused or resumed run."""
+        if paused:
+            self.status_label.setText("一時停止中")
+            self.status_label.setStyleSheet(_STYLE_PAUSED)
+        else:
+            self.set_running(True)
+
+    def set_scheduled(self, wall_time: float) -> None:
+        """Show a countdown until clicking starts at epoch time ``wall_time``."""
+        self._scheduled_wall = wall_time
+        self.schedule_button.setText("取消")
+        self.schedule_time_edit.setEnabled(False)
+        self._countdown_timer.start()
+        self._update_countdown()
+
+    def _clear_schedule(self) -> None:
+        self._scheduled_wall = 0.0
+        self._countdown_timer.stop()
+        self.schedule_button.setText("予約")
+        self.schedule_time_edit.setEnabled(True)
+
+    def _update_countdown(self) -> None:
+        remaining = self._scheduled_wall - time.time()
+        if remaining <= 0:
+            self.set_running(True)
+            return
+        hours, rest = divmod(remaining, 3600)
+        minutes, seconds = divmod(rest, 60)
+        self.status_label.setText(f"開始まで {int(hours)}:{int(minutes):02d}:{seconds:04.1f}")
+        self.status_label.setStyleSheet(_STYLE_PAUSED)
+
+    def _handle_schedule_clicked(self) -> None:
+        if self._scheduled_wall:
+            self.schedule_cancel_requested.emit()
+            return
+        self.scheduled_start_requested.emit(_next_occurrence(self.schedule_time_edit.time()))
+
+    def set_hotkey_text(self, action: HotkeyAction, text: str) -> None:
+        """Update hotkey display text for an action."""
+        label = self.hotkey_labels[action]
         text = text.strip()
         if not text:
-            self.hotkey_label.setText("未設定")
-            self.hotkey_label.setStyleSheet(_STYLE_MUTED)
+            label.setText("未設定")
+            label.setStyleSheet(_STYLE_MUTED)
             return
-        self.hotkey_label.setText(text)
-        self.hotkey_label.setStyleSheet("")
+        label.setText(text)
+        label.setStyleSheet("")
 
-    def _toggle_hotkey_capture(self) -> None:
-        if self._capturing_hotkey:
+    def _toggle_hotkey_capture(self, action: HotkeyAction) -> None:
+        capturing = self._capturing_action
+        if capturing is not None:
             self._stop_hotkey_capture()
-            return
-        self._start_hotkey_capture()
+            if capturing == action:
+                return
+        self._start_hotkey_capture(action)
 
-    def _start_hotkey_capture(self) -> None:
-        self._capturing_hotkey = True
-        self.hotkey_hint_label.setText("次のキー入力を割り当てます")
+    def _start_hotkey_capture(self, action: HotkeyAction) -> None:
+        self._capturing_action = action
+        self.hotkey_hint_label.setStyleSheet(_STYLE_MUTED)
+        self.hotkey_hint_label.setText("次のキー入力を割り当てます (連続入力で 2 段階、Backspace で解除)")
         self.hotkey_hint_label.setVisible(True)
-        self.hotkey_button.setText("キャンセル")
+        self.hotkey_buttons[action].setText("キャンセル")
         self._hotkey_capture.start()
 
     def _stop_hotkey_capture(self) -> None:
-        self._capturing_hotkey = False
+        if self._capturing_action is not None:
+            self.hotkey_buttons[self._capturing_action].setText("設定")
+        self._capturing_action = None
         self.hotkey_hint_label.setVisible(False)
         self.hotkey_hint_label.setText("")
-        self.hotkey_button.setText("設定")
         self._hotkey_capture.stop()
 
     def _handle_hotkey_captured(self, sequence: QKeySequence) -> None:
-        text = sequence.toString(QKeySequence.SequenceFormat.NativeText)
-        self.start_stop_hotkey = text
-        self.set_hotkey_text(text)
-        self._save_settings()
+        self._assign_hotkey(sequence.toString(QKeySequence.SequenceFormat.NativeText))
+
+    def _handle_hotkey_cleared(self) -> None:
+        self._assign_hotkey("")
+
+    def _assign_hotkey(self, text: str) -> None:
+        action = self._capturing_action
         self._stop_hotkey_capture()
-        self.hotkey_changed.emit(text)
+        if action is None:
+            return
+        bindings = {**self._hotkeys, action: text}
+        hold_actions = (HotkeyAction.TOGGLE,) if self.current_trigger_mode() == TRIGGER_HOLD else ()
+        try:
+            compile_hotkeys(bindings, hold_actions)
+        except ValueError as exc:
+            # Keep the previous binding so the registered hotkeys stay valid.
+            self.hotkey_hint_label.setStyleSheet(_STYLE_STOPPED)
+            self.hotkey_hint_label.setText(f"割り当てできません: {exc}")
+            self.hotkey_hint_label.setVisible(True)
+            return
+        self._hotkeys[action] = text
+        self.set_hotkey_text(action, text)
+        self._save_settings()
+        self.hotkey_bindings_changed.emit()
 
     def _apply_settings(self, settings: AppSettings) -> None:
         self.interval_spin.setValue(settings.interval_ms)
-        self.start_stop_hotkey = settings.start_stop_hotkey
-        self.set_hotkey_text(settings.start_stop_hotkey)
+        self._interval_profiles = settings.interval_profiles
+        self.profiles_edit.setText(format_interval_profiles(settings.interval_profiles))
+        self._hotkeys = settings.hotkey_bindings()
+        for action, text in self._hotkeys.items():
+            self.set_hotkey_text(action, text)
+        index = self.trigger_mode_combo.findData(settings.trigger_mode)
+        self.trigger_mode_combo.setCurrentIndex(max(index, 0))
+        index = self.jitter_combo.findData(settings.jitter_distribution)
+        self.jitter_combo.setCurrentIndex(max(index, 0))
+        self.jitter_spin.setValue(settings.jitter_percent)
+        self.jitter_spin.setEnabled(bool(settings.jitter_distribution))
+        index = self.input_device_combo.findData(settings.input_device)
+        self.input_device_combo.setCurrentIndex(max(index, 0))
+        self._repeat_keys = settings.repeat_keys
+        self.repeat_keys_edit.setText(format_repeat_keys(settings.repeat_keys))
+        index = self.key_backend_combo.findData(settings.key_backend)
+        self.key_backend_combo.setCurrentIndex(max(index, 0))
+        self._update_key_repeat_enabled()
+        self.low_power_check.setChecked(settings.low_power)
+        self._screen_region = settings.screen_region
+        self.screen_region_edit.setText(format_region(settings.screen_region))
 
     def _current_settings(self) -> AppSettings:
         return AppSettings(
             interval_ms=self.interval_spin.value(),
-            start_stop_hotkey=self.start_stop_hotkey,
+            start_stop_hotkey=self._hotkeys[HotkeyAction.TOGGLE],
+            pause_hotkey=self._hotkeys[HotkeyAction.PAUSE],
+            speed_up_hotkey=self._hotkeys[HotkeyAction.SPEED_UP],
+            slow_down_hotkey=self._hotkeys[HotkeyAction.SLOW_DOWN],
+            profile_hotkey=self._hotkeys[HotkeyAction.NEXT_PROFILE],
+            interval_profiles=self._interval_profiles,
+            trigger_mode=self.current_trigger_mode(),
+            jitter_distribution=self._current_jitter_distribution(),
+            jitter_percent=self.jitter_spin.value(),
+            input_device=self._current_combo_data(self.input_device_combo, INPUT_MOUSE),
+            repeat_keys=self._repeat_keys,
+            key_backend=self._current_combo_data(self.key_backend_combo, ""),
+            low_power=self.low_power_check.isChecked(),
+            screen_region=self._screen_region,
         )
 
     def current_interval_ms(self) -> int:
         """Return the current click interval in milliseconds."""
         return self.interval_spin.value()
 
-    def current_hotkey(self) -> str:
-        """Return the currently configured hotkey string."""
-        return self.start_stop_hotkey
+    def current_trigger_mode(self) -> str:
+        """Return how the start/stop hotkey controls clicking."""
+        mode = self.trigger_mode_combo.currentData()
+        return mode if isinstance(mode, str) else TRIGGER_TOGGLE
+
+    def current_jitter(self) -> JitterConfig | None:
+        """Return the configured interval randomization, if any."""
+        return self._current_settings().jitter_config()
+
+    def _current_jitter_distribution(self) -> str:
+        return self._current_combo_data(self.jitter_combo, "")
+
+    def current_key_repeat(self) -> KeyRepeatConfig | None:
+        """Return the keys to repeat instead of clicking, if keyboard input is selected."""
+        return self._current_settings().key_repeat_config()
+
+    def current_low_power(self) -> bool:
+        """Return whether power-saving timers are enabled (always ``False`` where unsupported)."""
+        return self.low_power_check.isChecked() and self.low_power_check.isEnabled()
+
+    def current_screen_trigger(self) -> ScreenTriggerConfig | None:
+        """Return the screen-change trigger, if a region is configured."""
+        return self._current_settings().screen_trigger_config()
+
+    @staticmethod
+    def _current_combo_data(combo: QComboBox, default: str) -> str:
+        data = combo.currentData()
+        return data if isinstance(data, str) else default
+
+    def current_hotkey_bindings(self) -> dict[HotkeyAction, str]:
+        """Return the configured hotkey text for each action."""
+        return dict(self._hotkeys)
+
+    def scale_interval(self, factor: float) -> int:
+        """Multiply the interval by ``factor`` (at least one step) and return the new value."""
+        current = self.interval_spin.value()
+        scaled = round(current * factor)
+        if scaled == current:
+            scaled = current + (1 if factor > 1 else -1)
+        self.interval_spin.setValue(min(max(scaled, _MIN_INTERVAL_MS), _MAX_INTERVAL_MS))
+        return self.interval_spin.value()
+
+    def next_profile(self) -> int:
+        """Switch to the interval preset after the current interval and return it."""
+        profiles = self._interval_profiles
+        current = self.interval_spin.value()
+        index = profiles.index(current) + 1 if current in profiles else 0
+        self.interval_spin.setValue(profiles[index % len(profiles)])
+        return self.interval_spin.value()
 
     def _save_settings(self) -> None:
         self._settings_repo.save(self._current_settings())
 
     def _handle_interval_changed(self, value: int) -> None:
+        self._save_settings()
+        self.interval_changed.emit(value)
+
+    def _handle_trigger_mode_changed(self, index: int) -> None:
+        _ = index
+        self._save_settings()
+        self.trigger_mode_changed.emit(self.current_trigger_mode())
+
+    def _handle_jitter_changed(self, value: int) -> None:
         _ = value
+        self.jitter_spin.setEnabled(bool(self._current_jitter_distribution()))
+        self._save_settings()
+        self.jitter_changed.emit()
+
+    def _handle_key_repeat_changed(self, index: int) -> None:
+        _ = index
+        self._update_key_repeat_enabled()
+        self._save_settings()
+        self.key_repeat_changed.emit()
+
+    def _handle_repeat_keys_edited(self) -> None:
+        keys = parse_repeat_keys(self.repeat_keys_edit.text())
+        self.repeat_keys_edit.setText(format_repeat_keys(keys))
+        if keys == self._repeat_keys:
+            return
+        self._repeat_keys = keys
+        self._save_settings()
+        self.key_repeat_changed.emit()
+
+    def _handle_low_power_toggled(self, checked: bool) -> None:
+        _ = checked
+        self._save_settings()
+        self.low_power_changed.emit(self.current_low_power())
+
+    def _handle_screen_region_edited(self) -> None:
+        region = parse_region(self.screen_region_edit.text())
+        self.screen_region_edit.setText(format_region(region))
+        if region == self._screen_region:
+            return
+        self._screen_region = region
         self._save_settings()
+        self.screen_trigger_changed.emit()
+
+    def _update_key_repeat_enabled(self) -> None:
+        keyboard = self._current_combo_data(self.input_device_combo, INPUT_MOUSE) == INPUT_KEYBOARD
+        self.repeat_keys_edit.setEnabled(keyboard)
+        self.key_backend_combo.setEnabled(keyboard)
+
+    def _handle_profiles_edited(self) -> None:
+        profiles = parse_interval_profiles(self.profiles_edit.text())
+        if profiles:
+            self._interval_profiles = profiles
+            self._save_settings()
+        self.profiles_edit.setText(format_interval_profiles(self._interval_profiles))
+
+
+def _next_occurrence(clock_time: QTime) -> float:
+    """Return the epoch time of the next ``clock_time`` today, or tomorrow if it has passed."""
+    now = datetime.now()
+    target = now.replace(
+        hour=clock_time.hour(),
+        minute=clock_time.minute(),
+        second=clock_time.second(),
+        microsecond=clock_time.msec() * 1000,
+    )
+    if target <= now:
+        target += timedelta(days=1)
+    return target.timestamp()